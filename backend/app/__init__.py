@@ -56,12 +56,30 @@ def create_app(config_name: str = "default") -> Flask:
     if app.config.get("ENABLE_EXTRACTION_WORKER", True):
         from app.worker import init_worker
 
-        init_worker(app)
+        init_worker(
+            app,
+            interval_seconds=app.config.get("EXTRACTION_WORKER_INTERVAL", 5),
+            concurrency=app.config.get("EXTRACTION_WORKER_CONCURRENCY", 1),
+        )
 
     # Initialize typo check worker (adaptive polling)
     if app.config.get("ENABLE_TYPO_CHECK_WORKER", True):
         from app.typo_worker import init_typo_worker
 
-        init_typo_worker(app)
+        init_typo_worker(
+            app,
+            interval_seconds=app.config.get("TYPO_WORKER_INTERVAL", 3),
+            concurrency=app.config.get("TYPO_WORKER_CONCURRENCY", 1),
+        )
+
+    # Initialize metadata enrichment worker (adaptive polling)
+    if app.config.get("ENABLE_METADATA_WORKER", True):
+        from app.metadata_worker import init_metadata_worker
+
+        init_metadata_worker(
+            app,
+            interval_seconds=app.config.get("METADATA_WORKER_INTERVAL", 5),
+            concurrency=app.config.get("METADATA_WORKER_CONCURRENCY", 4),
+        )
 
     return app
@@ -5,32 +5,124 @@ from flask import current_app
 from flask.cli import with_appcontext
 
 
-@click.command("run-worker")
-@click.option("--interval", default=5, help="Queue check interval in seconds")
+@click.command("run-workers")
+@click.option(
+    "--extraction/--no-extraction", default=True, help="Run the extraction worker"
+)
+@click.option("--typo/--no-typo", default=True, help="Run the typo check worker")
+@click.option(
+    "--metadata/--no-metadata", default=True, help="Run the metadata worker"
+)
+@click.option(
+    "--extraction-concurrency",
+    type=int,
+    default=None,
+    help="Parallel extraction jobs (default: EXTRACTION_WORKER_CONCURRENCY)",
+)
+@click.option(
+    "--typo-concurrency",
+    type=int,
+    default=None,
+    help="Parallel typo check jobs (default: TYPO_WORKER_CONCURRENCY)",
+)
+@click.option(
+    "--metadata-concurrency",
+    type=int,
+    default=None,
+    help="Parallel metadata lookups (default: METADATA_WORKER_CONCURRENCY)",
+)
 @with_appcontext
-def run_worker_command(interval):
-    """Run the PDF extraction worker."""
+def run_workers_command(
+    extraction,
+    typo,
+    metadata,
+    extraction_concurrency,
+    typo_concurrency,
+    metadata_concurrency,
+):
+    """Run the background workers as a dedicated process.
+
+    Web processes started with ENABLE_EXTRACTION_WORKER=false,
+    ENABLE_TYPO_CHECK_WORKER=false and ENABLE_METADATA_WORKER=false only
+    enqueue jobs; this process polls the queues without pausing and claims
+    jobs atomically, so several worker processes can run side by side.
+
+    SIGTERM (as sent by ``systemctl stop``) shuts down like Ctrl+C: no new
+    jobs are claimed and in-flight jobs are waited for.
+    """
+    import signal
     import time
 
-    from app.worker import create_scheduler
+    from app.metadata_worker import init_metadata_worker, metadata_worker
+    from app.typo_worker import init_typo_worker, typo_check_worker
+    from app.worker import extraction_worker, init_worker
+
+    app = current_app._get_current_object()
+
+    if not extraction and not typo and not metadata:
+        click.echo("Nothing to run: all workers are disabled.")
+        return
+
+    if extraction:
+        concurrency = extraction_concurrency or app.config.get(
+            "EXTRACTION_WORKER_CONCURRENCY", 1
+        )
+        init_worker(
+            app,
+            interval_seconds=app.config.get("EXTRACTION_WORKER_INTERVAL", 5),
+            max_idle_checks=None,
+            concurrency=concurrency,
+        )
+        click.echo(f"Extraction worker started (concurrency: {concurrency}).")
+
+    if typo:
+        concurrency = typo_concurrency or app.config.get("TYPO_WORKER_CONCURRENCY", 1)
+        init_typo_worker(
+            app,
+            interval_seconds=app.config.get("TYPO_WORKER_INTERVAL", 3),
+            max_idle_checks=None,
+            concurrency=concurrency,
+        )
+        click.echo(f"Typo check worker started (concurrency: {concurrency}).")
 
-    click.echo(f"Starting PDF extraction worker (interval: {interval}s)...")
+    if metadata:
+        concurrency = metadata_concurrency or app.config.get(
+            "METADATA_WORKER_CONCURRENCY", 4
+        )
+        init_metadata_worker(
+            app,
+            interval_seconds=app.config.get("METADATA_WORKER_INTERVAL", 5),
+            max_idle_checks=None,
+            concurrency=concurrency,
+        )
+        click.echo(f"Metadata worker started (concurrency: {concurrency}).")
 
-    scheduler = create_scheduler(current_app._get_current_object(), interval)
-    scheduler.start()
+    def handle_sigterm(signum, frame):
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
 
     try:
         while True:
             time.sleep(1)
     except (KeyboardInterrupt, SystemExit):
-        click.echo("\nShutting down extraction worker...")
-        scheduler.shutdown()
+        click.echo("\nShutting down workers...")
+        # Scheduler shutdown waits for running jobs to finish
+        extraction_worker.shutdown()
+        typo_check_worker.shutdown()
+        metadata_worker.shutdown()
 
 
 @click.command("process-queue")
 @click.option("--all", "process_all", is_flag=True, help="Process all pending items")
+@click.option(
+    "--mode",
+    type=click.Choice(["fast", "balanced", "precise"]),
+    default=None,
+    help="Extraction mode (default: EXTRACTION_MODE)",
+)
 @with_appcontext
-def process_queue_command(process_all):
+def process_queue_command(process_all, mode):
     """Process pending items in the extraction queue."""
     from app.services.extraction_service import ExtractionService
     from app.models.extraction_queue import ExtractionQueue
@@ -44,21 +136,22 @@ def process_queue_command(process_all):
     click.echo(f"Found {pending_count} pending items.")
 
     if process_all:
+        batch_size = current_app.config.get("EXTRACTION_BATCH_SIZE", 5)
         processed = 0
         while True:
-            success, error = ExtractionService.process_next()
-            if error:
-                click.echo(f"Error: {error}")
-            if not ExtractionQueue.query.filter_by(status="pending").first():
+            claimed, errors = ExtractionService.process_batch(batch_size, mode)
+            if claimed == 0:
                 break
-            processed += 1
+            for error in errors:
+                click.echo(f"Error: {error}")
+            processed += claimed
         click.echo(f"Processed {processed} items.")
     else:
-        success, error = ExtractionService.process_next()
-        if success:
+        _, errors = ExtractionService.process_batch(1, mode)
+        if errors:
+            click.echo(f"Error: {errors[0]}")
+        else:
             click.echo("Successfully processed one item.")
-        elif error:
-            click.echo(f"Error: {error}")
 
 
 @click.command("queue-status")
@@ -79,8 +172,144 @@ def queue_status_command():
     click.echo(f"  Failed:     {failed}")
 
 
+@click.command("backfill-metadata")
+@click.option(
+    "--status",
+    "statuses",
+    multiple=True,
+    default=("failed", "pending"),
+    show_default=True,
+    help="metadata_status values to retry (repeatable)",
+)
+@click.option(
+    "--older-than",
+    type=int,
+    default=None,
+    help="Also refresh metadata fetched more than this many days ago",
+)
+@click.option(
+    "--concurrency",
+    type=int,
+    default=None,
+    help="Parallel lookups (default: METADATA_WORKER_CONCURRENCY)",
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=100,
+    show_default=True,
+    help="Documents claimed and committed together",
+)
+@click.option(
+    "--start-after",
+    type=int,
+    default=0,
+    help="Resume after this document id",
+)
+@click.option("--limit", type=int, default=None, help="Stop after this many documents")
+@click.option(
+    "--reextract-doi",
+    is_flag=True,
+    help="Read the DOI from the PDF again instead of using the stored one",
+)
+@click.option("--dry-run", is_flag=True, help="Only count eligible documents")
+@with_appcontext
+def backfill_metadata_command(
+    statuses,
+    older_than,
+    concurrency,
+    batch_size,
+    start_after,
+    limit,
+    reextract_doi,
+    dry_run,
+):
+    """Fetch CrossRef metadata for documents that are missing it.
+
+    Documents are walked in id order and committed in batches; lookups run
+    on a thread pool through the shared CrossRef rate limiter and caches.
+    An interrupted run hands its open batch back and can be resumed with
+    --start-after.
+    """
+    from collections import Counter
+    from concurrent.futures import ThreadPoolExecutor
+    from datetime import datetime, timedelta, timezone
+
+    from app.services.metadata_service import MetadataService
+
+    fetched_before = (
+        datetime.now(timezone.utc) - timedelta(days=older_than)
+        if older_than is not None
+        else None
+    )
+
+    total = MetadataService.count_backfill_candidates(
+        statuses, fetched_before, after_id=start_after
+    )
+    if limit is not None:
+        total = min(total, limit)
+
+    if total == 0:
+        click.echo("No documents need metadata.")
+        return
+
+    click.echo(f"Found {total} documents to backfill.")
+    if dry_run:
+        return
+
+    concurrency = concurrency or current_app.config.get(
+        "METADATA_WORKER_CONCURRENCY", 4
+    )
+    outcomes = Counter()
+    errors = []
+    last_id = start_after
+
+    def record(document):
+        if document.metadata_status == "completed" and not document.doi:
+            outcomes["no_doi"] += 1
+        else:
+            outcomes[document.metadata_status] += 1
+        progress.update(1)
+
+    with ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="metadata-backfill"
+    ) as executor, click.progressbar(length=total, label="Backfilling") as progress:
+        try:
+            while limit is None or sum(outcomes.values()) < limit:
+                remaining = None if limit is None else limit - sum(outcomes.values())
+                documents, examined_id = MetadataService.claim_backfill_batch(
+                    last_id,
+                    batch_size if remaining is None else min(batch_size, remaining),
+                    statuses,
+                    fetched_before,
+                )
+                if examined_id is None:
+                    break
+                errors.extend(
+                    MetadataService.backfill_batch(
+                        documents,
+                        executor,
+                        reuse_doi=not reextract_doi,
+                        on_result=record,
+                    )
+                )
+                last_id = examined_id
+        except KeyboardInterrupt:
+            click.echo(f"\nInterrupted. Resume with --start-after {last_id}")
+            raise SystemExit(1)
+
+    for error in errors:
+        click.echo(f"Error: {error}")
+    click.echo(
+        f"Backfilled {sum(outcomes.values())} documents: "
+        f"{outcomes['completed']} with metadata, {outcomes['no_doi']} without DOI, "
+        f"{outcomes['failed']} failed (last id {last_id})."
+    )
+
+
 def register_cli(app):
     """Register CLI commands with the Flask application."""
-    app.cli.add_command(run_worker_command)
+    app.cli.add_command(run_workers_command)
     app.cli.add_command(process_queue_command)
     app.cli.add_command(queue_status_command)
+    app.cli.add_command(backfill_metadata_command)
@@ -0,0 +1,175 @@
+"""Background worker for CrossRef metadata enrichment using APScheduler.
+
+Implements adaptive polling: actively polls when there's work,
+pauses after consecutive idle checks, resumes when extraction
+completes new documents.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+logger = logging.getLogger(__name__)
+
+
+class MetadataWorkerManager:
+    """Manages the metadata enrichment worker with adaptive polling."""
+
+    def __init__(
+        self,
+        interval_seconds: int = 5,
+        max_idle_checks: Optional[int] = 10,
+        concurrency: int = 4,
+    ):
+        self.interval_seconds = interval_seconds
+        self.max_idle_checks = max_idle_checks
+        self.concurrency = concurrency
+        self.idle_count = 0
+        self.scheduler = None
+        self.app = None
+        self._lock = threading.Lock()
+        self._is_running = False
+
+    def init_app(self, app):
+        """Initialize with Flask application."""
+        if self.scheduler and self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+
+        self.app = app
+        self._is_running = False
+        self.scheduler = BackgroundScheduler(
+            executors={"default": ThreadPoolExecutor(self.concurrency)}
+        )
+        logger.info(
+            f"Metadata worker initialized "
+            f"(interval: {self.interval_seconds}s, "
+            f"max idle: {self.max_idle_checks}, "
+            f"concurrency: {self.concurrency})"
+        )
+
+    def _process_queue(self):
+        """Process documents awaiting metadata with idle tracking."""
+        if not self.app:
+            return
+
+        with self.app.app_context():
+            from app.services.metadata_service import MetadataService
+
+            MetadataService.release_stale_claims(
+                self.app.config.get("METADATA_CLAIM_TIMEOUT")
+            )
+
+            claimed, errors = MetadataService.process_batch(
+                self.app.config.get("METADATA_BATCH_SIZE", 10)
+            )
+
+            if claimed:
+                self.idle_count = 0
+                logger.info(
+                    f"Enriched {claimed} documents ({len(errors)} errors)"
+                )
+            else:
+                self.idle_count += 1
+                if (
+                    self.max_idle_checks is not None
+                    and self.idle_count >= self.max_idle_checks
+                ):
+                    self._pause()
+
+    def start(self):
+        """Start the worker scheduler."""
+        with self._lock:
+            if self._is_running:
+                return
+
+            self.idle_count = 0
+
+            if not self.scheduler.running:
+                self.scheduler.start()
+
+            try:
+                self.scheduler.add_job(
+                    func=self._process_queue,
+                    trigger=IntervalTrigger(seconds=self.interval_seconds),
+                    id="metadata_worker",
+                    name="Metadata Worker",
+                    replace_existing=True,
+                    max_instances=self.concurrency,
+                    coalesce=True,
+                )
+            except Exception:
+                self.scheduler.reschedule_job(
+                    "metadata_worker",
+                    trigger=IntervalTrigger(seconds=self.interval_seconds),
+                )
+
+            self._is_running = True
+            logger.info("Metadata worker started.")
+
+    def _pause(self):
+        """Pause the worker."""
+        with self._lock:
+            if not self._is_running:
+                return
+
+            try:
+                self.scheduler.pause_job("metadata_worker")
+            except Exception:
+                pass
+
+            self._is_running = False
+            logger.info("Metadata worker paused.")
+
+    def wake_up(self):
+        """Signal the worker to resume processing.
+
+        A no-op when this process has no in-process scheduler.
+        """
+        if self.scheduler is None:
+            return
+
+        with self._lock:
+            if self._is_running:
+                self.idle_count = 0
+                return
+
+            self.idle_count = 0
+
+            try:
+                self.scheduler.resume_job("metadata_worker")
+                self._is_running = True
+                logger.info("Metadata worker resumed.")
+            except Exception:
+                self.start()
+
+    def shutdown(self):
+        """Shutdown the worker scheduler."""
+        if self.scheduler and self.scheduler.running:
+            self.scheduler.shutdown(wait=True)
+            logger.info("Metadata worker shut down.")
+
+    @property
+    def is_running(self):
+        """Check if the worker is currently active."""
+        return self._is_running
+
+
+metadata_worker = MetadataWorkerManager()
+
+
+def init_metadata_worker(
+    app,
+    interval_seconds: int = 5,
+    max_idle_checks: Optional[int] = 10,
+    concurrency: int = 4,
+):
+    """Initialize and start the metadata worker."""
+    metadata_worker.interval_seconds = interval_seconds
+    metadata_worker.max_idle_checks = max_idle_checks
+    metadata_worker.concurrency = concurrency
+    metadata_worker.init_app(app)
+    metadata_worker.start()
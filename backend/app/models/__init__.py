@@ -9,6 +9,9 @@ from app.models.extraction_queue import ExtractionQueue
 from app.models.typo_check_result import TypoCheckResult
 from app.models.system_prompt import SystemPromptConfig
 from app.models.typo_check_job import TypoCheckJob
+from app.models.crossref_cache import CrossRefCacheEntry
+from app.models.rate_limit_bucket import RateLimitBucket
+from app.models.typo_chunk_cache import TypoChunkCacheEntry
 
 __all__ = [
     "db",
@@ -20,4 +23,7 @@ __all__ = [
     "TypoCheckResult",
     "SystemPromptConfig",
     "TypoCheckJob",
+    "CrossRefCacheEntry",
+    "RateLimitBucket",
+    "TypoChunkCacheEntry",
 ]
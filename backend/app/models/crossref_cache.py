@@ -0,0 +1,37 @@
+"""CrossRefCacheEntry model for the persistent CrossRef metadata cache."""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import String, Text, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app import db
+
+
+class CrossRefCacheEntry(db.Model):
+    """Cached CrossRef metadata shared by all processes.
+
+    Sits behind CrossRefService's in-memory LRU so lookups survive
+    restarts and are shared between web and worker processes.
+    """
+
+    __tablename__ = "crossref_cache"
+
+    doi: Mapped[str] = mapped_column(String(255), primary_key=True)
+    # Parsed metadata as a JSON string
+    data: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    # Used to evict the least recently used rows when over the size limit
+    last_accessed_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+        index=True,
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of cache entry."""
+        return f"<CrossRefCacheEntry {self.doi}>"
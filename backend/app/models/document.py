@@ -26,6 +26,8 @@ class SearchDocument(db.Model):
     page_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     extraction_status: Mapped[str] = mapped_column(String(20), default="pending")
     extraction_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Extraction engine mode that produced the stored pages
+    extraction_mode: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     retry_count: Mapped[int] = mapped_column(Integer, default=0)
     uploaded_at: Mapped[datetime] = mapped_column(
         DateTime, default=lambda: datetime.now(timezone.utc)
@@ -47,6 +49,10 @@ class SearchDocument(db.Model):
     metadata_fetched_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime, nullable=True
     )
+    # When the metadata worker claimed the document (stale claims are retried)
+    metadata_claimed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True
+    )
 
     # Relationships
     owner = relationship("User", back_populates="documents")
@@ -79,6 +85,7 @@ class SearchDocument(db.Model):
             "page_count": self.page_count,
             "extraction_status": self.extraction_status,
             "extraction_error": self.extraction_error,
+            "extraction_mode": self.extraction_mode,
             "uploaded_at": self.uploaded_at.isoformat() if self.uploaded_at else None,
             "extraction_completed_at": (
                 self.extraction_completed_at.isoformat()
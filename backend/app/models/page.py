@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from sqlalchemy import Integer, Text, ForeignKey, UniqueConstraint
+from sqlalchemy import Integer, String, Text, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app import db
@@ -22,6 +22,9 @@ class SearchPage(db.Model):
     page_number: Mapped[int] = mapped_column(Integer, nullable=False)
     content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     content_normalized: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Why the page is empty when extraction hit a limit
+    # (timeout, memory_limit, crashed); None for normal pages
+    extraction_flag: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
 
     # Unique constraint on (document_id, page_number)
     __table_args__ = (
@@ -42,7 +45,8 @@ class SearchPage(db.Model):
             "document_id": self.document_id,
             "page_number": self.page_number,
             "content": self.content,
-            "content_normalized": self.content_normalized
+            "content_normalized": self.content_normalized,
+            "extraction_flag": self.extraction_flag
         }
 
     def __repr__(self) -> str:
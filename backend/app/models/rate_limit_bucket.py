@@ -0,0 +1,24 @@
+"""RateLimitBucket model for rate limits shared between processes."""
+
+from sqlalchemy import Float, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app import db
+
+
+class RateLimitBucket(db.Model):
+    """Token bucket state shared by every process using the same limit.
+
+    Timestamps are Unix epoch seconds so refill arithmetic can run inside
+    a single atomic UPDATE on any backend.
+    """
+
+    __tablename__ = "rate_limit_buckets"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    tokens: Mapped[float] = mapped_column(Float, nullable=False)
+    updated_at: Mapped[float] = mapped_column(Float, nullable=False)
+
+    def __repr__(self) -> str:
+        """Return string representation of bucket."""
+        return f"<RateLimitBucket {self.name} tokens={self.tokens:.2f}>"
@@ -2,6 +2,7 @@
 
 import json
 from datetime import datetime, timezone
+from typing import Optional
 
 from sqlalchemy import String, Integer, DateTime, Text, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -27,6 +28,8 @@ class TypoCheckResult(db.Model):
     corrected_text: Mapped[str] = mapped_column(Text, nullable=False)
     issues: Mapped[str] = mapped_column(Text, nullable=False, default="[]")
     provider_used: Mapped[str] = mapped_column(String(50), nullable=False)
+    # Hash of the provider's model and system prompt (None for old rows)
+    prompt_version: Mapped[Optional[str]] = mapped_column(String(16), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=lambda: datetime.now(timezone.utc)
     )
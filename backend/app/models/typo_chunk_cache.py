@@ -0,0 +1,47 @@
+"""TypoChunkCacheEntry model for caching typo check results per chunk."""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import String, Text, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app import db
+
+
+class TypoChunkCacheEntry(db.Model):
+    """Cached provider result for one chunk of a typo check.
+
+    Keyed on a hash of the user, provider, prompt version and chunk text,
+    so resubmitting an edited document only sends the changed chunks to
+    the provider. Entries of the opt-in shared tier have no user and are
+    keyed on an HMAC of provider, prompt version and text instead.
+    """
+
+    __tablename__ = "typo_chunk_cache"
+
+    # SHA-256 of user id, provider, prompt version and chunk text, or for
+    # shared entries an HMAC-SHA256 of provider, prompt version and text
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    # None for shared entries
+    user_id: Mapped[Optional[str]] = mapped_column(
+        String(36),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
+    provider: Mapped[str] = mapped_column(String(50), nullable=False)
+    prompt_version: Mapped[str] = mapped_column(String(64), nullable=False)
+    corrected_text: Mapped[str] = mapped_column(Text, nullable=False)
+    # Issues as a JSON string, positions relative to the chunk
+    issues: Mapped[str] = mapped_column(Text, nullable=False, default="[]")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+        index=True,
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of cache entry."""
+        return f"<TypoChunkCacheEntry {self.cache_key[:12]}>"
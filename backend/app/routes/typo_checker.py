@@ -23,8 +23,11 @@ typo_checker_bp = Blueprint("typo_checker", __name__)
 def check_typo():
     """Submit text for async typo checking.
 
-    Returns cached result (200) immediately if available,
-    otherwise creates a background job and returns 202.
+    Returns cached result (200) immediately if available. Short texts
+    submitted without a provider are checked right away on the fastest
+    healthy provider, hedged against its tail latency, when TYPO_HEDGING
+    is on, for at most TYPO_HEDGE_SYNC_TIMEOUT seconds. Otherwise creates
+    a background job and returns 202.
     """
     data = request.get_json()
 
@@ -44,7 +47,15 @@ def check_typo():
             {"error": f"Text exceeds maximum limit of {MAX_TEXT_LENGTH} characters"}
         ), 400
 
-    provider = data.get("provider", "gemini")
+    # Without an explicit provider, short texts are checked synchronously
+    # so a stalled provider can be hedged; on failure or after
+    # TYPO_HEDGE_SYNC_TIMEOUT fall back to a job
+    if not data.get("provider") and TypoCheckerService.is_hedge_eligible(text):
+        result = TypoCheckerService.check_text_within(text, g.user_id)
+        if result and result.get("success"):
+            return jsonify(result), 200
+
+    provider = data.get("provider") or "gemini"
 
     # Check cache first (fast path)
     text_hash = hashlib.sha256(text.encode()).hexdigest()
@@ -67,6 +78,12 @@ def check_typo():
             "provider": cached_result.provider_used,
         }), 200
 
+    # Every chunk may already be cached (possibly by another user when
+    # the shared cache is on); answer without queueing a job
+    chunk_result = TypoCheckerService.get_cached_result(text, g.user_id, provider)
+    if chunk_result:
+        return jsonify(chunk_result), 200
+
     # Check concurrent job limit per user
     active_jobs = TypoCheckJob.query.filter(
         TypoCheckJob.user_id == g.user_id,
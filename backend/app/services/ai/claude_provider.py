@@ -7,6 +7,7 @@ to provide Korean text typo checking functionality.
 import json
 import logging
 import os
+import threading
 from typing import List, Optional
 
 from anthropic import Anthropic
@@ -78,6 +79,7 @@ IMPORTANT: Return ONLY the JSON object, no additional text or markdown formattin
         self.model = model or self.DEFAULT_MODEL
         self.max_tokens = max_tokens or self.DEFAULT_MAX_TOKENS
         self._client: Optional[Anthropic] = None
+        self._client_lock = threading.Lock()
 
     @property
     def provider_name(self) -> str:
@@ -103,22 +105,24 @@ IMPORTANT: Return ONLY the JSON object, no additional text or markdown formattin
             Anthropic client instance
         """
         if self._client is None:
-            self._client = Anthropic(api_key=self._api_key)
+            with self._client_lock:
+                if self._client is None:
+                    self._client = Anthropic(api_key=self._api_key)
         return self._client
 
     def get_system_prompt(self) -> str:
-        """Get the system prompt, checking database for custom configuration.
+        """Get the system prompt, using the cached custom configuration if any.
 
         Returns:
             Custom prompt from database if available and active,
             otherwise returns the default SYSTEM_PROMPT.
         """
         try:
-            from app.models.system_prompt import SystemPromptConfig
+            from app.services.system_prompt_service import SystemPromptService
 
-            config = SystemPromptConfig.get_by_provider(self.provider_name)
-            if config and config.is_active:
-                return config.prompt
+            prompt = SystemPromptService.get_cached_prompt_text(self.provider_name)
+            if prompt:
+                return prompt
         except Exception:
             # If database is not available, fall back to default
             pass
@@ -0,0 +1,293 @@
+"""Rolling health statistics and circuit breakers for AI providers.
+
+Every provider call records its latency and outcome. A provider whose
+recent calls keep failing has its circuit opened: it gets no traffic
+routed to it for a cooldown period, after which a single probe call is
+let through (half-open) while other calls are turned away, and the
+probe's outcome closes or re-opens the circuit.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+
+# Number of recent calls kept per provider
+DEFAULT_WINDOW = 50
+
+# Consecutive failures that open a circuit
+DEFAULT_FAILURE_THRESHOLD = 5
+
+# Error rate over the window that opens a circuit, once it has enough calls
+DEFAULT_ERROR_RATE_THRESHOLD = 0.5
+MIN_CALLS_FOR_ERROR_RATE = 10
+
+# Seconds an open circuit rejects traffic before letting calls through
+DEFAULT_COOLDOWN = 30.0
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class _ProviderStats:
+    """Recent calls and circuit state for one provider."""
+
+    calls: Deque[Tuple[float, bool]]
+    consecutive_failures: int = 0
+    state: str = CLOSED
+    opened_at: float = 0.0
+    probe_admitted_at: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+
+
+class ProviderHealth:
+    """Thread-safe per-provider latency, error-rate and circuit tracking."""
+
+    def __init__(
+        self,
+        window: int = DEFAULT_WINDOW,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN,
+        error_rate_threshold: float = DEFAULT_ERROR_RATE_THRESHOLD,
+    ):
+        """Initialize empty statistics.
+
+        Args:
+            window: Number of recent calls kept per provider
+            failure_threshold: Consecutive failures that open a circuit
+            cooldown: Seconds an open circuit rejects traffic
+            error_rate_threshold: Window error rate that opens a circuit
+        """
+        self.window = window
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.error_rate_threshold = error_rate_threshold
+        self._stats: Dict[str, _ProviderStats] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, provider: str) -> _ProviderStats:
+        stats = self._stats.get(provider)
+        if stats is None:
+            stats = _ProviderStats(calls=deque(maxlen=self.window))
+            self._stats[provider] = stats
+        return stats
+
+    def record(
+        self,
+        provider: str,
+        latency: float,
+        success: bool,
+        admitted_at: Optional[float] = None,
+    ) -> None:
+        """Record the outcome of one provider call.
+
+        While a circuit is open or half-open only the probe's outcome
+        moves it: success closes it, failure re-opens it. Other calls,
+        such as slow ones admitted before it opened, only add to the
+        statistics.
+
+        Args:
+            provider: Provider name
+            latency: Seconds the call took
+            success: Whether the call returned a usable result
+            admitted_at: Ticket acquire returned for the call, if any
+        """
+        with self._lock:
+            stats = self._get(provider)
+            stats.calls.append((latency, success))
+            stats.latencies = sorted(elapsed for elapsed, ok in stats.calls if ok)
+
+            if stats.state != CLOSED:
+                is_probe = (
+                    stats.state == HALF_OPEN
+                    and admitted_at is not None
+                    and admitted_at == stats.probe_admitted_at
+                )
+                if is_probe and success:
+                    stats.consecutive_failures = 0
+                    stats.state = CLOSED
+                elif is_probe:
+                    stats.state = OPEN
+                    stats.opened_at = time.monotonic()
+                return
+
+            if success:
+                stats.consecutive_failures = 0
+                return
+
+            stats.consecutive_failures += 1
+            failures = sum(1 for _, ok in stats.calls if not ok)
+            too_many_errors = (
+                len(stats.calls) >= MIN_CALLS_FOR_ERROR_RATE
+                and failures / len(stats.calls) >= self.error_rate_threshold
+            )
+            if (
+                stats.consecutive_failures >= self.failure_threshold
+                or too_many_errors
+            ):
+                stats.state = OPEN
+                stats.opened_at = time.monotonic()
+
+    def _rejecting(self, stats: _ProviderStats, now: float) -> bool:
+        """Return whether a circuit currently rejects calls (lock held).
+
+        An open circuit rejects calls during its cooldown, a half-open one
+        while its probe is in flight. A probe that has not reported within
+        a cooldown is presumed lost and may be replaced.
+        """
+        if stats.state == CLOSED:
+            return False
+        since = stats.opened_at if stats.state == OPEN else stats.probe_admitted_at
+        return now - since < self.cooldown
+
+    def is_healthy(self, provider: str) -> bool:
+        """Return whether traffic may be routed to a provider.
+
+        True for a closed circuit, and for an open one past its cooldown
+        that is ready for a probe. A half-open circuit, whose probe is
+        still in flight, takes no new traffic. Does not change any state.
+        """
+        with self._lock:
+            stats = self._stats.get(provider)
+            return stats is None or not self._rejecting(stats, time.monotonic())
+
+    def acquire(self, provider: str) -> Optional[float]:
+        """Admit a call to a provider, without waiting.
+
+        The first call to an open circuit past its cooldown becomes the
+        probe and turns the circuit half-open; until the probe reports,
+        further calls are refused so the caller can route elsewhere.
+
+        Args:
+            provider: Provider name
+
+        Returns:
+            Ticket to pass to record for this call, or None if the
+            circuit rejects calls right now
+        """
+        now = time.monotonic()
+        with self._lock:
+            stats = self._stats.get(provider)
+            if stats is None or stats.state == CLOSED:
+                return now
+            if self._rejecting(stats, now):
+                return None
+            stats.state = HALF_OPEN
+            stats.probe_admitted_at = now
+            return now
+
+    def latency(self, provider: str, quantile: float = 0.5) -> Optional[float]:
+        """Return a latency quantile of recent successful calls.
+
+        Args:
+            provider: Provider name
+            quantile: Quantile between 0 and 1
+
+        Returns:
+            Latency in seconds, or None without successful calls
+        """
+        with self._lock:
+            stats = self._stats.get(provider)
+            if stats is None or not stats.latencies:
+                return None
+            latencies = stats.latencies
+            index = min(len(latencies) - 1, int(quantile * len(latencies)))
+            return latencies[index]
+
+    def routing_key(self, provider: str) -> Tuple[int, float]:
+        """Return a sort key ranking providers for routing, best first.
+
+        Providers never called rank first so each gets tried, then
+        providers by median latency of successful calls, then providers
+        whose recent calls all failed.
+
+        Args:
+            provider: Provider name
+
+        Returns:
+            Tuple of (rank group, median latency)
+        """
+        with self._lock:
+            stats = self._stats.get(provider)
+            if stats is None or not stats.calls:
+                return (0, 0.0)
+            if not stats.latencies:
+                return (2, 0.0)
+            latencies = stats.latencies
+            return (1, latencies[len(latencies) // 2])
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Return current statistics for every provider seen.
+
+        Returns:
+            Dictionary of provider name to calls, error_rate, p50/p90
+            latency and circuit state
+        """
+        names = list(self._stats)
+        result = {}
+        for name in names:
+            with self._lock:
+                stats = self._stats[name]
+                calls = len(stats.calls)
+                failures = sum(1 for _, ok in stats.calls if not ok)
+                state = stats.state
+            result[name] = {
+                "calls": calls,
+                "error_rate": failures / calls if calls else 0.0,
+                "p50_latency": self.latency(name, 0.5),
+                "p90_latency": self.latency(name, 0.9),
+                "state": state,
+            }
+        return result
+
+
+class HedgeBudget:
+    """Caps the share of requests that may fire a hedge.
+
+    Tracks whether each of the last ``window`` eligible requests was
+    hedged, and allows a new hedge only while fewer than ``ratio`` of
+    the requests actually seen were, so a cold start does not hedge a
+    burst of ``ratio * window`` requests in a row. Losing calls that are
+    still running after their race was decided are charged against the
+    budget until they finish, since they still hold a provider slot and
+    are still billed.
+    """
+
+    def __init__(self, ratio: float, window: int = 100):
+        """Initialize an empty budget.
+
+        Args:
+            ratio: Maximum fraction of requests that may be hedged
+            window: Number of recent requests the ratio applies to
+        """
+        self.ratio = ratio
+        self.window = window
+        self._hedged: Deque[bool] = deque(maxlen=window)
+        self._abandoned = 0
+        self._lock = threading.Lock()
+
+    def record(self) -> None:
+        """Record a request that was answered without hedging."""
+        with self._lock:
+            self._hedged.append(False)
+
+    def charge(self) -> None:
+        """Charge an abandoned, still running call against the budget."""
+        with self._lock:
+            self._abandoned += 1
+
+    def release(self) -> None:
+        """Release the charge for an abandoned call that has finished."""
+        with self._lock:
+            self._abandoned = max(0, self._abandoned - 1)
+
+    def try_hedge(self) -> bool:
+        """Record a request that wants to hedge; return whether it may."""
+        with self._lock:
+            spent = sum(self._hedged) + self._abandoned
+            allowed = spent < self.ratio * max(len(self._hedged), 1)
+            self._hedged.append(allowed)
+            return allowed
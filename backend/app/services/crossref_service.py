@@ -2,14 +2,46 @@
 
 Fetches metadata for academic papers using DOIs from the CrossRef API.
 Uses the Polite Pool with mailto parameter for better rate limits.
-Includes in-memory caching with 7-day TTL.
+
+Results are cached for 7 days in two tiers: a bounded in-process LRU and
+a persistent crossref_cache table shared by all processes, so hit rates
+survive restarts and deploys. Failed lookups are cached briefly in memory
+and concurrent lookups of the same DOI share a single request.
+
+Requests go through a shared keep-alive session with a connection pool
+and retry/backoff policy, so most lookups skip the TCP and TLS handshake,
+and are paced by a token bucket to stay within the Polite Pool limit.
 """
 
+import json
+import logging
 import threading
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from http.cookiejar import DefaultCookiePolicy
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional, Tuple
 
 import requests
+from flask import current_app, has_app_context
+from requests.adapters import HTTPAdapter
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from urllib3.util.retry import Retry
+
+from app.utils.rate_limiter import DatabaseRateLimiter, RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class _InFlightLookup:
+    """A CrossRef request that concurrent callers for the same DOI wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Tuple[Optional[Dict[str, Any]], Optional[str]] = (
+            None,
+            "Unexpected error: lookup did not complete",
+        )
 
 
 class CrossRefService:
@@ -18,22 +50,77 @@ class CrossRefService:
     # CrossRef API base URL
     API_BASE_URL = "https://api.crossref.org/works"
 
-    # Request timeout in seconds
+    # Request timeout in seconds (default for CROSSREF_TIMEOUT)
     TIMEOUT = 2
 
+    # Defaults for the pooled HTTP session (CROSSREF_POOL_SIZE,
+    # CROSSREF_MAX_RETRIES, CROSSREF_BACKOFF_FACTOR)
+    POOL_SIZE = 10
+    MAX_RETRIES = 2
+    BACKOFF_FACTOR = 0.3
+
+    # Transient statuses worth retrying
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    # Defaults for CROSSREF_RATE_LIMIT (requests per second) and
+    # CROSSREF_RATE_LIMIT_TIMEOUT (seconds to wait for a request slot)
+    RATE_LIMIT = 50
+    RATE_LIMIT_TIMEOUT = 10
+
+    # Returned when no request slot frees up in time; never negative-cached
+    RATE_LIMITED_ERROR = "Rate limited: CrossRef request budget exhausted"
+
     # Contact email for Polite Pool access
     MAILTO = "pdf-search@example.com"
 
     # Cache TTL in days
     CACHE_TTL_DAYS = 7
 
-    # In-memory cache storage
-    _cache: Dict[str, Dict[str, Any]] = {}
+    # Defaults for CROSSREF_CACHE_MAX_ENTRIES / CROSSREF_CACHE_MAX_ROWS
+    CACHE_MAX_ENTRIES = 1000
+    PERSISTENT_CACHE_MAX_ROWS = 50000
+
+    # Prune the persistent cache after this many writes
+    PERSISTENT_PRUNE_INTERVAL = 100
+
+    # Refresh a row's last_accessed_at at most this often
+    ACCESS_TOUCH_INTERVAL = timedelta(hours=1)
+
+    # Defaults for CROSSREF_NOT_FOUND_TTL / CROSSREF_ERROR_TTL (seconds)
+    NOT_FOUND_TTL_SECONDS = 3600
+    ERROR_TTL_SECONDS = 60
+
+    # How long a caller waits for another thread's in-flight request
+    INFLIGHT_WAIT_SECONDS = 30
+
+    # In-memory LRU cache, least recently used first
+    _cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
     _cache_lock = threading.Lock()
 
+    # Recently failed lookups (not found, timeouts, API errors)
+    _negative_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    # Shared HTTP session, rebuilt when its settings change
+    _session: Optional[requests.Session] = None
+    _session_settings: Optional[Tuple[int, int, float]] = None
+    _session_lock = threading.Lock()
+
+    # Shared request pacing, rebuilt when the rate or backing store changes
+    _rate_limiter: Optional[RateLimiter] = None
+    _rate_limiter_key: Optional[Tuple[int, Optional[int]]] = None
+    _rate_limiter_lock = threading.Lock()
+
+    # Lookups currently being fetched, keyed by DOI
+    _inflight: Dict[str, _InFlightLookup] = {}
+    _inflight_lock = threading.Lock()
+
     # Cache statistics
     _cache_hits = 0
     _cache_misses = 0
+    _persistent_hits = 0
+    _writes_since_prune = 0
+    _negative_hits = 0
+    _coalesced = 0
 
     @classmethod
     def fetch_metadata(
@@ -43,7 +130,8 @@ class CrossRefService:
 
         Uses the Polite Pool by including mailto parameter.
         Returns tuple following the (result, error) pattern.
-        Caches successful results for 7 days.
+        Caches successful results for 7 days and failures for a short TTL.
+        Concurrent calls for the same DOI share one API request.
 
         Args:
             doi: DOI string to look up
@@ -54,24 +142,80 @@ class CrossRefService:
         if not doi:
             return None, "Invalid DOI: DOI cannot be empty"
 
-        # Check cache first
-        cached = cls._get_cache_entry(doi)
+        cached = cls._lookup_caches(doi)
         if cached is not None:
+            return cached
+
+        with cls._inflight_lock:
+            lookup = cls._inflight.get(doi)
+            is_leader = lookup is None
+            if is_leader:
+                lookup = _InFlightLookup()
+                cls._inflight[doi] = lookup
+
+        if not is_leader:
             with cls._cache_lock:
-                cls._cache_hits += 1
-            return cached, None
+                cls._coalesced += 1
+            if not lookup.done.wait(cls.INFLIGHT_WAIT_SECONDS):
+                return None, "Request timeout: CrossRef API did not respond in time"
+            return lookup.result
 
-        with cls._cache_lock:
-            cls._cache_misses += 1
+        try:
+            # Another caller may have finished between our cache check and
+            # taking over the lookup
+            cached = cls._get_cache_entry(doi)
+            if cached is not None:
+                lookup.result = (cached, None)
+                return cached, None
+
+            with cls._cache_lock:
+                cls._cache_misses += 1
+
+            # Fetch from API
+            result, error = cls._fetch_from_api(doi)
+
+            if result is not None and error is None:
+                cls._set_cache_entry(doi, result)
+                cls._set_persistent_entry(doi, result)
+            elif error is not None and error != cls.RATE_LIMITED_ERROR:
+                cls._set_negative_entry(doi, error)
+
+            lookup.result = (result, error)
+            return result, error
+
+        finally:
+            with cls._inflight_lock:
+                cls._inflight.pop(doi, None)
+            lookup.done.set()
+
+    @classmethod
+    def _lookup_caches(
+        cls, doi: str
+    ) -> Optional[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        """Check the negative, in-memory and persistent caches in turn.
+
+        Args:
+            doi: DOI string as cache key
 
-        # Fetch from API
-        result, error = cls._fetch_from_api(doi)
+        Returns:
+            Cached (result, error) tuple, or None on a miss
+        """
+        error = cls._get_negative_entry(doi)
+        if error is not None:
+            with cls._cache_lock:
+                cls._negative_hits += 1
+            return None, error
 
-        # Cache successful results only
-        if result is not None and error is None:
-            cls._set_cache_entry(doi, result)
+        cached = cls._get_cache_entry(doi)
+        if cached is None:
+            cached = cls._get_persistent_entry(doi)
+
+        if cached is None:
+            return None
 
-        return result, error
+        with cls._cache_lock:
+            cls._cache_hits += 1
+        return cached, None
 
     @classmethod
     def _fetch_from_api(
@@ -87,9 +231,18 @@ class CrossRefService:
         """
         url = f"{cls.API_BASE_URL}/{doi}"
         params = {"mailto": cls.MAILTO}
+        timeout = cls._get_config("CROSSREF_TIMEOUT", cls.TIMEOUT)
+
+        if not cls._get_rate_limiter().acquire(
+            wait=True,
+            timeout=cls._get_config(
+                "CROSSREF_RATE_LIMIT_TIMEOUT", cls.RATE_LIMIT_TIMEOUT
+            ),
+        ):
+            return None, cls.RATE_LIMITED_ERROR
 
         try:
-            response = requests.get(url, params=params, timeout=cls.TIMEOUT)
+            response = cls._get_session().get(url, params=params, timeout=timeout)
 
             if response.status_code == 404:
                 return None, f"DOI not found: {doi}"
@@ -115,6 +268,105 @@ class CrossRefService:
         except Exception as e:
             return None, f"Unexpected error: {str(e)}"
 
+    @classmethod
+    def _get_rate_limiter(cls) -> RateLimiter:
+        """Return the shared rate limiter for CrossRef requests.
+
+        Inside an app context with CROSSREF_RATE_LIMIT_SHARED enabled the
+        budget lives in the database, so every web and worker process
+        draws from the same bucket. Otherwise it is per process.
+
+        Returns:
+            RateLimiter allowing CROSSREF_RATE_LIMIT requests per second
+        """
+        rate = cls._get_config("CROSSREF_RATE_LIMIT", cls.RATE_LIMIT)
+        engine = None
+        if has_app_context() and current_app.config.get(
+            "CROSSREF_RATE_LIMIT_SHARED", True
+        ):
+            from app.models import db
+
+            engine = db.engine
+
+        key = (rate, id(engine) if engine is not None else None)
+
+        with cls._rate_limiter_lock:
+            if cls._rate_limiter is None or cls._rate_limiter_key != key:
+                if engine is not None:
+                    cls._rate_limiter = DatabaseRateLimiter(
+                        engine, "crossref", rate=rate, per_seconds=1.0
+                    )
+                else:
+                    cls._rate_limiter = RateLimiter(rate=rate, per_seconds=1.0)
+                cls._rate_limiter_key = key
+            return cls._rate_limiter
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Return the shared HTTP session, creating it on first use.
+
+        The session keeps connections to CrossRef alive between lookups.
+        It never stores cookies, so sharing it between threads is safe.
+
+        Returns:
+            Configured requests.Session
+        """
+        settings = (
+            cls._get_config("CROSSREF_POOL_SIZE", cls.POOL_SIZE),
+            cls._get_config("CROSSREF_MAX_RETRIES", cls.MAX_RETRIES),
+            cls._get_config("CROSSREF_BACKOFF_FACTOR", cls.BACKOFF_FACTOR),
+        )
+
+        with cls._session_lock:
+            if cls._session is not None and cls._session_settings == settings:
+                return cls._session
+
+            pool_size, max_retries, backoff_factor = settings
+            retry = Retry(
+                total=max_retries,
+                connect=max_retries,
+                # Retrying read timeouts would multiply the lookup budget
+                read=0,
+                status=max_retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=cls.RETRY_STATUSES,
+                allowed_methods=frozenset(["GET"]),
+                respect_retry_after_header=True,
+                # Return the last response so it is reported as an API error
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=1, pool_maxsize=pool_size, max_retries=retry
+            )
+
+            session = requests.Session()
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+            if cls._session is not None:
+                cls._session.close()
+            cls._session = session
+            cls._session_settings = settings
+
+            return session
+
+    @classmethod
+    def close_session(cls) -> None:
+        """Close the shared HTTP session and its pooled connections."""
+        with cls._session_lock:
+            if cls._session is not None:
+                cls._session.close()
+            cls._session = None
+            cls._session_settings = None
+
+    @classmethod
+    def _get_config(cls, name: str, default: Any) -> Any:
+        """Read a setting from app config, falling back outside an app."""
+        if has_app_context():
+            return current_app.config.get(name, default)
+        return default
+
     @classmethod
     def _get_cache_entry(cls, doi: str) -> Optional[Dict[str, Any]]:
         """Get cache entry if exists and not expired.
@@ -137,31 +389,268 @@ class CrossRefService:
                 del cls._cache[doi]
                 return None
 
+            cls._cache.move_to_end(doi)
             return entry["data"]
 
     @classmethod
-    def _set_cache_entry(cls, doi: str, data: Dict[str, Any]) -> None:
-        """Store data in cache with TTL.
+    def _set_cache_entry(
+        cls, doi: str, data: Dict[str, Any], ttl: Optional[timedelta] = None
+    ) -> None:
+        """Store data in cache with TTL, evicting least recently used entries.
 
         Args:
             doi: DOI string as cache key
             data: Metadata to cache
+            ttl: Time to live (default CACHE_TTL_DAYS)
         """
-        expires_at = datetime.now() + timedelta(days=cls.CACHE_TTL_DAYS)
+        expires_at = datetime.now() + (ttl or timedelta(days=cls.CACHE_TTL_DAYS))
+        max_entries = cls._get_config(
+            "CROSSREF_CACHE_MAX_ENTRIES", cls.CACHE_MAX_ENTRIES
+        )
 
         with cls._cache_lock:
             cls._cache[doi] = {
                 "data": data,
                 "expires_at": expires_at,
             }
+            cls._cache.move_to_end(doi)
+
+            while len(cls._cache) > max_entries:
+                cls._cache.popitem(last=False)
+
+    @classmethod
+    def _get_negative_entry(cls, doi: str) -> Optional[str]:
+        """Get the cached error for a recently failed lookup.
+
+        Args:
+            doi: DOI string as cache key
+
+        Returns:
+            Cached error message or None if not found/expired
+        """
+        with cls._cache_lock:
+            entry = cls._negative_cache.get(doi)
+
+            if entry is None:
+                return None
+
+            if datetime.now() > entry["expires_at"]:
+                del cls._negative_cache[doi]
+                return None
+
+            return entry["error"]
+
+    @classmethod
+    def _set_negative_entry(cls, doi: str, error: str) -> None:
+        """Cache a failed lookup with a short TTL.
+
+        Not-found DOIs are cached longer than transient failures
+        (timeouts, network and API errors).
+
+        Args:
+            doi: DOI string as cache key
+            error: Error message returned by the lookup
+        """
+        if error.startswith("DOI not found"):
+            ttl_seconds = cls._get_config(
+                "CROSSREF_NOT_FOUND_TTL", cls.NOT_FOUND_TTL_SECONDS
+            )
+        else:
+            ttl_seconds = cls._get_config("CROSSREF_ERROR_TTL", cls.ERROR_TTL_SECONDS)
+
+        if ttl_seconds <= 0:
+            return
+
+        max_entries = cls._get_config(
+            "CROSSREF_CACHE_MAX_ENTRIES", cls.CACHE_MAX_ENTRIES
+        )
+
+        with cls._cache_lock:
+            cls._negative_cache[doi] = {
+                "error": error,
+                "expires_at": datetime.now() + timedelta(seconds=ttl_seconds),
+            }
+            cls._negative_cache.move_to_end(doi)
+
+            while len(cls._negative_cache) > max_entries:
+                cls._negative_cache.popitem(last=False)
+
+    @classmethod
+    def _persistent_cache_enabled(cls) -> bool:
+        """Return True if the persistent cache tier can be used."""
+        return has_app_context() and current_app.config.get(
+            "CROSSREF_PERSISTENT_CACHE", True
+        )
+
+    @classmethod
+    def _get_persistent_entry(cls, doi: str) -> Optional[Dict[str, Any]]:
+        """Get an unexpired entry from the persistent cache.
+
+        Hits are promoted into the in-memory cache for their remaining TTL.
+        Cache tables use their own connection so they never commit or roll
+        back the caller's session.
+
+        Args:
+            doi: DOI string as cache key
+
+        Returns:
+            Cached metadata or None if not found/expired/unavailable
+        """
+        if not cls._persistent_cache_enabled():
+            return None
+
+        from app.models import db
+        from app.models.crossref_cache import CrossRefCacheEntry
+
+        table = CrossRefCacheEntry.__table__
+        now = datetime.now(timezone.utc)
+
+        try:
+            with db.engine.begin() as conn:
+                row = conn.execute(
+                    select(table.c.data, table.c.expires_at).where(
+                        table.c.doi == doi, table.c.expires_at > now
+                    )
+                ).first()
+
+                if row is None:
+                    return None
+
+                conn.execute(
+                    update(table)
+                    .where(
+                        table.c.doi == doi,
+                        table.c.last_accessed_at < now - cls.ACCESS_TOUCH_INTERVAL,
+                    )
+                    .values(last_accessed_at=now)
+                )
+
+        except SQLAlchemyError as e:
+            logger.warning(f"CrossRef persistent cache read failed: {e}")
+            return None
+
+        data = json.loads(row.data)
+        remaining = row.expires_at.replace(tzinfo=None) - now.replace(tzinfo=None)
+        cls._set_cache_entry(doi, data, ttl=remaining)
+
+        with cls._cache_lock:
+            cls._persistent_hits += 1
+
+        return data
+
+    @classmethod
+    def _set_persistent_entry(cls, doi: str, data: Dict[str, Any]) -> None:
+        """Store data in the persistent cache, pruning it periodically.
+
+        Args:
+            doi: DOI string as cache key
+            data: Metadata to cache
+        """
+        if not cls._persistent_cache_enabled():
+            return
+
+        from app.models import db
+        from app.models.crossref_cache import CrossRefCacheEntry
+
+        table = CrossRefCacheEntry.__table__
+        now = datetime.now(timezone.utc)
+
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(delete(table).where(table.c.doi == doi))
+                conn.execute(
+                    insert(table).values(
+                        doi=doi,
+                        data=json.dumps(data),
+                        created_at=now,
+                        expires_at=now + timedelta(days=cls.CACHE_TTL_DAYS),
+                        last_accessed_at=now,
+                    )
+                )
+
+        except SQLAlchemyError as e:
+            # Another process may have stored the same DOI concurrently
+            logger.warning(f"CrossRef persistent cache write failed: {e}")
+            return
+
+        with cls._cache_lock:
+            cls._writes_since_prune += 1
+            should_prune = cls._writes_since_prune >= cls.PERSISTENT_PRUNE_INTERVAL
+            if should_prune:
+                cls._writes_since_prune = 0
+
+        if should_prune:
+            cls.prune_persistent_cache()
+
+    @classmethod
+    def prune_persistent_cache(cls, max_rows: Optional[int] = None) -> int:
+        """Evict expired rows, then least recently used rows over the limit.
+
+        Args:
+            max_rows: Row limit (default CROSSREF_CACHE_MAX_ROWS)
+
+        Returns:
+            Number of rows deleted
+        """
+        if not cls._persistent_cache_enabled():
+            return 0
+
+        from app.models import db
+        from app.models.crossref_cache import CrossRefCacheEntry
+
+        table = CrossRefCacheEntry.__table__
+        if max_rows is None:
+            max_rows = cls._get_config(
+                "CROSSREF_CACHE_MAX_ROWS", cls.PERSISTENT_CACHE_MAX_ROWS
+            )
+
+        try:
+            with db.engine.begin() as conn:
+                deleted = conn.execute(
+                    delete(table).where(
+                        table.c.expires_at <= datetime.now(timezone.utc)
+                    )
+                ).rowcount
+
+                count = conn.execute(select(func.count()).select_from(table)).scalar()
+                if count > max_rows:
+                    oldest = (
+                        select(table.c.doi)
+                        .order_by(table.c.last_accessed_at.asc())
+                        .limit(count - max_rows)
+                    )
+                    deleted += conn.execute(
+                        delete(table).where(table.c.doi.in_(oldest))
+                    ).rowcount
+
+        except SQLAlchemyError as e:
+            logger.warning(f"CrossRef persistent cache prune failed: {e}")
+            return 0
+
+        return deleted
 
     @classmethod
     def clear_cache(cls) -> None:
-        """Clear all cached entries."""
+        """Clear all cached entries, including the persistent cache."""
         with cls._cache_lock:
             cls._cache.clear()
+            cls._negative_cache.clear()
             cls._cache_hits = 0
             cls._cache_misses = 0
+            cls._persistent_hits = 0
+            cls._writes_since_prune = 0
+            cls._negative_hits = 0
+            cls._coalesced = 0
+
+        if cls._persistent_cache_enabled():
+            from app.models import db
+            from app.models.crossref_cache import CrossRefCacheEntry
+
+            try:
+                with db.engine.begin() as conn:
+                    conn.execute(delete(CrossRefCacheEntry.__table__))
+            except SQLAlchemyError as e:
+                logger.warning(f"CrossRef persistent cache clear failed: {e}")
 
     @classmethod
     def remove_from_cache(cls, doi: str) -> bool:
@@ -173,24 +662,59 @@ class CrossRefService:
         Returns:
             True if removed, False if not found
         """
+        removed = False
         with cls._cache_lock:
             if doi in cls._cache:
                 del cls._cache[doi]
-                return True
-            return False
+                removed = True
+            if doi in cls._negative_cache:
+                del cls._negative_cache[doi]
+                removed = True
+
+        if cls._persistent_cache_enabled():
+            from app.models import db
+            from app.models.crossref_cache import CrossRefCacheEntry
+
+            table = CrossRefCacheEntry.__table__
+            try:
+                with db.engine.begin() as conn:
+                    result = conn.execute(delete(table).where(table.c.doi == doi))
+                    removed = removed or result.rowcount > 0
+            except SQLAlchemyError as e:
+                logger.warning(f"CrossRef persistent cache remove failed: {e}")
+
+        return removed
 
     @classmethod
     def get_cache_stats(cls) -> Dict[str, int]:
         """Get cache statistics.
 
         Returns:
-            Dictionary with cache statistics
+            Dictionary with cache statistics (size is the in-memory size)
         """
+        persistent_size = 0
+        if cls._persistent_cache_enabled():
+            from app.models import db
+            from app.models.crossref_cache import CrossRefCacheEntry
+
+            try:
+                with db.engine.connect() as conn:
+                    persistent_size = conn.execute(
+                        select(func.count()).select_from(CrossRefCacheEntry.__table__)
+                    ).scalar()
+            except SQLAlchemyError as e:
+                logger.warning(f"CrossRef persistent cache stats failed: {e}")
+
         with cls._cache_lock:
             return {
                 "size": len(cls._cache),
                 "hits": cls._cache_hits,
                 "misses": cls._cache_misses,
+                "persistent_size": persistent_size,
+                "persistent_hits": cls._persistent_hits,
+                "negative_size": len(cls._negative_cache),
+                "negative_hits": cls._negative_hits,
+                "coalesced": cls._coalesced,
             }
 
     @staticmethod
@@ -2,13 +2,43 @@
 
 Extracts Digital Object Identifiers (DOIs) from text and PDF documents.
 DOI format: 10.XXXX/SUFFIX where XXXX is a registrant code (4+ digits).
+
+PDFs are checked in order of cost: the document info dictionary, the XMP
+metadata packet and first-page link annotations are read without any
+layout analysis, and page text is only extracted when none of them has a
+DOI. Page text is scanned in a single pass per page with precompiled
+patterns; DOIs broken across lines are rejoined and every candidate is
+scored, so labelled or repeated DOIs win over bare citations.
 """
 
+import logging
 import os
 import re
-from typing import Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
 
 import pdfplumber
+from pdfminer.pdftypes import resolve1
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DOICandidate:
+    """A DOI found while scanning text.
+
+    Attributes:
+        doi: Cleaned DOI
+        confidence: Score from 0 to 1 that this is the document's own DOI
+        page: Index of the first page it was seen on
+        occurrences: Number of times it was seen
+    """
+
+    doi: str
+    confidence: float
+    page: int = 0
+    occurrences: int = 1
 
 
 class DOIService:
@@ -19,9 +49,50 @@ class DOIService:
     # Stops at uppercase letters that typically start journal names
     DOI_PATTERN = re.compile(r"10\.\d{4,9}/[^\s]+?(?=[A-Z][a-z]|$|\s)")
 
+    # DOI_PATTERN, also matching a bare prefix ("10.1093/") at a line end
+    # so a suffix wrapped onto the next line can be joined
+    DOI_SCAN_PATTERN = re.compile(
+        r"10\.\d{4,9}/(?:[^\s]+?(?=[A-Z][a-z]|$|\s)|(?=[ \t]*\r?\n))"
+    )
+
+    # Full-string DOI check used by validate_doi
+    VALID_DOI_PATTERN = re.compile(r"^10\.\d{4,9}/[^\s]+$")
+
+    # A label right before a DOI: "doi:", "DOI ", "https://doi.org/"
+    DOI_LABEL_PATTERN = re.compile(r"(?:\bdoi\s*[:=]?\s*|doi\.org/)$", re.IGNORECASE)
+
+    # Start of the next line, for DOIs broken after '.', '/', '-' or '_'
+    DOI_CONTINUATION_PATTERN = re.compile(
+        r"[ \t]*\r?\n[ \t]*([0-9a-z][^\s]*?)(?=[A-Z][a-z]|$|\s)"
+    )
+    DOI_BREAK_CHARS = "./-_"
+
+    # A continuation that looks like part of a DOI rather than prose: it
+    # contains a DOI separator or mixes letters and digits, so a plain word
+    # ("the") or number ("2020") after a line break is not joined
+    DOI_TAIL_PATTERN = re.compile(r"[./_;()-]|\d.*[a-z]|[a-z].*\d", re.IGNORECASE)
+
+    # Candidate scoring
+    BASE_CONFIDENCE = 0.5
+    LABEL_BONUS = 0.3
+    REPEAT_BONUS = 0.05
+    JOINED_PENALTY = 0.1
+    ALTERNATIVE_PENALTY = 0.3
+
     # Maximum pages to search for DOI (performance optimization)
     MAX_PAGES_TO_SEARCH = 5
 
+    # XMP properties publishers use for the article DOI, as element text
+    # (<prism:doi>10.1/x</prism:doi>) or attribute (prism:doi="10.1/x")
+    XMP_DOI_PATTERN = re.compile(
+        r"(?:prism:doi|pdfx:doi|crossmark:DOI|dc:identifier)"
+        r"\s*(?:=\s*[\"']|>)\s*([^<\"']+)"
+    )
+
+    # Link annotations are only trusted on the first page; later pages
+    # often link to cited works
+    MAX_LINK_PAGES = 1
+
     @staticmethod
     def validate_doi(doi: Optional[str]) -> bool:
         """Validate DOI format.
@@ -39,8 +110,7 @@ class DOIService:
             return False
 
         # Check basic format: 10.XXXX/suffix
-        pattern = re.compile(r"^10\.\d{4,9}/[^\s]+$")
-        return bool(pattern.match(doi))
+        return bool(DOIService.VALID_DOI_PATTERN.match(doi))
 
     @staticmethod
     def _clean_doi(doi: str) -> str:
@@ -58,6 +128,116 @@ class DOIService:
             doi = doi[:-1]
         return doi
 
+    @staticmethod
+    def _scan_text(text: str, page: int = 0) -> Iterator[DOICandidate]:
+        """Yield DOI candidates from one page of text in reading order.
+
+        A DOI that ends a line on '.', '/', '-' or '_' is joined with the
+        start of the next line when that reads as DOI text rather than a
+        word or number. The joined form is yielded first, followed
+        by lower-scored alternatives: the form without a line-end hyphen
+        (typeset hyphenation) and the form cut at the line break.
+
+        Args:
+            text: Page text
+            page: Page index recorded on each candidate
+
+        Yields:
+            DOICandidate for each valid DOI (and alternative) found
+        """
+        for match in DOIService.DOI_SCAN_PATTERN.finditer(text):
+            confidence = DOIService.BASE_CONFIDENCE
+            label = DOIService.DOI_LABEL_PATTERN.search(
+                text, max(0, match.start() - 16), match.start()
+            )
+            if label:
+                confidence += DOIService.LABEL_BONUS
+
+            raw = match.group()
+            variants = [(raw, confidence)]
+
+            if raw[-1] in DOIService.DOI_BREAK_CHARS:
+                continuation = DOIService.DOI_CONTINUATION_PATTERN.match(
+                    text, match.end()
+                )
+                # After a period only a digit plausibly continues the DOI;
+                # otherwise it is more likely the end of a sentence. A bare
+                # prefix ("10.1093/") is always joined, as it is no DOI alone
+                tail = continuation.group(1) if continuation else ""
+                if tail and (
+                    raw[-1] == "/"
+                    or (
+                        (raw[-1] != "." or tail[0].isdigit())
+                        and DOIService.DOI_TAIL_PATTERN.search(
+                            DOIService._clean_doi(tail)
+                        )
+                    )
+                ):
+                    joined = confidence - DOIService.JOINED_PENALTY
+                    alternative = confidence - DOIService.ALTERNATIVE_PENALTY
+                    variants = [(raw + tail, joined)]
+                    if raw[-1] == "-":
+                        variants.append((raw[:-1] + tail, alternative))
+                    variants.append((raw, alternative))
+
+            for candidate, score in variants:
+                doi = DOIService._clean_doi(candidate)
+                if DOIService.validate_doi(doi):
+                    yield DOICandidate(doi=doi, confidence=round(score, 2), page=page)
+
+    @staticmethod
+    def scan_dois(
+        texts: Iterable[Optional[str]], stop_at_first_page: bool = False
+    ) -> List[DOICandidate]:
+        """Collect scored DOI candidates from a stream of page texts.
+
+        Pages are consumed lazily, so with ``stop_at_first_page`` set no
+        further pages are read (or extracted, for a generator) once a page
+        yields a candidate. DOIs are compared case-insensitively; each
+        repeat raises a candidate's confidence.
+
+        Page order outweighs confidence: the article's own DOI comes before
+        the works it cites, so a labelled DOI in a later reference list
+        never outranks one found on an earlier page.
+
+        Args:
+            texts: Page texts in page order (None for empty pages)
+            stop_at_first_page: Stop after the first page with a candidate
+
+        Returns:
+            Candidates by first page seen, most confident first within a
+            page (ties keep reading order)
+        """
+        candidates: Dict[str, DOICandidate] = {}
+
+        for page, text in enumerate(texts):
+            if not text:
+                continue
+
+            for candidate in DOIService._scan_text(text, page):
+                key = candidate.doi.lower()
+                existing = candidates.get(key)
+                if existing is None:
+                    candidates[key] = candidate
+                    continue
+                existing.occurrences += 1
+                existing.confidence = round(
+                    min(
+                        1.0,
+                        max(existing.confidence, candidate.confidence)
+                        + DOIService.REPEAT_BONUS,
+                    ),
+                    2,
+                )
+
+            if stop_at_first_page and candidates:
+                break
+
+        return sorted(
+            candidates.values(),
+            key=lambda candidate: (candidate.page, -candidate.confidence),
+        )
+
     @staticmethod
     def extract_doi_from_text(text: Optional[str]) -> Optional[str]:
         """Extract first valid DOI from text.
@@ -76,20 +256,102 @@ class DOIService:
         if not text:
             return None
 
-        # Search for DOI pattern
-        match = DOIService.DOI_PATTERN.search(text)
-        if match:
-            doi = DOIService._clean_doi(match.group())
-            if DOIService.validate_doi(doi):
+        candidate = next(DOIService._scan_text(text), None)
+        return candidate.doi if candidate else None
+
+    @staticmethod
+    def _doi_from_info(pdf: pdfplumber.PDF) -> Optional[str]:
+        """Find a DOI in the document info dictionary.
+
+        Keys naming a DOI (e.g. /doi, /WPS-ARTICLEDOI) are checked before
+        free-text fields such as /Subject and /Keywords.
+
+        Args:
+            pdf: Open PDF
+
+        Returns:
+            DOI string or None
+        """
+        info: Dict[str, Any] = pdf.metadata or {}
+        keys = sorted(info, key=lambda key: "doi" not in str(key).lower())
+
+        for key in keys:
+            value = info[key]
+            if isinstance(value, str):
+                doi = DOIService.extract_doi_from_text(value)
+                if doi:
+                    return doi
+        return None
+
+    @staticmethod
+    def _doi_from_xmp(pdf: pdfplumber.PDF) -> Optional[str]:
+        """Find a DOI in the XMP metadata packet.
+
+        Args:
+            pdf: Open PDF
+
+        Returns:
+            DOI string or None
+        """
+        metadata = resolve1(pdf.doc.catalog.get("Metadata"))
+        if metadata is None or not hasattr(metadata, "get_data"):
+            return None
+
+        xmp = metadata.get_data().decode("utf-8", errors="ignore")
+        for match in DOIService.XMP_DOI_PATTERN.finditer(xmp):
+            doi = DOIService.extract_doi_from_text(match.group(1).strip())
+            if doi:
+                return doi
+        return None
+
+    @staticmethod
+    def _doi_from_uri(uri: str) -> Optional[str]:
+        """Extract a DOI from a doi.org or ?doi= link.
+
+        Args:
+            uri: Link target
+
+        Returns:
+            DOI string or None
+        """
+        parsed = urlparse(uri)
+        candidates = parse_qs(parsed.query).get("doi", [])
+        if parsed.netloc.lower().endswith("doi.org"):
+            candidates.append(unquote(parsed.path.lstrip("/")))
+
+        for candidate in candidates:
+            doi = DOIService.extract_doi_from_text(candidate)
+            if doi:
                 return doi
+        return None
+
+    @staticmethod
+    def _doi_from_links(pdf: pdfplumber.PDF) -> Optional[str]:
+        """Find a DOI in link annotations on the first page.
 
+        Args:
+            pdf: Open PDF
+
+        Returns:
+            DOI string or None
+        """
+        for page in pdf.pages[: DOIService.MAX_LINK_PAGES]:
+            for annot in page.annots:
+                uri = annot.get("uri")
+                if isinstance(uri, bytes):
+                    uri = uri.decode("latin-1")
+                if uri:
+                    doi = DOIService._doi_from_uri(uri)
+                    if doi:
+                        return doi
         return None
 
     @staticmethod
     def extract_doi_from_pdf(file_path: str) -> Tuple[Optional[str], Optional[str]]:
         """Extract DOI from PDF file.
 
-        Searches the first few pages of the PDF for a DOI.
+        Checks the info dictionary, XMP metadata and first-page links
+        before falling back to searching the text of the first few pages.
         Returns tuple following the (result, error) pattern.
 
         Args:
@@ -103,17 +365,32 @@ class DOIService:
 
         try:
             with pdfplumber.open(file_path) as pdf:
-                # Search first N pages for DOI
-                pages_to_search = min(len(pdf.pages), DOIService.MAX_PAGES_TO_SEARCH)
+                # Cheap sources first: no layout analysis needed
+                for source, locate in (
+                    ("info", DOIService._doi_from_info),
+                    ("xmp", DOIService._doi_from_xmp),
+                    ("links", DOIService._doi_from_links),
+                ):
+                    try:
+                        doi = locate(pdf)
+                    except Exception as e:
+                        # Malformed metadata only disables this source
+                        logger.debug(f"{file_path}: DOI {source} lookup failed - {e}")
+                        continue
+                    if doi:
+                        logger.debug(f"{file_path}: DOI found in {source}")
+                        return doi, None
 
-                for page_num in range(pages_to_search):
-                    page = pdf.pages[page_num]
-                    text = page.extract_text()
+                # Search first N pages for DOI, extracting each page only
+                # until one of them yields a candidate
+                texts = (
+                    page.extract_text()
+                    for page in pdf.pages[: DOIService.MAX_PAGES_TO_SEARCH]
+                )
+                candidates = DOIService.scan_dois(texts, stop_at_first_page=True)
 
-                    if text:
-                        doi = DOIService.extract_doi_from_text(text)
-                        if doi:
-                            return doi, None
+            if candidates:
+                return candidates[0].doi, None
 
             # No DOI found in searched pages
             return None, None
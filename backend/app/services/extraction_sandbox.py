@@ -0,0 +1,367 @@
+"""Supervised subprocess sandbox for PDF text extraction.
+
+Malformed or adversarially complex PDFs can make pdfplumber spin for
+minutes on a single page. The sandbox runs extraction in long-lived child
+processes with a memory limit, each serving many documents, and
+supervises them with per-page and per-document time limits. A page that
+exceeds its limit is recorded as empty with a flag, its child is killed
+and extraction resumes in a fresh child from the next page, so one
+pathological page never fails or stalls the whole document. A page that
+raises is likewise recorded empty and flagged, without a respawn.
+"""
+
+import logging
+import multiprocessing
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import pdfplumber
+
+from app.services.extraction_engines import balanced_page_text
+
+logger = logging.getLogger(__name__)
+
+# Page flags recorded on SearchPage.extraction_flag
+FLAG_TIMEOUT = "timeout"
+FLAG_MEMORY_LIMIT = "memory_limit"
+FLAG_CRASHED = "crashed"
+FLAG_FAILED = "failed"
+
+# Documents a child serves before it is replaced, bounding slow leaks
+DEFAULT_MAX_DOCUMENTS_PER_CHILD = 100
+
+
+@dataclass
+class PageText:
+    """Extracted text of a single page.
+
+    Attributes:
+        page_number: 1-based page number
+        content: Extracted text (empty when flagged)
+        flag: Why the page has no text (timeout, memory_limit, crashed,
+            failed), or None if extraction succeeded
+    """
+
+    page_number: int
+    content: str
+    flag: Optional[str] = None
+
+
+def _apply_memory_limit(memory_limit_bytes: Optional[int]) -> None:
+    """Cap the child's address space where the platform supports it."""
+    if not memory_limit_bytes:
+        return
+    try:
+        import resource
+
+        resource.setrlimit(
+            resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes)
+        )
+    except (ImportError, ValueError, OSError):
+        # Not supported on this platform; time limits still apply
+        pass
+
+
+def _extract_document(
+    file_path: str, start_page: int, page_extractor: Callable, conn
+) -> None:
+    """Stream the page texts of one PDF back over ``conn``.
+
+    Messages sent:
+        ("pages", total) once the PDF is open
+        ("page", page_number, text, flag) for each page from start_page
+        ("error", message) if the PDF cannot be processed
+        ("done",) when all pages are sent
+    """
+    try:
+        with pdfplumber.open(file_path) as pdf:
+            conn.send(("pages", len(pdf.pages)))
+
+            for page_number in range(start_page, len(pdf.pages) + 1):
+                page = pdf.pages[page_number - 1]
+                flag = None
+                try:
+                    text = page_extractor(page)
+                except MemoryError:
+                    text, flag = "", FLAG_MEMORY_LIMIT
+                except Exception as e:
+                    # One unparseable page must not fail the document
+                    logger.warning(f"{file_path}: page {page_number} failed - {e}")
+                    text, flag = "", FLAG_FAILED
+                finally:
+                    page.close()
+                conn.send(("page", page_number, text, flag))
+
+        conn.send(("done",))
+
+    except Exception as e:
+        conn.send(("error", str(e)))
+
+
+def _serve_worker(
+    memory_limit_bytes: Optional[int], page_extractor: Callable, conn
+) -> None:
+    """Child process entry point: serve extraction requests until stopped.
+
+    Each request is a ``(file_path, start_page)`` tuple answered as in
+    _extract_document; None (or a closed pipe) stops the child.
+    """
+    _apply_memory_limit(memory_limit_bytes)
+
+    try:
+        while True:
+            try:
+                request = conn.recv()
+            except EOFError:
+                return
+            if request is None:
+                return
+            file_path, start_page = request
+            _extract_document(file_path, start_page, page_extractor, conn)
+    finally:
+        conn.close()
+
+
+@dataclass
+class _Child:
+    """A sandbox child process and the parent end of its pipe."""
+
+    process: multiprocessing.process.BaseProcess
+    conn: Any
+    documents: int = 0
+
+
+class ExtractionSandbox:
+    """Run PDF extraction in supervised, reusable child processes.
+
+    Idle children are kept for the next document, so the cost of starting
+    a process (and importing the app in it) is paid once per child rather
+    than once per document. A child is only replaced after a timeout, a
+    crash or memory-limit kill, or max_documents_per_child documents.
+
+    Attributes:
+        page_timeout: Seconds allowed per page before it is flagged
+        document_timeout: Seconds allowed for the whole document; pages
+            not reached by then are flagged as timed out
+        memory_limit_mb: Address space limit for the child (0 disables)
+    """
+
+    def __init__(
+        self,
+        page_timeout: float = 30,
+        document_timeout: float = 600,
+        memory_limit_mb: int = 1024,
+        page_extractor: Callable = balanced_page_text,
+        max_documents_per_child: int = DEFAULT_MAX_DOCUMENTS_PER_CHILD,
+    ):
+        """Initialize the sandbox.
+
+        Args:
+            page_timeout: Per-page time limit in seconds
+            document_timeout: Per-document time limit in seconds
+            memory_limit_mb: Child memory limit in megabytes (0 disables)
+            page_extractor: Picklable callable turning a pdfplumber page
+                into text
+            max_documents_per_child: Documents a child serves before it
+                is replaced
+        """
+        self.page_timeout = page_timeout
+        self.document_timeout = document_timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.page_extractor = page_extractor
+        self.max_documents_per_child = max_documents_per_child
+        self._idle: List[_Child] = []
+        self._lock = threading.Lock()
+
+        start_methods = multiprocessing.get_all_start_methods()
+        # forkserver avoids forking a process that holds scheduler threads
+        # and DB connections, while staying much cheaper than spawn
+        self._context = multiprocessing.get_context(
+            "forkserver" if "forkserver" in start_methods else "spawn"
+        )
+
+    def extract(self, file_path: str) -> List[PageText]:
+        """Extract the text of every page of a PDF.
+
+        Args:
+            file_path: Path to the PDF file
+
+        Returns:
+            PageText for every page, in page order
+
+        Raises:
+            TimeoutError: If the PDF cannot even be opened in time
+            RuntimeError: If the PDF cannot be opened or parsed
+        """
+        deadline = time.monotonic() + self.document_timeout
+        pages: Dict[int, PageText] = {}
+        total: Optional[int] = None
+        next_page = 1
+
+        while total is None or next_page <= total:
+            if time.monotonic() >= deadline:
+                break
+
+            total, next_page = self._run_child(
+                file_path, next_page, deadline, pages, total
+            )
+
+        if total is None:
+            raise TimeoutError(f"Timed out opening PDF: {file_path}")
+
+        timed_out = 0
+        for page_number in range(1, total + 1):
+            if page_number not in pages:
+                pages[page_number] = PageText(page_number, "", FLAG_TIMEOUT)
+            if pages[page_number].flag:
+                timed_out += 1
+
+        if timed_out:
+            logger.warning(
+                f"{file_path}: {timed_out}/{total} pages recorded empty "
+                f"(time or memory limit exceeded, or page failed)"
+            )
+
+        return [pages[page_number] for page_number in range(1, total + 1)]
+
+    def close(self) -> None:
+        """Stop all idle children."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for child in idle:
+            self._stop(child)
+
+    def _spawn(self) -> _Child:
+        """Start a new child process."""
+        parent_conn, child_conn = self._context.Pipe()
+        memory_limit = self.memory_limit_mb * 1024 * 1024 or None
+        process = self._context.Process(
+            target=_serve_worker,
+            args=(memory_limit, self.page_extractor, child_conn),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return _Child(process=process, conn=parent_conn)
+
+    def _checkout(self) -> _Child:
+        """Take an idle live child, or start one if there is none."""
+        with self._lock:
+            while self._idle:
+                child = self._idle.pop()
+                if child.process.is_alive():
+                    return child
+                self._kill(child)
+        return self._spawn()
+
+    def _checkin(self, child: _Child) -> None:
+        """Return a child that finished a request to the idle pool."""
+        child.documents += 1
+        if child.documents >= self.max_documents_per_child:
+            self._stop(child)
+            return
+        with self._lock:
+            self._idle.append(child)
+
+    @staticmethod
+    def _stop(child: _Child) -> None:
+        """Ask an idle child to exit, killing it if it does not."""
+        try:
+            child.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        child.process.join(timeout=1)
+        ExtractionSandbox._kill(child)
+
+    @staticmethod
+    def _kill(child: _Child) -> None:
+        """Kill a child (e.g. one stuck on a page) and release its pipe."""
+        child.conn.close()
+        if child.process.is_alive():
+            child.process.kill()
+        child.process.join(timeout=5)
+
+    def _request(self, file_path: str, start_page: int) -> _Child:
+        """Send an extraction request to a child, replacing a dead one."""
+        child = self._checkout()
+        try:
+            child.conn.send((file_path, start_page))
+        except (OSError, ValueError):
+            # The idle child died since it was checked
+            self._kill(child)
+            child = self._spawn()
+            child.conn.send((file_path, start_page))
+        return child
+
+    def _run_child(
+        self,
+        file_path: str,
+        start_page: int,
+        deadline: float,
+        pages: Dict[int, PageText],
+        total: Optional[int],
+    ):
+        """Extract from ``start_page`` in one child until it finishes or stalls.
+
+        A child that finishes (or reports an unreadable PDF) goes back to
+        the idle pool; one that stalls or dies is killed.
+
+        Returns:
+            Tuple of (total page count or None, next page to extract)
+        """
+        child = self._request(file_path, start_page)
+        conn = child.conn
+        reusable = False
+        next_page = start_page
+
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return total, next_page
+
+                if not conn.poll(min(self.page_timeout, remaining)):
+                    if total is None:
+                        raise TimeoutError(f"Timed out opening PDF: {file_path}")
+                    if time.monotonic() < deadline:
+                        logger.warning(
+                            f"{file_path}: page {next_page} exceeded "
+                            f"{self.page_timeout}s, skipping"
+                        )
+                        pages[next_page] = PageText(next_page, "", FLAG_TIMEOUT)
+                        next_page += 1
+                    return total, next_page
+
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    # Child died without reporting (e.g. killed by the
+                    # memory limit or a crash inside the PDF parser)
+                    if total is None:
+                        raise RuntimeError(
+                            f"Extraction process died opening PDF: {file_path}"
+                        )
+                    pages[next_page] = PageText(next_page, "", FLAG_CRASHED)
+                    return total, next_page + 1
+
+                kind = message[0]
+                if kind == "pages":
+                    total = message[1]
+                elif kind == "page":
+                    _, page_number, text, flag = message
+                    pages[page_number] = PageText(page_number, text, flag)
+                    next_page = page_number + 1
+                elif kind == "error":
+                    reusable = True
+                    raise RuntimeError(message[1])
+                elif kind == "done":
+                    reusable = True
+                    return total, (total or 0) + 1
+
+        finally:
+            if reusable:
+                self._checkin(child)
+            else:
+                self._kill(child)
@@ -1,30 +1,48 @@
 """PDF text extraction service."""
 
-import json
 import logging
 import os
 import re
+import threading
 import unicodedata
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pdfplumber
+from flask import current_app
+from sqlalchemy import func, select, true, update
+from sqlalchemy.orm import joinedload
 
 from app.models import db
 from app.models.document import SearchDocument
 from app.models.page import SearchPage
 from app.models.extraction_queue import ExtractionQueue
-from app.services.crossref_service import CrossRefService
-from app.services.doi_service import DOIService
+from app.services.extraction_engines import EXTRACTION_ENGINES, resolve_mode
+from app.services.extraction_sandbox import ExtractionSandbox, PageText
 
 logger = logging.getLogger(__name__)
 
+# Default number of queue items claimed per worker tick
+DEFAULT_BATCH_SIZE = 5
+
+# Guards creation of the per-app extraction sandboxes
+_sandboxes_lock = threading.Lock()
+
 
 class ExtractionService:
     """Service class for PDF text extraction operations."""
 
     MAX_RETRIES = 3
 
+    # Size-aware priority tiers: (upper bound, priority), smallest first.
+    # Documents larger than every bound (or of unknown size) get priority 0.
+    PRIORITY_PAGE_TIERS = [(10, 30), (50, 20), (200, 10)]
+    PRIORITY_SIZE_TIERS = [
+        (1 * 1024 * 1024, 30),
+        (5 * 1024 * 1024, 20),
+        (20 * 1024 * 1024, 10),
+    ]
+
     @staticmethod
     def normalize_text(text: Optional[str]) -> str:
         """Normalize text for consistent searching.
@@ -56,16 +74,59 @@ class ExtractionService:
         return normalized
 
     @staticmethod
-    def add_to_queue(document_id: int, priority: int = 0) -> ExtractionQueue:
+    def compute_priority(
+        file_size_bytes: Optional[int], page_count: Optional[int] = None
+    ) -> int:
+        """Derive a queue priority from document size.
+
+        Small documents get a higher priority so they become searchable
+        quickly even while large bulk imports are queued. The page count
+        is preferred when known (e.g. on re-extraction), otherwise the
+        file size is used.
+
+        Args:
+            file_size_bytes: Size of the PDF file in bytes
+            page_count: Number of pages, if already known
+
+        Returns:
+            Priority level (higher = processed first)
+        """
+        if page_count:
+            value, tiers = page_count, ExtractionService.PRIORITY_PAGE_TIERS
+        elif file_size_bytes:
+            value, tiers = file_size_bytes, ExtractionService.PRIORITY_SIZE_TIERS
+        else:
+            return 0
+
+        for upper_bound, priority in tiers:
+            if value <= upper_bound:
+                return priority
+        return 0
+
+    @staticmethod
+    def add_to_queue(
+        document_id: int, priority: Optional[int] = None
+    ) -> ExtractionQueue:
         """Add a document to the extraction queue.
 
         Args:
             document_id: ID of the document to process
-            priority: Priority level (higher = processed first)
+            priority: Priority level (higher = processed first). Derived
+                from the document size when omitted.
 
         Returns:
             Created ExtractionQueue item
         """
+        if priority is None:
+            document = db.session.get(SearchDocument, document_id)
+            priority = (
+                ExtractionService.compute_priority(
+                    document.file_size_bytes, document.page_count
+                )
+                if document
+                else 0
+            )
+
         queue_item = ExtractionQueue(document_id=document_id, priority=priority)
         db.session.add(queue_item)
         db.session.commit()
@@ -89,276 +150,425 @@ class ExtractionService:
         )
 
     @staticmethod
-    def extract_text(document_id: int) -> int:
-        """Extract text from a PDF document.
-
-        Uses pdfplumber to extract text from each page and stores
-        it in SearchPage records.
+    def claim_pending_batch(limit: int) -> List[ExtractionQueue]:
+        """Atomically claim up to ``limit`` pending items for this worker.
+
+        Candidates are ordered round-robin across document owners (each
+        owner's best item first, then their second best, ...) and by
+        priority and age within a round, so one user's bulk import cannot
+        starve everyone else. Candidate rows are selected with
+        ``FOR UPDATE SKIP LOCKED`` so concurrent workers on PostgreSQL skip
+        rows another worker is claiming. The status flip is a single guarded UPDATE
+        (``status='pending'``) with RETURNING, which keeps the claim safe on
+        backends without row locks such as SQLite: rows lost to another
+        worker are simply not returned. The matching documents are marked
+        as processing in the same transaction.
+
+        Only an owner's first ``limit`` items can be claimed in one batch,
+        so the round-robin ranking is computed over at most that many
+        items per owner (see _owner_round_subquery).
 
         Args:
-            document_id: ID of the document to extract
+            limit: Maximum number of items to claim
 
         Returns:
-            Number of pages extracted
-
-        Raises:
-            FileNotFoundError: If the PDF file doesn't exist
-            Exception: If the PDF cannot be parsed
+            Claimed ExtractionQueue items (status 'processing'), in
+            priority order
         """
-        document = db.session.get(SearchDocument, document_id)
-        if not document:
-            raise ValueError(f"Document {document_id} not found")
+        owner_round = ExtractionService._owner_round_subquery(limit)
+        candidate_ids = [
+            row.id
+            for row in db.session.query(ExtractionQueue.id)
+            .join(owner_round, owner_round.c.id == ExtractionQueue.id)
+            .order_by(
+                owner_round.c.owner_round.asc(),
+                ExtractionQueue.priority.desc(),
+                ExtractionQueue.created_at.asc(),
+            )
+            .limit(limit)
+            .with_for_update(of=ExtractionQueue, skip_locked=True)
+            .all()
+        ]
+        if not candidate_ids:
+            db.session.commit()
+            return []
+
+        claimed_ids = set(
+            db.session.execute(
+                update(ExtractionQueue)
+                .where(
+                    ExtractionQueue.id.in_(candidate_ids),
+                    ExtractionQueue.status == "pending",
+                )
+                .values(status="processing", started_at=datetime.now(timezone.utc))
+                .returning(ExtractionQueue.id)
+                .execution_options(synchronize_session=False)
+            ).scalars()
+        )
+        if claimed_ids:
+            db.session.execute(
+                update(SearchDocument)
+                .where(
+                    SearchDocument.id.in_(
+                        select(ExtractionQueue.document_id).where(
+                            ExtractionQueue.id.in_(claimed_ids)
+                        )
+                    )
+                )
+                .values(extraction_status="processing")
+                .execution_options(synchronize_session=False)
+            )
+        db.session.commit()
 
-        file_path = document.file_path
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
+        if not claimed_ids:
+            return []
 
-        # Delete any existing pages for this document
-        SearchPage.query.filter_by(document_id=document_id).delete()
-        db.session.commit()
+        items = (
+            ExtractionQueue.query.options(joinedload(ExtractionQueue.document))
+            .filter(ExtractionQueue.id.in_(claimed_ids))
+            .all()
+        )
+        order = {item_id: index for index, item_id in enumerate(candidate_ids)}
+        return sorted(items, key=lambda item: order[item.id])
 
-        page_count = 0
+    @staticmethod
+    def _owner_round_subquery(limit: int):
+        """Rank pending items by round-robin position within their owner.
 
-        try:
-            with pdfplumber.open(file_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    content = page.extract_text() or ""
-                    content_normalized = ExtractionService.normalize_text(content)
-
-                    search_page = SearchPage(
-                        document_id=document_id,
-                        page_number=page_num,
-                        content=content,
-                        content_normalized=content_normalized,
-                    )
-                    db.session.add(search_page)
-                    page_count += 1
+        On PostgreSQL a LATERAL join fetches each owner's best ``limit``
+        pending items through the queue's status/priority order, so the
+        window input stays bounded by owners x limit however long the
+        queue is. Other backends (SQLite in development and tests) rank
+        every pending item.
 
-                db.session.commit()
+        Args:
+            limit: Maximum number of items per owner worth ranking
 
-        except Exception:
-            db.session.rollback()
-            raise
+        Returns:
+            Subquery with ``id`` and ``owner_round`` columns
+        """
+        pending = ExtractionQueue.status == "pending"
+        joined = ExtractionQueue.document_id == SearchDocument.id
+        best_first = (ExtractionQueue.priority.desc(), ExtractionQueue.created_at.asc())
+
+        if db.session.get_bind().dialect.name == "postgresql":
+            owners = (
+                select(SearchDocument.owner_id)
+                .join(ExtractionQueue, joined)
+                .where(pending)
+                .distinct()
+                .subquery("owners")
+            )
+            per_owner = (
+                select(
+                    ExtractionQueue.id,
+                    ExtractionQueue.priority,
+                    ExtractionQueue.created_at,
+                )
+                .join(SearchDocument, joined)
+                .where(pending, SearchDocument.owner_id == owners.c.owner_id)
+                .order_by(*best_first)
+                .limit(limit)
+                .lateral("per_owner")
+            )
+            candidates = (
+                select(
+                    per_owner.c.id,
+                    owners.c.owner_id,
+                    per_owner.c.priority,
+                    per_owner.c.created_at,
+                )
+                .select_from(owners)
+                .join(per_owner, true())
+                .subquery("candidates")
+            )
+        else:
+            candidates = (
+                select(
+                    ExtractionQueue.id,
+                    SearchDocument.owner_id,
+                    ExtractionQueue.priority,
+                    ExtractionQueue.created_at,
+                )
+                .join(SearchDocument, joined)
+                .where(pending)
+                .subquery("candidates")
+            )
 
-        return page_count
+        return select(
+            candidates.c.id,
+            func.row_number()
+            .over(
+                partition_by=candidates.c.owner_id,
+                order_by=(
+                    candidates.c.priority.desc(),
+                    candidates.c.created_at.asc(),
+                ),
+            )
+            .label("owner_round"),
+        ).subquery("owner_round")
+
+    @staticmethod
+    def claim_next_pending() -> Optional[ExtractionQueue]:
+        """Atomically claim the next pending item for this worker.
+
+        Returns:
+            Claimed ExtractionQueue item (status 'processing') or None
+        """
+        claimed = ExtractionService.claim_pending_batch(1)
+        return claimed[0] if claimed else None
 
     @staticmethod
-    def _format_author_name(given: str, family: str) -> str:
-        """Format author name as 'Family, G.' format.
+    def get_extraction_mode(mode: Optional[str] = None) -> str:
+        """Resolve the extraction mode to use.
 
         Args:
-            given: Given name(s)
-            family: Family name
+            mode: Explicit mode (fast, balanced, precise); defaults to the
+                EXTRACTION_MODE config value
 
         Returns:
-            Formatted author name
+            Valid extraction mode name
         """
-        if given and family:
-            # Get first initial from given name
-            initial = given[0].upper() + "."
-            return f"{family}, {initial}"
-        elif family:
-            return family
-        elif given:
-            return given
-        return ""
+        return resolve_mode(mode or current_app.config.get("EXTRACTION_MODE", "balanced"))
 
     @staticmethod
-    def _process_metadata(document: SearchDocument, metadata: Dict[str, Any]) -> bool:
-        """Process and save CrossRef metadata to document.
+    def _get_sandbox(mode: str) -> Optional[ExtractionSandbox]:
+        """Get the app's extraction sandbox for a mode.
 
-        Only saves metadata if title exists (per REQ-UNW-002).
+        Sandboxes are kept per application and settings, so their child
+        processes serve many documents instead of one each.
 
         Args:
-            document: Document to update
-            metadata: Metadata dictionary from CrossRef
+            mode: Extraction mode whose engine the sandbox runs
 
         Returns:
-            True if metadata was saved, False otherwise
+            ExtractionSandbox, or None when sandboxing is disabled
         """
-        # REQ-UNW-002: Do NOT save incomplete metadata (must have title)
-        title = metadata.get("title")
-        if not title:
-            logger.warning(
-                f"Document {document.id}: Skipping metadata - no title found"
+        config = current_app.config
+        if not config.get("EXTRACTION_SANDBOX_ENABLED", True):
+            return None
+
+        settings = (
+            mode,
+            config.get("EXTRACTION_PAGE_TIMEOUT", 30),
+            config.get("EXTRACTION_DOCUMENT_TIMEOUT", 600),
+            config.get("EXTRACTION_MEMORY_LIMIT_MB", 1024),
+        )
+        with _sandboxes_lock:
+            sandboxes = current_app.extensions.setdefault(
+                "extraction_sandboxes", {}
             )
-            return False
-
-        # Process authors
-        authors = metadata.get("authors", [])
-        if authors:
-            # Parse first author - CrossRef returns "Given Family" format
-            first_author_full = authors[0]
-            parts = first_author_full.rsplit(" ", 1)
-            if len(parts) == 2:
-                given, family = parts
-                document.first_author = ExtractionService._format_author_name(
-                    given, family
+            sandbox = sandboxes.get(settings)
+            if sandbox is None:
+                sandbox = ExtractionSandbox(
+                    page_timeout=settings[1],
+                    document_timeout=settings[2],
+                    memory_limit_mb=settings[3],
+                    page_extractor=EXTRACTION_ENGINES[mode],
                 )
-            else:
-                document.first_author = first_author_full
-
-            # Process co-authors (remaining authors)
-            if len(authors) > 1:
-                co_authors_list = []
-                for author_full in authors[1:]:
-                    parts = author_full.rsplit(" ", 1)
-                    if len(parts) == 2:
-                        given, family = parts
-                        co_authors_list.append(
-                            ExtractionService._format_author_name(given, family)
-                        )
-                    else:
-                        co_authors_list.append(author_full)
-                document.co_authors = json.dumps(co_authors_list)
-
-        # Set other metadata fields
-        document.journal_name = metadata.get("journal")
-        document.publication_year = metadata.get("year")
-        document.publisher = metadata.get("publisher")
-
-        logger.info(
-            f"Document {document.id}: Metadata saved - "
-            f"first_author={document.first_author}, "
-            f"journal={document.journal_name}, "
-            f"year={document.publication_year}"
-        )
-
-        return True
+                sandboxes[settings] = sandbox
+        return sandbox
 
     @staticmethod
-    def _extract_and_fetch_metadata(document: SearchDocument) -> None:
-        """Extract DOI and fetch CrossRef metadata for a document.
+    def _read_pages(file_path: str, mode: str = "balanced") -> List[PageText]:
+        """Read the text of every page of a PDF without touching the database.
 
-        This method implements graceful degradation (REQ-UNW-003):
-        - If DOI not found: metadata_status = 'completed' (no metadata to fetch)
-        - If CrossRef API fails: metadata_status = 'failed', but extraction succeeds
-        - Never fails the entire upload due to metadata issues
+        Runs in the supervised extraction sandbox unless it is disabled,
+        in which case pdfplumber is called in-process.
 
         Args:
-            document: Document to process for metadata
+            file_path: Path to the PDF file
+            mode: Extraction mode (fast, balanced, precise)
+
+        Returns:
+            PageText for every page, in page order
+
+        Raises:
+            FileNotFoundError: If the PDF file doesn't exist
+            Exception: If the PDF cannot be parsed
         """
-        # TASK-006: Extract DOI from PDF
-        doi, doi_error = DOIService.extract_doi_from_pdf(document.file_path)
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        sandbox = ExtractionService._get_sandbox(mode)
+        if sandbox:
+            return sandbox.extract(file_path)
+
+        page_extractor = EXTRACTION_ENGINES[mode]
+        with pdfplumber.open(file_path) as pdf:
+            return [
+                PageText(page_num, page_extractor(page))
+                for page_num, page in enumerate(pdf.pages, start=1)
+            ]
+
+    @staticmethod
+    def _build_pages(document_id: int, pages: List[PageText]) -> List[SearchPage]:
+        """Build SearchPage records for extracted pages.
+
+        Args:
+            document_id: ID of the owning document
+            pages: Extracted pages in page order
 
-        if doi_error:
-            logger.warning(
-                f"Document {document.id}: DOI extraction error - {doi_error}"
+        Returns:
+            Unsaved SearchPage records
+        """
+        return [
+            SearchPage(
+                document_id=document_id,
+                page_number=page.page_number,
+                content=page.content,
+                content_normalized=ExtractionService.normalize_text(page.content),
+                extraction_flag=page.flag,
             )
+            for page in pages
+        ]
 
-        if not doi:
-            # No DOI found - mark as completed (nothing to fetch)
-            document.metadata_status = "completed"
-            logger.info(f"Document {document.id}: No DOI found in PDF")
-            return
+    @staticmethod
+    def extract_text(document_id: int, mode: Optional[str] = None) -> int:
+        """Extract text from a PDF document.
 
-        # Store DOI information
-        document.doi = doi
-        document.doi_url = f"https://doi.org/{doi}"
-        document.metadata_status = "processing"
-        db.session.commit()
+        Uses pdfplumber to extract text from each page and stores
+        it in SearchPage records.
 
-        logger.info(f"Document {document.id}: DOI extracted - {doi}")
+        Args:
+            document_id: ID of the document to extract
+            mode: Extraction mode (defaults to EXTRACTION_MODE config)
 
-        # TASK-007: Fetch CrossRef metadata
-        metadata, api_error = CrossRefService.fetch_metadata(doi)
+        Returns:
+            Number of pages extracted
 
-        if api_error:
-            # REQ-UNW-003: Continue operation even if CrossRef API fails
-            document.metadata_status = "failed"
-            logger.warning(f"Document {document.id}: CrossRef API error - {api_error}")
-            return
+        Raises:
+            FileNotFoundError: If the PDF file doesn't exist
+            Exception: If the PDF cannot be parsed
+        """
+        document = db.session.get(SearchDocument, document_id)
+        if not document:
+            raise ValueError(f"Document {document_id} not found")
 
-        if not metadata:
-            document.metadata_status = "failed"
-            logger.warning(
-                f"Document {document.id}: No metadata returned from CrossRef"
-            )
-            return
+        mode = ExtractionService.get_extraction_mode(mode)
+        pages = ExtractionService._read_pages(document.file_path, mode)
 
-        # Process and save metadata
-        saved = ExtractionService._process_metadata(document, metadata)
+        try:
+            # Replace any existing pages for this document
+            SearchPage.query.filter_by(document_id=document_id).delete()
+            db.session.add_all(ExtractionService._build_pages(document_id, pages))
+            document.extraction_mode = mode
+            db.session.commit()
 
-        if saved:
-            document.metadata_status = "completed"
-            document.metadata_fetched_at = datetime.now(timezone.utc)
-        else:
-            # REQ-UNW-002: Incomplete metadata (no title)
-            document.metadata_status = "failed"
+        except Exception:
+            db.session.rollback()
+            raise
+
+        return len(pages)
 
     @staticmethod
-    def process_next() -> Tuple[bool, Optional[str]]:
-        """Process the next item in the extraction queue.
+    def process_batch(
+        batch_size: int = DEFAULT_BATCH_SIZE, mode: Optional[str] = None
+    ) -> Tuple[int, List[str]]:
+        """Claim and process a batch of extraction queue items.
+
+        Claims up to ``batch_size`` items in one statement, extracts text
+        for each of them, then writes pages and completion/retry statuses
+        for the whole batch in a single transaction. Completed documents
+        are searchable immediately; DOI extraction and CrossRef metadata
+        are left to the metadata worker (see MetadataService). Handles
+        retries up to MAX_RETRIES.
 
-        Retrieves the next pending item, extracts text from its document,
-        extracts DOI and fetches CrossRef metadata, and updates statuses
-        accordingly. Handles retries up to MAX_RETRIES.
+        Args:
+            batch_size: Maximum number of items to claim
+            mode: Extraction mode (defaults to EXTRACTION_MODE config)
 
         Returns:
-            Tuple of (success, error_message)
+            Tuple of (number of items claimed, list of error messages)
         """
-        queue_item = ExtractionService.get_next_pending()
-        if not queue_item:
-            return True, None
+        queue_items = ExtractionService.claim_pending_batch(batch_size)
+        if not queue_items:
+            return 0, []
 
-        document = queue_item.document
-        if not document:
-            queue_item.status = "failed"
-            queue_item.error_message = "Document not found"
-            db.session.commit()
-            return False, "Document not found"
+        mode = ExtractionService.get_extraction_mode(mode)
 
-        # Mark as processing
-        queue_item.status = "processing"
-        queue_item.started_at = datetime.now(timezone.utc)
-        document.extraction_status = "processing"
-        db.session.commit()
+        extracted: Dict[int, List[PageText]] = {}
+        failures: Dict[int, str] = {}
+
+        for queue_item in queue_items:
+            try:
+                extracted[queue_item.id] = ExtractionService._read_pages(
+                    queue_item.document.file_path, mode
+                )
+            except Exception as e:
+                failures[queue_item.id] = str(e)
+
+        now = datetime.now(timezone.utc)
+        completed_documents: List[SearchDocument] = []
 
         try:
-            page_count = ExtractionService.extract_text(document.id)
-
-            # Success - update extraction status
-            queue_item.status = "completed"
-            queue_item.completed_at = datetime.now(timezone.utc)
-            document.extraction_status = "completed"
-            document.page_count = page_count
-            document.extraction_completed_at = datetime.now(timezone.utc)
+            completed_ids = [
+                item.document_id for item in queue_items if item.id in extracted
+            ]
+            if completed_ids:
+                SearchPage.query.filter(
+                    SearchPage.document_id.in_(completed_ids)
+                ).delete(synchronize_session=False)
+
+            for queue_item in queue_items:
+                document = queue_item.document
+
+                if queue_item.id in extracted:
+                    pages = extracted[queue_item.id]
+                    db.session.add_all(
+                        ExtractionService._build_pages(document.id, pages)
+                    )
+                    queue_item.status = "completed"
+                    queue_item.completed_at = now
+                    document.extraction_status = "completed"
+                    document.page_count = len(pages)
+                    document.extraction_mode = mode
+                    document.extraction_completed_at = now
+                    # Picked up by the metadata worker
+                    document.metadata_status = "pending"
+                    document.metadata_claimed_at = None
+                    completed_documents.append(document)
+                    continue
+
+                error_message = failures[queue_item.id]
+                queue_item.error_message = error_message
+                queue_item.retry_count += 1
+
+                if queue_item.retry_count >= ExtractionService.MAX_RETRIES:
+                    # Max retries reached, mark as failed
+                    queue_item.status = "failed"
+                    queue_item.completed_at = now
+                    document.extraction_status = "failed"
+                    document.extraction_error = error_message
+                else:
+                    # Still have retries left, keep as pending
+                    queue_item.status = "pending"
+                    queue_item.started_at = None
+                    document.extraction_status = "pending"
+
             db.session.commit()
 
-            # TASK-006 & TASK-007: Extract DOI and fetch metadata
-            # This runs after successful text extraction
-            # Metadata failures do not affect extraction success
-            try:
-                ExtractionService._extract_and_fetch_metadata(document)
-                db.session.commit()
-            except Exception as metadata_error:
-                # REQ-UNW-003: Never fail the entire upload due to metadata issues
-                logger.error(
-                    f"Document {document.id}: Metadata processing error - "
-                    f"{str(metadata_error)}"
-                )
-                document.metadata_status = "failed"
-                db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
 
-            return True, None
+        if completed_documents:
+            from app.metadata_worker import metadata_worker
 
-        except Exception as e:
-            error_message = str(e)
+            metadata_worker.wake_up()
 
-            queue_item.retry_count += 1
-            queue_item.error_message = error_message
+        return len(queue_items), list(failures.values())
 
-            if queue_item.retry_count >= ExtractionService.MAX_RETRIES:
-                # Max retries reached, mark as failed
-                queue_item.status = "failed"
-                queue_item.completed_at = datetime.now(timezone.utc)
-                document.extraction_status = "failed"
-                document.extraction_error = error_message
-            else:
-                # Still have retries left, keep as pending
-                queue_item.status = "pending"
-                queue_item.started_at = None
+    @staticmethod
+    def process_next() -> Tuple[bool, Optional[str]]:
+        """Process the next item in the extraction queue.
 
-            db.session.commit()
+        Convenience wrapper around process_batch for a single item.
 
-            return False, error_message
+        Returns:
+            Tuple of (success, error_message)
+        """
+        _, errors = ExtractionService.process_batch(1)
+        if errors:
+            return False, errors[0]
+        return True, None
@@ -0,0 +1,545 @@
+"""CrossRef metadata enrichment service.
+
+Metadata enrichment is a separate stage from text extraction: extraction
+marks completed documents with metadata_status 'pending' and the metadata
+worker claims them in batches. DOI lookups are I/O-bound, so they run
+concurrently without holding up CPU-bound extraction, and documents are
+searchable as soon as their text is stored. The ``flask backfill-metadata``
+command reuses the same lookups to retry failed or old documents in bulk.
+"""
+
+import json
+import logging
+from concurrent.futures import Executor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from flask import current_app
+from sqlalchemy import ColumnElement, and_, or_, update
+
+from app.models import db
+from app.models.document import SearchDocument
+from app.services.crossref_service import CrossRefService
+from app.services.doi_service import DOIService
+
+logger = logging.getLogger(__name__)
+
+# Default number of documents claimed per worker tick
+DEFAULT_BATCH_SIZE = 10
+
+# metadata_status values a backfill retries by default
+BACKFILL_STATUSES = ("failed", "pending")
+
+
+@dataclass
+class MetadataLookup:
+    """Result of looking up a document's DOI and CrossRef metadata.
+
+    Attributes:
+        doi: DOI found in (or already known for) the document
+        doi_error: Error from reading the PDF, if any
+        metadata: CrossRef metadata, if the lookup succeeded
+        api_error: Error from CrossRef, if any
+    """
+
+    doi: Optional[str] = None
+    doi_error: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = None
+    api_error: Optional[str] = None
+
+
+class MetadataService:
+    """Service class for DOI extraction and CrossRef metadata enrichment."""
+
+    # Claims older than this are considered abandoned (worker crashed)
+    CLAIM_TIMEOUT_SECONDS = 600
+
+    @staticmethod
+    def claim_pending_batch(limit: int) -> List[SearchDocument]:
+        """Atomically claim up to ``limit`` documents awaiting metadata.
+
+        Uses the same claim pattern as ExtractionService: candidates are
+        selected with ``FOR UPDATE SKIP LOCKED`` and flipped to
+        'processing' by a guarded UPDATE ... RETURNING, so concurrent
+        workers never claim the same document.
+
+        Args:
+            limit: Maximum number of documents to claim
+
+        Returns:
+            Claimed documents (metadata_status 'processing'), oldest
+            extraction first
+        """
+        candidate_ids = [
+            row.id
+            for row in db.session.query(SearchDocument.id)
+            .filter(
+                SearchDocument.extraction_status == "completed",
+                SearchDocument.metadata_status == "pending",
+                SearchDocument.is_active.is_(True),
+            )
+            .order_by(
+                SearchDocument.extraction_completed_at.asc(), SearchDocument.id.asc()
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        ]
+        if not candidate_ids:
+            db.session.commit()
+            return []
+
+        claimed_ids = set(
+            db.session.execute(
+                update(SearchDocument)
+                .where(
+                    SearchDocument.id.in_(candidate_ids),
+                    SearchDocument.metadata_status == "pending",
+                )
+                .values(
+                    metadata_status="processing",
+                    metadata_claimed_at=datetime.now(timezone.utc),
+                )
+                .returning(SearchDocument.id)
+                .execution_options(synchronize_session=False)
+            ).scalars()
+        )
+        db.session.commit()
+
+        if not claimed_ids:
+            return []
+
+        documents = SearchDocument.query.filter(
+            SearchDocument.id.in_(claimed_ids)
+        ).all()
+        order = {document_id: index for index, document_id in enumerate(candidate_ids)}
+        return sorted(documents, key=lambda document: order[document.id])
+
+    @staticmethod
+    def release_stale_claims(timeout_seconds: Optional[int] = None) -> int:
+        """Return abandoned metadata claims to the pending state.
+
+        Args:
+            timeout_seconds: Claim age after which a document is retried
+                (default CLAIM_TIMEOUT_SECONDS)
+
+        Returns:
+            Number of documents released
+        """
+        if timeout_seconds is None:
+            timeout_seconds = MetadataService.CLAIM_TIMEOUT_SECONDS
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=timeout_seconds)
+
+        released = db.session.execute(
+            update(SearchDocument)
+            .where(
+                SearchDocument.metadata_status == "processing",
+                or_(
+                    SearchDocument.metadata_claimed_at.is_(None),
+                    SearchDocument.metadata_claimed_at < cutoff,
+                ),
+            )
+            .values(metadata_status="pending", metadata_claimed_at=None)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.session.commit()
+
+        if released:
+            logger.warning(f"Released {released} stale metadata claims")
+
+        return released
+
+    @staticmethod
+    def _format_author_name(given: str, family: str) -> str:
+        """Format author name as 'Family, G.' format.
+
+        Args:
+            given: Given name(s)
+            family: Family name
+
+        Returns:
+            Formatted author name
+        """
+        if given and family:
+            # Get first initial from given name
+            initial = given[0].upper() + "."
+            return f"{family}, {initial}"
+        elif family:
+            return family
+        elif given:
+            return given
+        return ""
+
+    @staticmethod
+    def _process_metadata(document: SearchDocument, metadata: Dict[str, Any]) -> bool:
+        """Process and save CrossRef metadata to document.
+
+        Only saves metadata if title exists (per REQ-UNW-002).
+
+        Args:
+            document: Document to update
+            metadata: Metadata dictionary from CrossRef
+
+        Returns:
+            True if metadata was saved, False otherwise
+        """
+        # REQ-UNW-002: Do NOT save incomplete metadata (must have title)
+        title = metadata.get("title")
+        if not title:
+            logger.warning(
+                f"Document {document.id}: Skipping metadata - no title found"
+            )
+            return False
+
+        # Process authors
+        authors = metadata.get("authors", [])
+        if authors:
+            # Parse first author - CrossRef returns "Given Family" format
+            first_author_full = authors[0]
+            parts = first_author_full.rsplit(" ", 1)
+            if len(parts) == 2:
+                given, family = parts
+                document.first_author = MetadataService._format_author_name(
+                    given, family
+                )
+            else:
+                document.first_author = first_author_full
+
+            # Process co-authors (remaining authors)
+            if len(authors) > 1:
+                co_authors_list = []
+                for author_full in authors[1:]:
+                    parts = author_full.rsplit(" ", 1)
+                    if len(parts) == 2:
+                        given, family = parts
+                        co_authors_list.append(
+                            MetadataService._format_author_name(given, family)
+                        )
+                    else:
+                        co_authors_list.append(author_full)
+                document.co_authors = json.dumps(co_authors_list)
+
+        # Set other metadata fields
+        document.journal_name = metadata.get("journal")
+        document.publication_year = metadata.get("year")
+        document.publisher = metadata.get("publisher")
+
+        logger.info(
+            f"Document {document.id}: Metadata saved - "
+            f"first_author={document.first_author}, "
+            f"journal={document.journal_name}, "
+            f"year={document.publication_year}"
+        )
+
+        return True
+
+    @staticmethod
+    def lookup(file_path: str, doi: Optional[str] = None) -> MetadataLookup:
+        """Find a document's DOI and fetch its CrossRef metadata.
+
+        Touches no database state, so lookups can run in worker threads;
+        apply_lookup() writes the result to the document.
+
+        Args:
+            file_path: Path to the PDF file
+            doi: Known DOI; skips reading the PDF when given
+
+        Returns:
+            MetadataLookup with the DOI, metadata and any errors
+        """
+        result = MetadataLookup(doi=doi)
+
+        if not result.doi:
+            # TASK-006: Extract DOI from PDF
+            result.doi, result.doi_error = DOIService.extract_doi_from_pdf(file_path)
+            if not result.doi:
+                return result
+
+        # TASK-007: Fetch CrossRef metadata
+        result.metadata, result.api_error = CrossRefService.fetch_metadata(result.doi)
+        return result
+
+    @staticmethod
+    def apply_lookup(document: SearchDocument, result: MetadataLookup) -> None:
+        """Write a lookup result to a document.
+
+        Sets the document's DOI, metadata fields and metadata_status; the
+        caller commits.
+
+        This method implements graceful degradation (REQ-UNW-003):
+        - If DOI not found: metadata_status = 'completed' (no metadata to fetch)
+        - If CrossRef API fails: metadata_status = 'failed', but extraction succeeds
+        - Never fails the entire upload due to metadata issues
+
+        Args:
+            document: Document the lookup was made for
+            result: Result of lookup()
+        """
+        if result.doi_error:
+            logger.warning(
+                f"Document {document.id}: DOI extraction error - {result.doi_error}"
+            )
+
+        if not result.doi:
+            # No DOI found - mark as completed (nothing to fetch)
+            document.metadata_status = "completed"
+            logger.info(f"Document {document.id}: No DOI found in PDF")
+            return
+
+        # Store DOI information
+        document.doi = result.doi
+        document.doi_url = f"https://doi.org/{result.doi}"
+
+        logger.info(f"Document {document.id}: DOI extracted - {result.doi}")
+
+        if result.api_error:
+            # REQ-UNW-003: Continue operation even if CrossRef API fails
+            document.metadata_status = "failed"
+            logger.warning(
+                f"Document {document.id}: CrossRef API error - {result.api_error}"
+            )
+            return
+
+        if not result.metadata:
+            document.metadata_status = "failed"
+            logger.warning(
+                f"Document {document.id}: No metadata returned from CrossRef"
+            )
+            return
+
+        # Process and save metadata
+        saved = MetadataService._process_metadata(document, result.metadata)
+
+        if saved:
+            document.metadata_status = "completed"
+            document.metadata_fetched_at = datetime.now(timezone.utc)
+        else:
+            # REQ-UNW-002: Incomplete metadata (no title)
+            document.metadata_status = "failed"
+
+    @staticmethod
+    def enrich_document(document: SearchDocument) -> None:
+        """Extract DOI and fetch CrossRef metadata for a document.
+
+        Sets the document's DOI, metadata fields and metadata_status; the
+        caller commits.
+
+        Args:
+            document: Document to process for metadata
+        """
+        MetadataService.apply_lookup(
+            document, MetadataService.lookup(document.file_path)
+        )
+
+    @staticmethod
+    def process_batch(batch_size: int = DEFAULT_BATCH_SIZE) -> Tuple[int, List[str]]:
+        """Claim and enrich a batch of documents.
+
+        Each document is committed on its own so one slow or failing
+        lookup never loses the results of the others. Failures only set
+        metadata_status to 'failed'; extraction results are untouched.
+
+        Args:
+            batch_size: Maximum number of documents to claim
+
+        Returns:
+            Tuple of (number of documents claimed, list of error messages)
+        """
+        documents = MetadataService.claim_pending_batch(batch_size)
+        errors: List[str] = []
+
+        for document in documents:
+            try:
+                MetadataService.enrich_document(document)
+                db.session.commit()
+            except Exception as metadata_error:
+                # REQ-UNW-003: Never fail the document due to metadata issues
+                logger.error(
+                    f"Document {document.id}: Metadata processing error - "
+                    f"{str(metadata_error)}"
+                )
+                db.session.rollback()
+                document.metadata_status = "failed"
+                db.session.commit()
+                errors.append(f"Document {document.id}: {metadata_error}")
+
+        return len(documents), errors
+
+    @staticmethod
+    def _backfill_filter(
+        statuses: Sequence[str], fetched_before: Optional[datetime]
+    ) -> ColumnElement[bool]:
+        """Build the eligibility condition for backfill selection."""
+        conditions = [SearchDocument.metadata_status.in_(list(statuses))]
+        if fetched_before is not None:
+            conditions.append(
+                and_(
+                    SearchDocument.metadata_status == "completed",
+                    SearchDocument.metadata_fetched_at < fetched_before,
+                )
+            )
+        return or_(*conditions)
+
+    @staticmethod
+    def count_backfill_candidates(
+        statuses: Sequence[str] = BACKFILL_STATUSES,
+        fetched_before: Optional[datetime] = None,
+        after_id: int = 0,
+    ) -> int:
+        """Count documents a backfill run would process.
+
+        Args:
+            statuses: metadata_status values to retry
+            fetched_before: Also refresh completed metadata older than this
+            after_id: Only count documents with a larger id
+
+        Returns:
+            Number of eligible documents
+        """
+        return SearchDocument.query.filter(
+            SearchDocument.id > after_id,
+            SearchDocument.extraction_status == "completed",
+            SearchDocument.is_active.is_(True),
+            MetadataService._backfill_filter(statuses, fetched_before),
+        ).count()
+
+    @staticmethod
+    def claim_backfill_batch(
+        after_id: int,
+        limit: int,
+        statuses: Sequence[str] = BACKFILL_STATUSES,
+        fetched_before: Optional[datetime] = None,
+    ) -> Tuple[List[SearchDocument], Optional[int]]:
+        """Atomically claim the next batch of documents to backfill.
+
+        Walks documents in id order so a run always makes progress and can
+        be resumed from the last id it reported. Claims use the same
+        guarded UPDATE as claim_pending_batch, so a backfill never works on
+        a document the metadata worker holds (and vice versa), and claims
+        left behind by an interrupted run are released like stale worker
+        claims.
+
+        Args:
+            after_id: Only consider documents with a larger id
+            limit: Maximum number of documents to claim
+            statuses: metadata_status values to retry
+            fetched_before: Also refresh completed metadata older than this
+
+        Returns:
+            Tuple of (claimed documents in id order, largest id examined or
+            None when no candidates remain)
+        """
+        eligible = MetadataService._backfill_filter(statuses, fetched_before)
+
+        candidate_ids = [
+            row.id
+            for row in db.session.query(SearchDocument.id)
+            .filter(
+                SearchDocument.id > after_id,
+                SearchDocument.extraction_status == "completed",
+                SearchDocument.is_active.is_(True),
+                eligible,
+            )
+            .order_by(SearchDocument.id.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        ]
+        if not candidate_ids:
+            db.session.commit()
+            return [], None
+
+        claimed_ids = set(
+            db.session.execute(
+                update(SearchDocument)
+                .where(SearchDocument.id.in_(candidate_ids), eligible)
+                .values(
+                    metadata_status="processing",
+                    metadata_claimed_at=datetime.now(timezone.utc),
+                )
+                .returning(SearchDocument.id)
+                .execution_options(synchronize_session=False)
+            ).scalars()
+        )
+        db.session.commit()
+
+        documents = (
+            SearchDocument.query.filter(SearchDocument.id.in_(claimed_ids))
+            .order_by(SearchDocument.id.asc())
+            .all()
+            if claimed_ids
+            else []
+        )
+        return documents, candidate_ids[-1]
+
+    @staticmethod
+    def backfill_batch(
+        documents: List[SearchDocument],
+        executor: Executor,
+        reuse_doi: bool = True,
+        on_result: Optional[Callable[[SearchDocument], None]] = None,
+    ) -> List[str]:
+        """Look up metadata for claimed documents concurrently.
+
+        Lookups (PDF reads and CrossRef requests, which go through the
+        shared rate limiter and caches) run on the executor; results are
+        applied on the calling thread and committed together.
+
+        Args:
+            documents: Documents claimed by claim_backfill_batch()
+            executor: Pool the lookups run on
+            reuse_doi: Use the stored DOI instead of re-reading the PDF
+            on_result: Called with each document once its result is applied
+
+        Returns:
+            List of error messages
+        """
+        app = current_app._get_current_object()
+        errors: List[str] = []
+
+        def run_lookup(file_path: str, doi: Optional[str]) -> MetadataLookup:
+            with app.app_context():
+                return MetadataService.lookup(file_path, doi)
+
+        futures = {
+            executor.submit(
+                run_lookup, document.file_path, document.doi if reuse_doi else None
+            ): document
+            for document in documents
+        }
+
+        try:
+            for future in as_completed(futures):
+                document = futures[future]
+                try:
+                    MetadataService.apply_lookup(document, future.result())
+                except Exception as metadata_error:
+                    logger.error(
+                        f"Document {document.id}: Metadata backfill error - "
+                        f"{str(metadata_error)}"
+                    )
+                    document.metadata_status = "failed"
+                    errors.append(f"Document {document.id}: {metadata_error}")
+                document.metadata_claimed_at = None
+                if on_result is not None:
+                    on_result(document)
+        except BaseException:
+            # Interrupted: drop partial results and hand the claims back
+            for future in futures:
+                future.cancel()
+            db.session.rollback()
+            db.session.execute(
+                update(SearchDocument)
+                .where(
+                    SearchDocument.id.in_([document.id for document in documents]),
+                    SearchDocument.metadata_status == "processing",
+                )
+                .values(metadata_status="pending", metadata_claimed_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            db.session.commit()
+            raise
+
+        db.session.commit()
+        return errors
@@ -1,6 +1,18 @@
-"""Service for managing AI provider system prompts."""
+"""Service for managing AI provider system prompts.
 
-from typing import Optional, List, Dict, Any
+Providers read their prompt for every chunk they check, so active custom
+prompts are cached per application. Changes made through this service
+invalidate the cache at once. Other processes notice within
+SYSTEM_PROMPT_CACHE_TTL seconds through a cheap check of the prompt
+table's row count and latest update time.
+"""
+
+import threading
+import time
+from typing import Optional, List, Dict, Any, Tuple
+
+from flask import current_app, has_app_context
+from sqlalchemy import func
 
 from app import db
 from app.models.system_prompt import SystemPromptConfig
@@ -9,6 +21,80 @@ from app.services.ai.gemini_provider import GeminiProvider
 from app.services.ai.openai_provider import OpenAIProvider
 
 
+# Default for SYSTEM_PROMPT_CACHE_TTL (seconds between cross-process checks)
+DEFAULT_CACHE_TTL = 5.0
+
+_cache_init_lock = threading.Lock()
+
+
+class PromptCache:
+    """In-process cache of active custom prompts with a version counter.
+
+    The version increases whenever the cached prompts are dropped, either
+    by a local change or because another process changed the table.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_CACHE_TTL):
+        """Initialize an empty cache.
+
+        Args:
+            ttl: Seconds between checks for changes made by other processes
+        """
+        self.ttl = ttl
+        self.version = 0
+        self._prompts: Dict[str, Optional[str]] = {}
+        self._stamp: Optional[Tuple] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, provider: str) -> Tuple[bool, Optional[str]]:
+        """Look up a provider's cached prompt.
+
+        Args:
+            provider: The provider name
+
+        Returns:
+            Tuple of (whether the provider is cached, custom prompt or None)
+        """
+        self._check_stamp()
+        with self._lock:
+            if provider in self._prompts:
+                return True, self._prompts[provider]
+            return False, None
+
+    def put(self, provider: str, prompt: Optional[str], version: int) -> None:
+        """Cache a prompt read while the cache was at the given version."""
+        with self._lock:
+            if version == self.version:
+                self._prompts[provider] = prompt
+
+    def invalidate(self) -> None:
+        """Drop cached prompts and bump the version."""
+        with self._lock:
+            self._prompts.clear()
+            self.version += 1
+            self._checked_at = 0.0
+
+    def _check_stamp(self) -> None:
+        """Invalidate if the prompt table changed since the last check."""
+        now = time.monotonic()
+        if now - self._checked_at < self.ttl:
+            return
+
+        stamp = tuple(
+            db.session.query(
+                func.count(SystemPromptConfig.id),
+                func.max(SystemPromptConfig.updated_at),
+            ).one()
+        )
+        with self._lock:
+            if stamp != self._stamp:
+                self._prompts.clear()
+                self.version += 1
+                self._stamp = stamp
+            self._checked_at = now
+
+
 class SystemPromptService:
     """Service for managing system prompt configurations.
 
@@ -58,6 +144,61 @@ class SystemPromptService:
             return prompt.prompt
         return None
 
+    @classmethod
+    def get_cached_prompt_text(cls, provider: str) -> Optional[str]:
+        """Get the active custom prompt for a provider through the cache.
+
+        Args:
+            provider: The provider name (claude, gemini, openai)
+
+        Returns:
+            The prompt text, or None if not configured in DB
+        """
+        cache = cls._get_cache()
+        if cache is None:
+            return cls.get_prompt_text(provider)
+
+        found, prompt = cache.get(provider)
+        if found:
+            return prompt
+
+        version = cache.version
+        prompt = cls.get_prompt_text(provider)
+        cache.put(provider, prompt, version)
+        return prompt
+
+    @classmethod
+    def cache_version(cls) -> int:
+        """Return the current prompt cache version (0 outside an app)."""
+        cache = cls._get_cache()
+        return cache.version if cache else 0
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drop cached prompts after a change."""
+        cache = cls._get_cache()
+        if cache is not None:
+            cache.invalidate()
+
+    @staticmethod
+    def _get_cache() -> Optional[PromptCache]:
+        """Return the current application's prompt cache, if any."""
+        if not has_app_context():
+            return None
+        extensions = current_app.extensions
+        cache = extensions.get("system_prompt_cache")
+        if cache is None:
+            with _cache_init_lock:
+                cache = extensions.setdefault(
+                    "system_prompt_cache",
+                    PromptCache(
+                        current_app.config.get(
+                            "SYSTEM_PROMPT_CACHE_TTL", DEFAULT_CACHE_TTL
+                        )
+                    ),
+                )
+        return cache
+
     @classmethod
     def update_prompt(cls, provider: str, prompt: str) -> Dict[str, Any]:
         """Update or create a system prompt for a provider.
@@ -83,6 +224,7 @@ class SystemPromptService:
         if existing:
             existing.prompt = prompt.strip()
             db.session.commit()
+            cls.invalidate_cache()
             return existing.to_dict()
         else:
             new_prompt = SystemPromptConfig(
@@ -92,6 +234,7 @@ class SystemPromptService:
             )
             db.session.add(new_prompt)
             db.session.commit()
+            cls.invalidate_cache()
             return new_prompt.to_dict()
 
     @classmethod
@@ -114,6 +257,7 @@ class SystemPromptService:
         if existing:
             db.session.delete(existing)
             db.session.commit()
+            cls.invalidate_cache()
 
         return True
 
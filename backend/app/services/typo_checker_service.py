@@ -3,17 +3,55 @@
 This service provides the main interface for checking Korean text
 for typos using various AI providers. It handles text chunking,
 provider selection, result aggregation, and caching.
+
+Chunks of a long text are sent to the provider concurrently, bounded by
+TYPO_CHUNK_CONCURRENCY per check and TYPO_PROVIDER_CONCURRENCY in-flight
+requests per provider across the whole process, and reassembled in order.
+Every provider call feeds rolling latency and error statistics; providers
+that keep failing have their circuit opened, and checks without an
+explicit provider go to the fastest provider that is currently healthy.
+Short checks on that path can optionally be hedged (TYPO_HEDGING): if the
+provider has not answered within its p90 latency, the chunk is also sent
+to a second provider and the first good answer wins.
+Each chunk's result is cached per user, provider and prompt version, so
+resubmitting an edited text only re-checks the chunks that changed. With
+TYPO_SHARED_CACHE enabled, results are also shared between users under an
+HMAC of the text, so identical inputs from any account hit the cache.
+Shared entries store the corrected text in plain form and belong to no
+user, so they outlive the account that submitted them until they expire.
+
+When a user resubmits an edited version of a text they checked before,
+the new text is diffed line by line against the most similar recent
+result: only changed paragraphs are sent to the provider and the issues
+found in unchanged paragraphs are carried over at their new positions.
 """
 
 import hashlib
+import hmac
 import json
 import logging
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+from difflib import SequenceMatcher
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from flask import current_app, has_app_context
+from sqlalchemy import delete, insert, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from app import db
+from app.models.typo_check_job import TypoCheckJob
 from app.models.typo_check_result import TypoCheckResult
-from app.services.ai.ai_provider_interface import AIProviderInterface
+from app.models.typo_chunk_cache import TypoChunkCacheEntry
+from app.services.ai.ai_provider_interface import AIProviderInterface, TypoIssue
+from app.services.ai.ai_provider_interface import (
+    TypoCheckResult as ChunkResult,
+)
+from app.services.ai.provider_health import HedgeBudget, ProviderHealth
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +62,32 @@ MAX_TEXT_LENGTH = 100000
 # Default chunk size for splitting large texts
 DEFAULT_CHUNK_SIZE = 8000
 
+# Defaults for TYPO_CHUNK_CONCURRENCY (parallel chunks per check) and
+# TYPO_PROVIDER_CONCURRENCY (in-flight requests per provider per process)
+DEFAULT_CHUNK_CONCURRENCY = 8
+DEFAULT_PROVIDER_CONCURRENCY = 16
+
+# Default for TYPO_CHUNK_CACHE_MAX_AGE_DAYS (0 disables the chunk cache)
+DEFAULT_CHUNK_CACHE_MAX_AGE_DAYS = 30
+
+# Defaults for TYPO_HEDGE_BUDGET (share of eligible requests that may be
+# hedged) and TYPO_HEDGE_MAX_LENGTH (longest text that is hedged)
+DEFAULT_HEDGE_BUDGET = 0.1
+DEFAULT_HEDGE_MAX_LENGTH = 2000
+
+# Default for TYPO_HEDGE_SYNC_TIMEOUT (seconds the submit endpoint waits
+# for a synchronous hedged check) and the threads those checks run on
+DEFAULT_HEDGE_SYNC_TIMEOUT = 10.0
+SYNC_CHECK_WORKERS = 2
+
+# Expired chunk cache rows are pruned once every this many writes
+CHUNK_CACHE_PRUNE_INTERVAL = 100
+
+# Incremental re-checks compare against this many of the user's latest
+# results and need at least this fraction of paragraphs in common
+INCREMENTAL_CANDIDATES = 5
+INCREMENTAL_MIN_SIMILARITY = 0.6
+
 
 class TypoCheckerService:
     """Service for checking Korean text for typos.
@@ -35,6 +99,22 @@ class TypoCheckerService:
     # Registry of available providers
     _provider_registry: dict = {}
 
+    # Long-lived provider instances (and so SDK clients with their
+    # connection pools) by name, with the class each was built from
+    _provider_instances: Dict[str, Tuple[type, AIProviderInterface]] = {}
+    _provider_instances_lock = threading.Lock()
+    _app_state_lock = threading.Lock()
+
+    # Per-provider request slots shared by every check in this process
+    _provider_slots: Dict[str, threading.BoundedSemaphore] = {}
+    _provider_slots_lock = threading.Lock()
+
+    # Threads running synchronous checks for the submit endpoint
+    _sync_executor: Optional[ThreadPoolExecutor] = None
+
+    # Chunk cache writes since the last prune
+    _chunk_cache_writes = 0
+
     @classmethod
     def _init_providers(cls):
         """Initialize provider registry with lazy imports."""
@@ -137,39 +217,43 @@ class TypoCheckerService:
                     "provider": None,
                 }
 
-        # Chunk text if needed
-        chunks = TypoCheckerService._chunk_text(text)
-
-        # Process each chunk
-        all_issues: List[Dict] = []
-        corrected_chunks: List[str] = []
-        current_position = 0
-
-        for chunk in chunks:
-            result = ai_provider.check_typo(chunk)
-
-            if not result.success:
-                return {
-                    "success": False,
-                    "error": result.error_message or "Failed to check typos",
-                    "corrected_text": "",
-                    "issues": [],
-                    "provider": ai_provider.provider_name,
-                }
+        # Chunk text if needed, reusing a previous check of similar text
+        chunks, carried = TypoCheckerService._plan_chunks(
+            ai_provider, text, user_id
+        )
 
-            corrected_chunks.append(result.corrected_text)
+        # Hedge short default-routed checks against provider tail latency
+        hedge = not provider and TypoCheckerService.is_hedge_eligible(text)
 
-            # Adjust issue positions for chunk offset
-            for issue in result.issues:
-                issue_dict = issue.to_dict()
-                issue_dict["position"] += current_position
-                all_issues.append(issue_dict)
+        # Check chunks concurrently
+        results: List[Optional[ChunkResult]] = [None] * len(chunks)
 
-            current_position += len(chunk)
+        with closing(
+            TypoCheckerService._iter_chunk_results(
+                ai_provider, chunks, user_id, carried, hedge=hedge
+            )
+        ) as completed:
+            for index, result in completed:
+                if not result.success:
+                    return {
+                        "success": False,
+                        "error": result.error_message or "Failed to check typos",
+                        "corrected_text": "",
+                        "issues": [],
+                        "provider": ai_provider.provider_name,
+                    }
+                results[index] = result
 
         # Combine results
-        final_corrected = "".join(corrected_chunks)
+        final_corrected, all_issues = TypoCheckerService._merge_chunk_results(
+            chunks, results
+        )
         provider_name = ai_provider.provider_name
+        if hedge:
+            # A hedge may have answered every chunk
+            answered_by = {result.provider for result in results}
+            if len(answered_by) == 1:
+                provider_name = answered_by.pop()
 
         # If corrected text is significantly shorter than original,
         # reconstruct it by applying issues to original text
@@ -191,6 +275,7 @@ class TypoCheckerService:
                 corrected_text=final_corrected,
                 issues=json.dumps(all_issues),
                 provider_used=provider_name,
+                prompt_version=TypoCheckerService._prompt_version(ai_provider),
             )
             db.session.add(db_result)
             db.session.commit()
@@ -207,6 +292,138 @@ class TypoCheckerService:
             "cached": False,
         }
 
+    @staticmethod
+    def is_hedge_eligible(text: str) -> bool:
+        """Return whether a default-routed check of text would be hedged.
+
+        Args:
+            text: Text to check
+
+        Returns:
+            True if TYPO_HEDGING is on and the text is short enough
+        """
+        return bool(
+            TypoCheckerService._get_config("TYPO_HEDGING", False)
+        ) and len(text) <= TypoCheckerService._get_config(
+            "TYPO_HEDGE_MAX_LENGTH", DEFAULT_HEDGE_MAX_LENGTH
+        )
+
+    @classmethod
+    def check_text_within(
+        cls, text: str, user_id: str, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Run a default-routed check_text, giving up after a timeout.
+
+        The check runs on a small shared pool, so a request thread waits
+        at most ``timeout`` seconds. A check that overruns keeps its pool
+        thread until it finishes and still stores its result.
+
+        Args:
+            text: Text to check
+            user_id: Owner of the check
+            timeout: Seconds to wait; defaults to TYPO_HEDGE_SYNC_TIMEOUT
+
+        Returns:
+            check_text result, or None if it did not finish in time
+        """
+        if timeout is None:
+            timeout = cls._get_config(
+                "TYPO_HEDGE_SYNC_TIMEOUT", DEFAULT_HEDGE_SYNC_TIMEOUT
+            )
+        with cls._app_state_lock:
+            if cls._sync_executor is None:
+                cls._sync_executor = ThreadPoolExecutor(
+                    max_workers=SYNC_CHECK_WORKERS, thread_name_prefix="typo-sync"
+                )
+            executor = cls._sync_executor
+
+        app = current_app._get_current_object()
+
+        def run() -> Dict[str, Any]:
+            with app.app_context():
+                return cls.check_text(text, user_id)
+
+        future = executor.submit(run)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # Still queued checks are dropped; a running one finishes
+            future.cancel()
+            logger.info(f"Synchronous typo check exceeded {timeout}s, queueing")
+            return None
+
+    @staticmethod
+    def get_cached_result(
+        text: str, user_id: str, provider: str
+    ) -> Optional[Dict[str, Any]]:
+        """Assemble a result from the chunk cache without calling a provider.
+
+        Used by the submit endpoint so texts whose chunks were all checked
+        before (by this user, or by anyone with TYPO_SHARED_CACHE on) are
+        answered immediately instead of queueing a job. The assembled
+        result is saved to the user's history like a fresh check.
+
+        With TYPO_SHARED_CACHE on, the result is reported as a fresh check
+        ("cached": False): shared entries have no owner, so a cached flag
+        would tell the caller that some other account submitted the text.
+
+        Args:
+            text: Text to check
+            user_id: User submitting the text
+            provider: Provider name the text would be checked with
+
+        Returns:
+            Result dictionary as returned by check_text, or None if any
+            chunk is not cached
+        """
+        ai_provider = TypoCheckerService._get_provider(provider)
+        if not ai_provider:
+            return None
+
+        chunks = TypoCheckerService._chunk_text(text)
+        try:
+            hits, _ = TypoCheckerService._load_cached_chunks(
+                ai_provider, chunks, user_id
+            )
+        except Exception as e:
+            logger.warning(f"Chunk cache lookup failed: {e}")
+            return None
+        if len(hits) < len(chunks):
+            return None
+
+        final_corrected, all_issues = TypoCheckerService._merge_chunk_results(
+            chunks, [hits[index] for index in range(len(chunks))]
+        )
+        if len(final_corrected) < len(text) * 0.5:
+            final_corrected = TypoCheckerService._reconstruct_corrected_text(
+                text, all_issues
+            )
+
+        try:
+            db.session.add(
+                TypoCheckResult(
+                    user_id=user_id,
+                    original_text_hash=hashlib.sha256(text.encode()).hexdigest(),
+                    original_text=text,
+                    corrected_text=final_corrected,
+                    issues=json.dumps(all_issues),
+                    provider_used=ai_provider.provider_name,
+                    prompt_version=TypoCheckerService._prompt_version(ai_provider),
+                )
+            )
+            db.session.commit()
+        except Exception as e:
+            logger.error(f"Failed to cache result: {e}")
+            db.session.rollback()
+
+        return {
+            "success": True,
+            "corrected_text": final_corrected,
+            "issues": all_issues,
+            "provider": ai_provider.provider_name,
+            "cached": TypoCheckerService._shared_cache_secret() is None,
+        }
+
     @staticmethod
     def get_user_history(
         user_id: str, page: int = 1, per_page: int = 20
@@ -317,10 +534,10 @@ class TypoCheckerService:
         TypoCheckerService._init_providers()
 
         available = []
-        for name, provider_class in TypoCheckerService._provider_registry.items():
+        for name in TypoCheckerService._provider_registry:
             try:
-                provider = provider_class()
-                is_avail = provider.is_available()
+                provider = TypoCheckerService._get_provider(name)
+                is_avail = provider is not None and provider.is_available()
                 logger.info(f"[DEBUG] Provider '{name}' is_available: {is_avail}")
                 if is_avail:
                     available.append(name)
@@ -331,48 +548,189 @@ class TypoCheckerService:
         logger.info(f"[DEBUG] Available providers: {available}")
         return available
 
-    @staticmethod
-    def _get_provider(name: str) -> Optional[AIProviderInterface]:
+    @classmethod
+    def _get_provider(cls, name: str) -> Optional[AIProviderInterface]:
         """Get a specific provider by name.
 
+        Instances are created once per process and shared by every request
+        and worker thread, so their SDK clients keep connections alive
+        between calls. Providers must therefore be safe to use from several
+        threads at once. An unavailable provider (e.g. no API key set yet)
+        is not pooled, so its configuration is read again on the next call.
+
         Args:
             name: Provider name
 
         Returns:
             Provider instance or None if not found
         """
-        TypoCheckerService._init_providers()
-        provider_class = TypoCheckerService._provider_registry.get(name)
-        if provider_class:
+        cls._init_providers()
+        provider_class = cls._provider_registry.get(name)
+        if not provider_class:
+            return None
+
+        pooled = cls._provider_instances.get(name)
+        if pooled and pooled[0] is provider_class:
+            return pooled[1]
+
+        with cls._provider_instances_lock:
+            pooled = cls._provider_instances.get(name)
+            if pooled and pooled[0] is provider_class:
+                return pooled[1]
             try:
-                return provider_class()
+                provider = provider_class()
+                available = provider.is_available()
             except Exception:
                 return None
-        return None
+            if available:
+                cls._provider_instances[name] = (provider_class, provider)
+            return provider
 
-    @staticmethod
-    def _get_default_provider() -> Optional[AIProviderInterface]:
-        """Get the default available provider.
+    @classmethod
+    def reset_providers(cls) -> None:
+        """Drop pooled provider instances, e.g. after API keys change."""
+        with cls._provider_instances_lock:
+            cls._provider_instances.clear()
 
-        Returns:
-            First available provider or None
-        """
+    @staticmethod
+    def _available_providers() -> List[AIProviderInterface]:
+        """Return available providers in order of preference."""
         TypoCheckerService._init_providers()
-        # Try providers in order of preference
+        # Try providers in order of preference, then any other
         preference_order = ["claude", "openai", "gemini"]
+        names = preference_order + [
+            name
+            for name in TypoCheckerService._provider_registry
+            if name not in preference_order
+        ]
 
-        for name in preference_order:
+        available = []
+        for name in names:
             provider = TypoCheckerService._get_provider(name)
             if provider and provider.is_available():
-                return provider
+                available.append(provider)
+        return available
 
-        # Try any available provider
-        for name in TypoCheckerService._provider_registry:
-            provider = TypoCheckerService._get_provider(name)
-            if provider and provider.is_available():
-                return provider
+    @staticmethod
+    def _get_default_provider() -> Optional[AIProviderInterface]:
+        """Get the fastest currently healthy provider.
+
+        Providers are ranked by their recent median latency, with ones
+        never called yet first so each gets tried and ones whose recent
+        calls all failed last, and ties broken by preference order. Providers whose circuit is open are skipped
+        unless every available provider is tripped.
+
+        Returns:
+            Selected provider or None if none is available
+        """
+        candidates = TypoCheckerService._available_providers()
+        if not candidates:
+            return None
+
+        health = TypoCheckerService._get_health()
+        if health is None:
+            return candidates[0]
+
+        healthy = [p for p in candidates if health.is_healthy(p.provider_name)]
+        if not healthy:
+            return candidates[0]
+        return min(healthy, key=lambda p: health.routing_key(p.provider_name))
+
+    @staticmethod
+    def _get_hedge_provider(primary_name: str) -> Optional[AIProviderInterface]:
+        """Get the fastest healthy provider other than the primary.
+
+        Args:
+            primary_name: Provider the hedged request went to first
+
+        Returns:
+            Secondary provider or None if there is no healthy one
+        """
+        health = TypoCheckerService._get_health()
+        if health is None:
+            return None
+        healthy = [
+            p
+            for p in TypoCheckerService._available_providers()
+            if p.provider_name != primary_name and health.is_healthy(p.provider_name)
+        ]
+        if not healthy:
+            return None
+        return min(healthy, key=lambda p: health.routing_key(p.provider_name))
+
+    @classmethod
+    def _app_extension(cls, name: str, factory: Callable[[], Any]) -> Any:
+        """Return per-application state, creating it on first use.
+
+        Returns None outside an application context.
+        """
+        if not has_app_context():
+            return None
+        extensions = current_app.extensions
+        value = extensions.get(name)
+        if value is None:
+            with cls._app_state_lock:
+                value = extensions.get(name)
+                if value is None:
+                    value = extensions[name] = factory()
+        return value
+
+    @classmethod
+    def _get_health(cls) -> Optional[ProviderHealth]:
+        """Return the current application's provider health tracker."""
+        return cls._app_extension(
+            "typo_provider_health",
+            lambda: ProviderHealth(
+                failure_threshold=cls._get_config("TYPO_CIRCUIT_FAILURES", 5),
+                cooldown=cls._get_config("TYPO_CIRCUIT_COOLDOWN", 30.0),
+            ),
+        )
 
-        return None
+    @classmethod
+    def _get_hedge_budget(cls) -> Optional[HedgeBudget]:
+        """Return the current application's hedge budget."""
+        return cls._app_extension(
+            "typo_hedge_budget",
+            lambda: HedgeBudget(
+                cls._get_config("TYPO_HEDGE_BUDGET", DEFAULT_HEDGE_BUDGET)
+            ),
+        )
+
+    @staticmethod
+    def claim_next_job() -> Optional[TypoCheckJob]:
+        """Atomically claim the oldest pending typo check job.
+
+        Uses ``FOR UPDATE SKIP LOCKED`` plus a guarded status UPDATE so
+        that several workers (threads, processes or hosts) never pick up
+        the same job. On backends without row locks the guard alone
+        decides the race and the loser gets None.
+
+        Returns:
+            Claimed TypoCheckJob (status 'processing') or None
+        """
+        candidate = (
+            TypoCheckJob.query.filter_by(status="pending")
+            .order_by(TypoCheckJob.created_at.asc())
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+        if not candidate:
+            db.session.commit()
+            return None
+
+        claimed = TypoCheckJob.query.filter_by(
+            id=candidate.id, status="pending"
+        ).update(
+            {"status": "processing", "started_at": datetime.now(timezone.utc)},
+            synchronize_session=False,
+        )
+        db.session.commit()
+
+        if claimed != 1:
+            return None
+
+        db.session.refresh(candidate)
+        return candidate
 
     @staticmethod
     def process_job(job_id: int) -> None:
@@ -420,48 +778,53 @@ class TypoCheckerService:
             # Get provider
             TypoCheckerService._init_providers()
             ai_provider = TypoCheckerService._get_provider(job.provider)
-            if not ai_provider or not ai_provider.is_available():
+            health = TypoCheckerService._get_health()
+            if (
+                not ai_provider
+                or not ai_provider.is_available()
+                or (health and not health.is_healthy(job.provider))
+            ):
                 ai_provider = TypoCheckerService._get_default_provider()
             if not ai_provider or not ai_provider.is_available():
                 raise ValueError(f"Provider '{job.provider}' is not available")
 
-            # Chunk text
-            chunks = TypoCheckerService._chunk_text(text)
+            # Chunk text, reusing a previous check of similar text
+            chunks, carried = TypoCheckerService._plan_chunks(
+                ai_provider, text, job.user_id
+            )
             job.progress_total = len(chunks)
             job.progress_current = 0
             db.session.commit()
 
-            all_issues: List[Dict] = []
-            corrected_chunks: List[str] = []
-            current_position = 0
+            results: List[Optional[ChunkResult]] = [None] * len(chunks)
 
-            for i, chunk in enumerate(chunks):
-                # Check for cancellation between chunks
-                db.session.refresh(job)
-                if job.status == "cancelled":
-                    logger.info(f"Typo check job {job_id} cancelled by user")
-                    return
-
-                result = ai_provider.check_typo(chunk)
-                if not result.success:
-                    raise ValueError(
-                        result.error_message or "Failed to check typos"
-                    )
-
-                corrected_chunks.append(result.corrected_text)
-                for issue in result.issues:
-                    issue_dict = issue.to_dict()
-                    issue_dict["position"] += current_position
-                    all_issues.append(issue_dict)
-
-                current_position += len(chunk)
-
-                # Update progress after each chunk
-                job.progress_current = i + 1
-                db.session.commit()
+            with closing(
+                TypoCheckerService._iter_chunk_results(
+                    ai_provider, chunks, job.user_id, carried
+                )
+            ) as completed:
+                for done, (index, result) in enumerate(completed, start=1):
+                    if not result.success:
+                        raise ValueError(
+                            result.error_message or "Failed to check typos"
+                        )
+                    results[index] = result
+
+                    # Check for cancellation as chunks complete; closing
+                    # the iterator cancels chunks not yet sent
+                    db.session.refresh(job)
+                    if job.status == "cancelled":
+                        logger.info(f"Typo check job {job_id} cancelled by user")
+                        return
+
+                    # Update progress after each chunk
+                    job.progress_current = done
+                    db.session.commit()
 
             # Combine results
-            final_corrected = "".join(corrected_chunks)
+            final_corrected, all_issues = TypoCheckerService._merge_chunk_results(
+                chunks, results
+            )
             provider_name = ai_provider.provider_name
 
             if len(final_corrected) < len(text) * 0.5:
@@ -477,6 +840,7 @@ class TypoCheckerService:
                 corrected_text=final_corrected,
                 issues=json.dumps(all_issues),
                 provider_used=provider_name,
+                prompt_version=TypoCheckerService._prompt_version(ai_provider),
             )
             db.session.add(db_result)
             db.session.flush()
@@ -508,6 +872,682 @@ class TypoCheckerService:
                     job.started_at = None
                 db.session.commit()
 
+    @staticmethod
+    def _get_config(key: str, default: Any) -> Any:
+        """Read a config value, falling back outside an app context."""
+        if has_app_context():
+            return current_app.config.get(key, default)
+        return default
+
+    @classmethod
+    def _get_provider_slots(cls, provider_name: str) -> threading.BoundedSemaphore:
+        """Return the semaphore limiting in-flight requests to a provider.
+
+        Args:
+            provider_name: Provider identifier
+
+        Returns:
+            Semaphore shared by all checks in this process
+        """
+        with cls._provider_slots_lock:
+            slots = cls._provider_slots.get(provider_name)
+            if slots is None:
+                slots = threading.BoundedSemaphore(
+                    cls._get_config(
+                        "TYPO_PROVIDER_CONCURRENCY", DEFAULT_PROVIDER_CONCURRENCY
+                    )
+                )
+                cls._provider_slots[provider_name] = slots
+            return slots
+
+    @staticmethod
+    def _check_chunk(
+        ai_provider: AIProviderInterface,
+        chunk: str,
+        cancelled: Optional[threading.Event] = None,
+    ) -> ChunkResult:
+        """Check one chunk, waiting for a free provider slot.
+
+        If the provider's circuit turns the call away (open, or half-open
+        with its probe in flight), the chunk goes to the fastest other
+        healthy provider instead, or fails at once if there is none. The
+        call's latency and outcome are recorded in the provider's health
+        statistics.
+
+        Args:
+            ai_provider: Provider to use
+            chunk: Text chunk
+            cancelled: Set once the result is no longer wanted; checked
+                before the provider is called
+
+        Returns:
+            Provider result for the chunk
+        """
+        name = ai_provider.provider_name
+        health = TypoCheckerService._get_health()
+        admitted_at = None
+        if health:
+            admitted_at = health.acquire(name)
+            if admitted_at is None:
+                alternative = TypoCheckerService._get_hedge_provider(name)
+                if alternative is not None:
+                    admitted_at = health.acquire(alternative.provider_name)
+                if admitted_at is None:
+                    return ChunkResult(
+                        original_text=chunk,
+                        corrected_text="",
+                        provider=name,
+                        success=False,
+                        error_message=(
+                            f"Provider '{name}' is temporarily unavailable"
+                        ),
+                    )
+                ai_provider, name = alternative, alternative.provider_name
+
+        with TypoCheckerService._get_provider_slots(name):
+            if cancelled is not None and cancelled.is_set():
+                return ChunkResult(
+                    original_text=chunk,
+                    corrected_text="",
+                    provider=name,
+                    success=False,
+                    error_message="Check was cancelled",
+                )
+            started = time.monotonic()
+            try:
+                result = ai_provider.check_typo(chunk)
+            except Exception:
+                if health:
+                    health.record(
+                        name, time.monotonic() - started, False, admitted_at
+                    )
+                raise
+        if health:
+            health.record(
+                name, time.monotonic() - started, result.success, admitted_at
+            )
+        return result
+
+    @staticmethod
+    def _check_chunk_hedged(
+        ai_provider: AIProviderInterface, chunk: str
+    ) -> ChunkResult:
+        """Check one chunk, hedging against the provider's tail latency.
+
+        If the provider has not answered within its recent p90 latency and
+        the hedge budget allows, the chunk is also sent to the fastest
+        other healthy provider and the first successful result is used.
+        Once the race is decided, a losing request that has not reached
+        its provider yet is cancelled. One already in flight cannot be
+        stopped: it is charged against the hedge budget until it finishes,
+        and its result only feeds the health statistics.
+
+        Args:
+            ai_provider: Primary provider
+            chunk: Text chunk
+
+        Returns:
+            Result from whichever provider answered first successfully,
+            or the primary's result if both failed
+        """
+        health = TypoCheckerService._get_health()
+        budget = TypoCheckerService._get_hedge_budget()
+        delay = health.latency(ai_provider.provider_name, 0.9) if health else None
+        if delay is None or budget is None:
+            return TypoCheckerService._check_chunk(ai_provider, chunk)
+
+        app = current_app._get_current_object()
+        cancelled = threading.Event()
+
+        def run(provider: AIProviderInterface) -> ChunkResult:
+            with app.app_context():
+                return TypoCheckerService._check_chunk(provider, chunk, cancelled)
+
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="typo-hedge")
+        futures = []
+        try:
+            primary = executor.submit(run, ai_provider)
+            futures.append(primary)
+            if wait([primary], timeout=delay).done:
+                budget.record()
+                return primary.result()
+
+            secondary_provider = TypoCheckerService._get_hedge_provider(
+                ai_provider.provider_name
+            )
+            if secondary_provider is None:
+                budget.record()
+                return primary.result()
+            if not budget.try_hedge():
+                return primary.result()
+
+            logger.info(
+                f"Hedging {ai_provider.provider_name} chunk to "
+                f"{secondary_provider.provider_name} after {delay:.2f}s"
+            )
+            secondary = executor.submit(run, secondary_provider)
+            futures.append(secondary)
+            for future in as_completed(futures):
+                if future.exception() is None and future.result().success:
+                    return future.result()
+            return primary.result()
+        finally:
+            cancelled.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            for future in futures:
+                if not future.done():
+                    budget.charge()
+                    future.add_done_callback(lambda _: budget.release())
+
+    @staticmethod
+    def _prompt_version(ai_provider: AIProviderInterface) -> str:
+        """Identify the model and system prompt a provider currently uses.
+
+        Cached chunk results are only reused for the same version, so
+        editing a system prompt or changing model invalidates them.
+
+        Args:
+            ai_provider: Provider instance
+
+        Returns:
+            Short hex digest
+        """
+        get_system_prompt = getattr(ai_provider, "get_system_prompt", None)
+        prompt = get_system_prompt() if callable(get_system_prompt) else ""
+        model = getattr(ai_provider, "model", "")
+        return hashlib.sha256(f"{model}\0{prompt}".encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _chunk_cache_key(
+        user_id: str, provider_name: str, prompt_version: str, chunk: str
+    ) -> str:
+        """Build the content-addressed cache key for one chunk."""
+        return hashlib.sha256(
+            f"{user_id}\0{provider_name}\0{prompt_version}\0{chunk}".encode()
+        ).hexdigest()
+
+    @staticmethod
+    def _shared_chunk_cache_key(
+        secret: bytes, provider_name: str, prompt_version: str, chunk: str
+    ) -> str:
+        """Build the keyed cache key for a shared (cross-user) chunk entry.
+
+        Keyed with a server secret so the key cannot be recomputed from a
+        guessed text without it; the stored result itself is not encrypted.
+        """
+        return hmac.new(
+            secret,
+            f"{provider_name}\0{prompt_version}\0{chunk}".encode(),
+            hashlib.sha256,
+        ).hexdigest()
+
+    @staticmethod
+    def _shared_cache_secret() -> Optional[bytes]:
+        """Return the HMAC key for the shared tier, or None if it is off."""
+        if not TypoCheckerService._get_config("TYPO_SHARED_CACHE", False):
+            return None
+        secret = TypoCheckerService._get_config(
+            "TYPO_SHARED_CACHE_KEY", None
+        ) or TypoCheckerService._get_config("SECRET_KEY", "")
+        return secret if isinstance(secret, bytes) else str(secret).encode()
+
+    @staticmethod
+    def _chunk_cache_cutoff() -> Optional[datetime]:
+        """Return the oldest usable cache time, or None if caching is off."""
+        max_age_days = TypoCheckerService._get_config(
+            "TYPO_CHUNK_CACHE_MAX_AGE_DAYS", DEFAULT_CHUNK_CACHE_MAX_AGE_DAYS
+        )
+        if not max_age_days or not has_app_context():
+            return None
+        return datetime.now(timezone.utc) - timedelta(days=max_age_days)
+
+    @staticmethod
+    def _get_cached_chunks(
+        cache_keys: List[str], cutoff: datetime
+    ) -> Dict[str, Tuple[str, List[Dict]]]:
+        """Load cached chunk results in one query.
+
+        The cache uses its own connection so it never commits or rolls
+        back the caller's session.
+
+        Args:
+            cache_keys: Keys from _chunk_cache_key
+            cutoff: Ignore entries created before this time
+
+        Returns:
+            Mapping of cache key to (corrected text, issue dicts)
+        """
+        table = TypoChunkCacheEntry.__table__
+        try:
+            with db.engine.connect() as conn:
+                rows = conn.execute(
+                    select(table.c.cache_key, table.c.corrected_text, table.c.issues)
+                    .where(table.c.cache_key.in_(cache_keys))
+                    .where(table.c.created_at >= cutoff)
+                ).all()
+        except SQLAlchemyError as e:
+            logger.warning(f"Chunk cache lookup failed: {e}")
+            return {}
+
+        return {
+            row.cache_key: (row.corrected_text, json.loads(row.issues or "[]"))
+            for row in rows
+        }
+
+    @classmethod
+    def _store_chunk(
+        cls,
+        cache_key: str,
+        user_id: Optional[str],
+        provider_name: str,
+        prompt_version: str,
+        result: ChunkResult,
+        cutoff: datetime,
+    ) -> None:
+        """Store one chunk result, pruning expired rows periodically."""
+        table = TypoChunkCacheEntry.__table__
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(delete(table).where(table.c.cache_key == cache_key))
+                conn.execute(
+                    insert(table).values(
+                        cache_key=cache_key,
+                        user_id=user_id,
+                        provider=provider_name,
+                        prompt_version=prompt_version,
+                        corrected_text=result.corrected_text,
+                        issues=json.dumps([issue.to_dict() for issue in result.issues]),
+                        created_at=datetime.now(timezone.utc),
+                    )
+                )
+
+                cls._chunk_cache_writes += 1
+                if cls._chunk_cache_writes >= CHUNK_CACHE_PRUNE_INTERVAL:
+                    cls._chunk_cache_writes = 0
+                    conn.execute(delete(table).where(table.c.created_at < cutoff))
+        except IntegrityError:
+            # A concurrent check stored the same chunk first
+            pass
+        except SQLAlchemyError as e:
+            logger.warning(f"Failed to cache chunk result: {e}")
+
+    @staticmethod
+    def _load_cached_chunks(
+        ai_provider: AIProviderInterface,
+        chunks: List[str],
+        user_id: Optional[str],
+    ) -> Tuple[Dict[int, ChunkResult], Optional[Callable[[int, ChunkResult], None]]]:
+        """Look up cached results for chunks in one query.
+
+        Checks the user's own entries and, when TYPO_SHARED_CACHE is on,
+        the shared tier. With the shared tier on, fresh results are stored
+        there only, since it serves the same user too.
+
+        Args:
+            ai_provider: Provider the chunks are checked with
+            chunks: Text chunks in order
+            user_id: Owner of the check (None disables the cache)
+
+        Returns:
+            Tuple of (cached results by chunk index, function storing a
+            fresh result for a chunk index, or None if caching is off)
+        """
+        cutoff = TypoCheckerService._chunk_cache_cutoff() if user_id else None
+        if cutoff is None:
+            return {}, None
+
+        provider_name = ai_provider.provider_name
+        prompt_version = TypoCheckerService._prompt_version(ai_provider)
+        user_keys = {
+            index: TypoCheckerService._chunk_cache_key(
+                user_id, provider_name, prompt_version, chunk
+            )
+            for index, chunk in enumerate(chunks)
+        }
+        shared_keys: Dict[int, str] = {}
+        secret = TypoCheckerService._shared_cache_secret()
+        if secret:
+            shared_keys = {
+                index: TypoCheckerService._shared_chunk_cache_key(
+                    secret, provider_name, prompt_version, chunk
+                )
+                for index, chunk in enumerate(chunks)
+            }
+
+        cached = TypoCheckerService._get_cached_chunks(
+            list(user_keys.values()) + list(shared_keys.values()), cutoff
+        )
+
+        hits: Dict[int, ChunkResult] = {}
+        for index, chunk in enumerate(chunks):
+            entry = cached.get(user_keys[index]) or cached.get(
+                shared_keys.get(index, "")
+            )
+            if entry is None:
+                continue
+            corrected_text, issues = entry
+            hits[index] = ChunkResult(
+                original_text=chunk,
+                corrected_text=corrected_text,
+                issues=[TypoIssue(**issue) for issue in issues],
+                provider=provider_name,
+            )
+
+        store_keys, owner = (shared_keys, None) if shared_keys else (user_keys, user_id)
+
+        def remember(index: int, result: ChunkResult) -> None:
+            # Hedged answers from another provider are not cached under
+            # this provider's key
+            if result.success and result.provider == provider_name:
+                TypoCheckerService._store_chunk(
+                    store_keys[index],
+                    owner,
+                    provider_name,
+                    prompt_version,
+                    result,
+                    cutoff,
+                )
+
+        return hits, remember
+
+    @staticmethod
+    def _find_previous_result(
+        user_id: str, provider_name: str, prompt_version: str, paragraphs: List[str]
+    ) -> Optional[Tuple[TypoCheckResult, SequenceMatcher]]:
+        """Find the user's recent result most similar to the given text.
+
+        Only results from the same provider and prompt version qualify,
+        since issues found under another prompt may no longer apply.
+
+        Args:
+            user_id: Owner of the check
+            provider_name: Provider the text is checked with
+            prompt_version: Current prompt version of that provider
+            paragraphs: New text split into paragraphs
+
+        Returns:
+            Tuple of (previous result, paragraph matcher from its text to
+            the new one), or None if no recent result is similar enough
+        """
+        try:
+            candidates = (
+                TypoCheckResult.query.filter_by(
+                    user_id=user_id,
+                    provider_used=provider_name,
+                    prompt_version=prompt_version,
+                )
+                .order_by(TypoCheckResult.created_at.desc())
+                .limit(INCREMENTAL_CANDIDATES)
+                .all()
+            )
+        except SQLAlchemyError as e:
+            logger.warning(f"Previous result lookup failed: {e}")
+            db.session.rollback()
+            return None
+
+        best = None
+        best_ratio = INCREMENTAL_MIN_SIMILARITY
+        for candidate in candidates:
+            if not candidate.original_text:
+                continue
+            matcher = SequenceMatcher(
+                None,
+                candidate.original_text.splitlines(keepends=True),
+                paragraphs,
+                autojunk=False,
+            )
+            if matcher.quick_ratio() < best_ratio:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= best_ratio:
+                best, best_ratio = (candidate, matcher), ratio
+        return best
+
+    @staticmethod
+    def _plan_chunks(
+        ai_provider: AIProviderInterface, text: str, user_id: str
+    ) -> Tuple[List[str], Dict[int, ChunkResult]]:
+        """Split text into chunks, reusing a previous check where possible.
+
+        The text is diffed paragraph by paragraph against the user's most
+        similar recent result. Runs of unchanged paragraphs become single
+        chunks whose result is built from the previous issues, shifted to
+        their new positions. Nearby changed runs are merged, together with
+        the unchanged paragraphs between them, into regions of up to
+        DEFAULT_CHUNK_SIZE, so scattered edits are checked in context
+        rather than as many tiny requests; each region is chunked as usual.
+        Without a similar result, with TYPO_INCREMENTAL_CHECK off, or when
+        the changes would need more requests than plain chunking, this is
+        plain _chunk_text.
+
+        Args:
+            ai_provider: Provider the text is checked with
+            text: Text to check
+            user_id: Owner of the check
+
+        Returns:
+            Tuple of (chunks covering the text in order, carried-over
+            results by chunk index)
+        """
+        if not user_id or not TypoCheckerService._get_config(
+            "TYPO_INCREMENTAL_CHECK", True
+        ):
+            return TypoCheckerService._chunk_text(text), {}
+
+        provider_name = ai_provider.provider_name
+        paragraphs = text.splitlines(keepends=True)
+        previous = TypoCheckerService._find_previous_result(
+            user_id,
+            provider_name,
+            TypoCheckerService._prompt_version(ai_provider),
+            paragraphs,
+        )
+        if previous is None:
+            return TypoCheckerService._chunk_text(text), {}
+
+        result, matcher = previous
+        old_paragraphs = matcher.a
+        try:
+            old_issues = json.loads(result.issues) if result.issues else []
+        except json.JSONDecodeError:
+            return TypoCheckerService._chunk_text(text), {}
+
+        old_offsets = [0]
+        for paragraph in old_paragraphs:
+            old_offsets.append(old_offsets[-1] + len(paragraph))
+        new_offsets = [0]
+        for paragraph in paragraphs:
+            new_offsets.append(new_offsets[-1] + len(paragraph))
+
+        # (start, end, old paragraph range) in the new text; the range is
+        # None for changed regions
+        plan: List[Tuple[int, int, Optional[Tuple[int, int]]]] = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            start, end = new_offsets[j1], new_offsets[j2]
+            if start == end:
+                continue
+            if tag == "equal":
+                plan.append((start, end, (i1, i2)))
+                continue
+
+            # Absorb a directly preceding changed region, or one separated
+            # only by an unchanged gap, while the whole fits in one chunk
+            merge_from = None
+            if plan and plan[-1][2] is None:
+                merge_from = -1
+            elif len(plan) > 1 and plan[-2][2] is None:
+                merge_from = -2
+            if (
+                merge_from is not None
+                and end - plan[merge_from][0] <= DEFAULT_CHUNK_SIZE
+            ):
+                start = plan[merge_from][0]
+                del plan[merge_from:]
+            plan.append((start, end, None))
+
+        changed = [
+            TypoCheckerService._chunk_text(text[start:end])
+            for start, end, old_range in plan
+            if old_range is None
+        ]
+        plain = TypoCheckerService._chunk_text(text)
+        if sum(len(region) for region in changed) > len(plain):
+            return plain, {}
+
+        chunks: List[str] = []
+        carried: Dict[int, ChunkResult] = {}
+        regions = iter(changed)
+        for new_start, new_end, old_range in plan:
+            if old_range is None:
+                chunks.extend(next(regions))
+                continue
+
+            segment = text[new_start:new_end]
+            start, end = old_offsets[old_range[0]], old_offsets[old_range[1]]
+            issues = [
+                TypoIssue(**{**issue, "position": issue["position"] - start})
+                for issue in old_issues
+                if start <= issue.get("position", -1) < end
+            ]
+            carried[len(chunks)] = ChunkResult(
+                original_text=segment,
+                corrected_text=TypoCheckerService._reconstruct_corrected_text(
+                    segment, [issue.to_dict() for issue in issues]
+                ),
+                issues=issues,
+                provider=provider_name,
+            )
+            chunks.append(segment)
+
+        logger.info(
+            f"Incremental typo check against result {result.id}: "
+            f"{len(chunks) - len(carried)}/{len(chunks)} chunks changed"
+        )
+        return chunks, carried
+
+    @staticmethod
+    def _iter_chunk_results(
+        ai_provider: AIProviderInterface,
+        chunks: List[str],
+        user_id: Optional[str] = None,
+        carried: Optional[Dict[int, ChunkResult]] = None,
+        hedge: bool = False,
+    ) -> Iterator[Tuple[int, ChunkResult]]:
+        """Check chunks concurrently, yielding results as they complete.
+
+        Carried-over results (see _plan_chunks) are yielded first. With a
+        user_id, cached chunks (see _load_cached_chunks) follow without
+        calling the provider, and fresh results are cached.
+        The rest run on a thread pool, up to TYPO_CHUNK_CONCURRENCY at
+        once, each in its own app context. Closing the iterator early
+        (after a failure or cancellation) cancels the chunks that have not
+        started.
+
+        Args:
+            ai_provider: Provider to use
+            chunks: Text chunks in order
+            user_id: Owner of the check, for the chunk cache
+            carried: Results already known for some chunk indexes
+            hedge: Hedge provider calls (see _check_chunk_hedged)
+
+        Yields:
+            Tuple of (chunk index, result) in completion order
+        """
+        carried = carried or {}
+        yield from carried.items()
+
+        hits, store = TypoCheckerService._load_cached_chunks(
+            ai_provider,
+            [chunk for index, chunk in enumerate(chunks) if index not in carried],
+            user_id,
+        )
+        fresh = [index for index in range(len(chunks)) if index not in carried]
+        hits = {fresh[index]: result for index, result in hits.items()}
+        if hits:
+            logger.info(f"Typo chunk cache: {len(hits)}/{len(chunks)} chunks reused")
+        yield from hits.items()
+
+        pending = [index for index in fresh if index not in hits]
+        positions = {index: position for position, index in enumerate(fresh)}
+
+        def remember(index: int, result: ChunkResult) -> None:
+            if store is not None:
+                store(positions[index], result)
+
+        if not pending:
+            return
+
+        check = (
+            TypoCheckerService._check_chunk_hedged
+            if hedge
+            else TypoCheckerService._check_chunk
+        )
+
+        if len(pending) == 1:
+            index = pending[0]
+            result = check(ai_provider, chunks[index])
+            remember(index, result)
+            yield index, result
+            return
+
+        app = current_app._get_current_object() if has_app_context() else None
+
+        def run(chunk: str) -> ChunkResult:
+            if app is None:
+                return check(ai_provider, chunk)
+            with app.app_context():
+                return check(ai_provider, chunk)
+
+        workers = min(
+            len(pending),
+            TypoCheckerService._get_config(
+                "TYPO_CHUNK_CONCURRENCY", DEFAULT_CHUNK_CONCURRENCY
+            ),
+        )
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix="typo-chunk"
+        )
+        try:
+            futures = {executor.submit(run, chunks[index]): index for index in pending}
+            for future in as_completed(futures):
+                index = futures[future]
+                result = future.result()
+                remember(index, result)
+                yield index, result
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _merge_chunk_results(
+        chunks: List[str], results: List[ChunkResult]
+    ) -> Tuple[str, List[Dict]]:
+        """Reassemble chunk results in order.
+
+        Args:
+            chunks: Text chunks in order
+            results: Result for each chunk, in the same order
+
+        Returns:
+            Tuple of (combined corrected text, issues with positions
+            relative to the full text)
+        """
+        all_issues: List[Dict] = []
+        corrected_chunks: List[str] = []
+        current_position = 0
+
+        for chunk, result in zip(chunks, results):
+            corrected_chunks.append(result.corrected_text)
+
+            # Adjust issue positions for chunk offset
+            for issue in result.issues:
+                issue_dict = issue.to_dict()
+                issue_dict["position"] += current_position
+                all_issues.append(issue_dict)
+
+            current_position += len(chunk)
+
+        return "".join(corrected_chunks), all_issues
+
     @staticmethod
     def _reconstruct_corrected_text(original_text: str, issues: List[Dict]) -> str:
         """Reconstruct corrected text by applying issues to original.
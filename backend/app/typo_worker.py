@@ -7,7 +7,9 @@ pauses after consecutive idle checks, resumes when new jobs arrive.
 import logging
 import threading
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
@@ -17,9 +19,15 @@ logger = logging.getLogger(__name__)
 class TypoCheckWorkerManager:
     """Manages the typo check worker with adaptive polling."""
 
-    def __init__(self, interval_seconds: int = 3, max_idle_checks: int = 10):
+    def __init__(
+        self,
+        interval_seconds: int = 3,
+        max_idle_checks: Optional[int] = 10,
+        concurrency: int = 1,
+    ):
         self.interval_seconds = interval_seconds
         self.max_idle_checks = max_idle_checks
+        self.concurrency = concurrency
         self.idle_count = 0
         self.scheduler = None
         self.app = None
@@ -28,12 +36,19 @@ class TypoCheckWorkerManager:
 
     def init_app(self, app):
         """Initialize with Flask application."""
+        if self.scheduler and self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+
         self.app = app
-        self.scheduler = BackgroundScheduler()
+        self._is_running = False
+        self.scheduler = BackgroundScheduler(
+            executors={"default": ThreadPoolExecutor(self.concurrency)}
+        )
         logger.info(
             f"Typo check worker initialized "
             f"(interval: {self.interval_seconds}s, "
-            f"max idle: {self.max_idle_checks})"
+            f"max idle: {self.max_idle_checks}, "
+            f"concurrency: {self.concurrency})"
         )
 
     def _cleanup_stale_jobs(self):
@@ -62,16 +77,11 @@ class TypoCheckWorkerManager:
             return
 
         with self.app.app_context():
-            from app.models.typo_check_job import TypoCheckJob
             from app.services.typo_checker_service import TypoCheckerService
 
             self._cleanup_stale_jobs()
 
-            job = (
-                TypoCheckJob.query.filter_by(status="pending")
-                .order_by(TypoCheckJob.created_at.asc())
-                .first()
-            )
+            job = TypoCheckerService.claim_next_job()
 
             if job:
                 self.idle_count = 0
@@ -79,7 +89,10 @@ class TypoCheckWorkerManager:
                 TypoCheckerService.process_job(job.id)
             else:
                 self.idle_count += 1
-                if self.idle_count >= self.max_idle_checks:
+                if (
+                    self.max_idle_checks is not None
+                    and self.idle_count >= self.max_idle_checks
+                ):
                     self._pause()
 
     def start(self):
@@ -100,6 +113,8 @@ class TypoCheckWorkerManager:
                     id="typo_check_worker",
                     name="Typo Check Worker",
                     replace_existing=True,
+                    max_instances=self.concurrency,
+                    coalesce=True,
                 )
             except Exception:
                 self.scheduler.reschedule_job(
@@ -125,7 +140,13 @@ class TypoCheckWorkerManager:
             logger.info("Typo check worker paused.")
 
     def wake_up(self):
-        """Signal the worker to resume processing."""
+        """Signal the worker to resume processing.
+
+        A no-op when this process has no in-process scheduler.
+        """
+        if self.scheduler is None:
+            return
+
         with self._lock:
             if self._is_running:
                 self.idle_count = 0
@@ -143,7 +164,7 @@ class TypoCheckWorkerManager:
     def shutdown(self):
         """Shutdown the worker scheduler."""
         if self.scheduler and self.scheduler.running:
-            self.scheduler.shutdown()
+            self.scheduler.shutdown(wait=True)
             logger.info("Typo check worker shut down.")
 
     @property
@@ -155,9 +176,15 @@ class TypoCheckWorkerManager:
 typo_check_worker = TypoCheckWorkerManager()
 
 
-def init_typo_worker(app, interval_seconds: int = 3, max_idle_checks: int = 10):
+def init_typo_worker(
+    app,
+    interval_seconds: int = 3,
+    max_idle_checks: Optional[int] = 10,
+    concurrency: int = 1,
+):
     """Initialize and start the typo check worker."""
     typo_check_worker.interval_seconds = interval_seconds
     typo_check_worker.max_idle_checks = max_idle_checks
+    typo_check_worker.concurrency = concurrency
     typo_check_worker.init_app(app)
     typo_check_worker.start()
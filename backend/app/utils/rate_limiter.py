@@ -2,12 +2,21 @@
 
 Thread-safe rate limiter for controlling API request rates.
 Default configuration: 50 requests per second (CrossRef Polite Pool limit).
+Blocking acquires sleep for exactly the time until the next token instead
+of polling, and an asyncio variant is available for async callers.
 """
 
+import asyncio
+import logging
 import threading
 import time
 from typing import Optional
 
+from sqlalchemy import case, delete, insert, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+logger = logging.getLogger(__name__)
+
 
 class RateLimiter:
     """Thread-safe rate limiter using token bucket algorithm.
@@ -21,6 +30,10 @@ class RateLimiter:
         tokens: Current number of available tokens
     """
 
+    # Whether taking a token does blocking I/O, so async callers must run
+    # it off the event loop
+    _blocking_take = False
+
     def __init__(self, rate: int = 50, per_seconds: float = 1.0):
         """Initialize rate limiter.
 
@@ -33,6 +46,8 @@ class RateLimiter:
         self._tokens = float(rate)
         self._last_update = time.monotonic()
         self._lock = threading.Lock()
+        # Waiters sleep on this until a token is due (or reset() is called)
+        self._condition = threading.Condition(self._lock)
 
     @property
     def tokens(self) -> float:
@@ -64,44 +79,228 @@ class RateLimiter:
             return self._acquire_with_wait(timeout)
         return self._try_acquire()
 
-    def _try_acquire(self) -> bool:
-        """Try to acquire a token without waiting."""
-        with self._lock:
-            self._refill()
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """Acquire a token without blocking the event loop.
+
+        Waits with asyncio.sleep. For limiters whose token bucket lives
+        outside the process, each attempt to take a token runs in a worker
+        thread, since it is a database round-trip.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever)
 
-            if self._tokens >= 1:
-                self._tokens -= 1
+        Returns:
+            True if token was acquired, False if timeout exceeded
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            if self._blocking_take:
+                wait = await asyncio.to_thread(self._take_locked)
+            else:
+                wait = self._take_locked()
+            if wait == 0:
                 return True
 
-            return False
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+
+            await asyncio.sleep(wait)
+
+    def _take_locked(self) -> float:
+        """Run _take_or_wait_time under the lock."""
+        with self._lock:
+            return self._take_or_wait_time()
+
+    def _take_or_wait_time(self) -> float:
+        """Take a token if one is available. Caller must hold the lock.
+
+        Returns:
+            0 if a token was taken, otherwise seconds until one is due
+        """
+        self._refill()
+
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+
+        return (1 - self._tokens) * self.per_seconds / self.rate
+
+    def _try_acquire(self) -> bool:
+        """Try to acquire a token without waiting."""
+        with self._lock:
+            return self._take_or_wait_time() == 0
 
     def _acquire_with_wait(self, timeout: Optional[float]) -> bool:
         """Acquire a token, waiting if necessary.
 
+        Sleeps on a condition variable for exactly the time until the next
+        token is due, so waiters neither poll nor wake up early.
+
         Args:
             timeout: Maximum time to wait in seconds
 
         Returns:
             True if token was acquired, False if timeout exceeded
         """
-        start_time = time.monotonic()
-        poll_interval = 0.01  # 10ms polling interval
+        deadline = None if timeout is None else time.monotonic() + timeout
 
-        while True:
-            if self._try_acquire():
-                return True
+        with self._condition:
+            while True:
+                wait = self._take_or_wait_time()
+                if wait == 0:
+                    return True
 
-            # Check timeout
-            if timeout is not None:
-                elapsed = time.monotonic() - start_time
-                if elapsed >= timeout:
-                    return False
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    wait = min(wait, remaining)
 
-            # Small sleep to avoid busy waiting
-            time.sleep(poll_interval)
+                self._condition.wait(wait)
 
     def reset(self) -> None:
         """Reset the rate limiter to full capacity."""
-        with self._lock:
+        with self._condition:
             self._tokens = float(self.rate)
             self._last_update = time.monotonic()
+            self._condition.notify_all()
+
+
+class DatabaseRateLimiter(RateLimiter):
+    """Token bucket whose state lives in the rate_limit_buckets table.
+
+    Every process using the same bucket name shares one budget, so the
+    limit holds globally no matter how many web and worker processes
+    make requests. Each acquire is a single guarded UPDATE that refills
+    and takes a token atomically (row lock on PostgreSQL, database lock
+    on SQLite). Waiting still happens locally, for exactly the time until
+    the shared bucket's next token is due.
+
+    If the database is unavailable the limiter falls back to its
+    in-process bucket rather than blocking requests.
+    """
+
+    _blocking_take = True
+
+    def __init__(
+        self,
+        engine,
+        name: str,
+        rate: int = 50,
+        per_seconds: float = 1.0,
+    ):
+        """Initialize shared rate limiter.
+
+        Args:
+            engine: SQLAlchemy engine holding the rate_limit_buckets table
+            name: Bucket name shared by all processes
+            rate: Maximum requests per time period (default 50)
+            per_seconds: Time period in seconds (default 1.0)
+        """
+        super().__init__(rate=rate, per_seconds=per_seconds)
+        self.engine = engine
+        self.name = name
+
+    @staticmethod
+    def _table():
+        """Return the rate_limit_buckets table.
+
+        Imported lazily so this utility does not depend on the models
+        package at import time.
+        """
+        from app.models.rate_limit_bucket import RateLimitBucket
+
+        return RateLimitBucket.__table__
+
+    @property
+    def tokens(self) -> float:
+        """Get the shared bucket's current token count."""
+        table = self._table()
+        try:
+            with self.engine.connect() as conn:
+                row = conn.execute(
+                    select(table.c.tokens, table.c.updated_at).where(
+                        table.c.name == self.name
+                    )
+                ).first()
+        except SQLAlchemyError:
+            return super().tokens
+
+        if row is None:
+            return float(self.rate)
+        return self._refilled(row.tokens, row.updated_at, time.time())
+
+    def _refilled(self, tokens: float, updated_at: float, now: float) -> float:
+        """Token count after refilling for the time since updated_at."""
+        elapsed = max(0.0, now - updated_at)
+        return min(float(self.rate), tokens + elapsed * self.rate / self.per_seconds)
+
+    def _take_or_wait_time(self) -> float:
+        """Take a token from the shared bucket if one is available.
+
+        Returns:
+            0 if a token was taken, otherwise seconds until one is due
+        """
+        table = self._table()
+        now = time.time()
+
+        elapsed = case((table.c.updated_at > now, 0.0), else_=now - table.c.updated_at)
+        refilled = table.c.tokens + elapsed * (self.rate / self.per_seconds)
+        capped = case((refilled > self.rate, float(self.rate)), else_=refilled)
+
+        # A second attempt is only needed if another process creates the
+        # bucket between our UPDATE and INSERT
+        for attempt in range(2):
+            try:
+                with self.engine.begin() as conn:
+                    taken = conn.execute(
+                        update(table)
+                        .where(table.c.name == self.name, capped >= 1)
+                        .values(tokens=capped - 1, updated_at=now)
+                        .returning(table.c.name)
+                    ).first()
+                    if taken is not None:
+                        return 0.0
+
+                    row = conn.execute(
+                        select(table.c.tokens, table.c.updated_at).where(
+                            table.c.name == self.name
+                        )
+                    ).first()
+                    if row is None:
+                        conn.execute(
+                            insert(table).values(
+                                name=self.name, tokens=self.rate - 1.0, updated_at=now
+                            )
+                        )
+                        return 0.0
+                break
+
+            except IntegrityError:
+                # Another process created the bucket first; retry against it
+                if attempt:
+                    return super()._take_or_wait_time()
+
+            except SQLAlchemyError as e:
+                logger.warning(
+                    f"Shared rate limiter unavailable, using local bucket: {e}"
+                )
+                return super()._take_or_wait_time()
+
+        refilled = self._refilled(row.tokens, row.updated_at, now)
+        return max((1 - refilled) * self.per_seconds / self.rate, 0.001)
+
+    def reset(self) -> None:
+        """Reset the shared bucket to full capacity."""
+        table = self._table()
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(delete(table).where(table.c.name == self.name))
+        except SQLAlchemyError as e:
+            logger.warning(f"Could not reset shared rate limiter: {e}")
+
+        super().reset()
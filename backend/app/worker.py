@@ -6,6 +6,9 @@ pauses after consecutive idle checks, resumes when new uploads arrive.
 
 import logging
 import threading
+from typing import Optional
+
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
@@ -23,9 +26,15 @@ class ExtractionWorkerManager:
     When new uploads arrive, the worker is signaled to resume.
     """
 
-    def __init__(self, interval_seconds: int = 5, max_idle_checks: int = 10):
+    def __init__(
+        self,
+        interval_seconds: int = 5,
+        max_idle_checks: Optional[int] = 10,
+        concurrency: int = 1,
+    ):
         self.interval_seconds = interval_seconds
         self.max_idle_checks = max_idle_checks
+        self.concurrency = concurrency
         self.idle_count = 0
         self.scheduler = None
         self.app = None
@@ -38,12 +47,19 @@ class ExtractionWorkerManager:
         Args:
             app: Flask application instance
         """
+        if self.scheduler and self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+
         self.app = app
-        self.scheduler = BackgroundScheduler()
+        self._is_running = False
+        self.scheduler = BackgroundScheduler(
+            executors={"default": ThreadPoolExecutor(self.concurrency)}
+        )
         logger.info(
             f"Extraction worker initialized "
             f"(interval: {self.interval_seconds}s, "
-            f"max idle: {self.max_idle_checks})"
+            f"max idle: {self.max_idle_checks}, "
+            f"concurrency: {self.concurrency})"
         )
 
     def _process_queue(self):
@@ -52,23 +68,23 @@ class ExtractionWorkerManager:
             return
 
         with self.app.app_context():
-            from app.services.extraction_service import ExtractionService
-            from app.models.extraction_queue import ExtractionQueue
+            from app.services.extraction_service import (
+                DEFAULT_BATCH_SIZE,
+                ExtractionService,
+            )
 
-            pending_count = ExtractionQueue.query.filter_by(status="pending").count()
+            batch_size = self.app.config.get("EXTRACTION_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+            processed, errors = ExtractionService.process_batch(batch_size)
 
-            if pending_count > 0:
+            if processed > 0:
                 # Reset idle count when there's work
                 self.idle_count = 0
                 logger.info(
-                    f"Processing extraction queue. {pending_count} items pending."
+                    f"Processed {processed} extraction items "
+                    f"({processed - len(errors)} succeeded, {len(errors)} failed)."
                 )
 
-                success, error = ExtractionService.process_next()
-
-                if success:
-                    logger.info("Successfully processed one extraction item.")
-                elif error:
+                for error in errors:
                     logger.warning(f"Extraction failed: {error}")
             else:
                 # Increment idle count
@@ -77,7 +93,10 @@ class ExtractionWorkerManager:
                     f"Queue empty. Idle count: {self.idle_count}/{self.max_idle_checks}"
                 )
 
-                if self.idle_count >= self.max_idle_checks:
+                if (
+                    self.max_idle_checks is not None
+                    and self.idle_count >= self.max_idle_checks
+                ):
                     logger.info(
                         f"No work for {self.max_idle_checks} checks. "
                         "Pausing worker until next upload."
@@ -103,6 +122,8 @@ class ExtractionWorkerManager:
                     id="extraction_worker",
                     name="PDF Extraction Worker",
                     replace_existing=True,
+                    max_instances=self.concurrency,
+                    coalesce=True,
                 )
             except Exception:
                 # Job might already exist, reschedule it
@@ -131,8 +152,13 @@ class ExtractionWorkerManager:
     def wake_up(self):
         """Signal the worker to resume processing.
 
-        Call this when new documents are uploaded.
+        Call this when new documents are uploaded. A no-op in web
+        processes that run without an in-process scheduler; the
+        dedicated worker process polls the queue on its own.
         """
+        if self.scheduler is None:
+            return
+
         with self._lock:
             if self._is_running:
                 # Already running, just reset idle count
@@ -152,7 +178,7 @@ class ExtractionWorkerManager:
     def shutdown(self):
         """Shutdown the worker scheduler."""
         if self.scheduler and self.scheduler.running:
-            self.scheduler.shutdown()
+            self.scheduler.shutdown(wait=True)
             logger.info("Extraction worker shut down.")
 
     @property
@@ -165,40 +191,23 @@ class ExtractionWorkerManager:
 extraction_worker = ExtractionWorkerManager()
 
 
-def init_worker(app, interval_seconds: int = 5, max_idle_checks: int = 10):
+def init_worker(
+    app,
+    interval_seconds: int = 5,
+    max_idle_checks: Optional[int] = 10,
+    concurrency: int = 1,
+):
     """Initialize and start the extraction worker.
 
     Args:
         app: Flask application instance
         interval_seconds: Polling interval in seconds
         max_idle_checks: Number of idle checks before pausing
+            (None keeps polling forever, as in the dedicated worker process)
+        concurrency: Maximum number of queue items processed in parallel
     """
     extraction_worker.interval_seconds = interval_seconds
     extraction_worker.max_idle_checks = max_idle_checks
+    extraction_worker.concurrency = concurrency
     extraction_worker.init_app(app)
     extraction_worker.start()
-
-
-def run_worker():
-    """Run the extraction worker as a standalone process."""
-    import os
-    import time
-    from app import create_app
-
-    config_name = os.environ.get("FLASK_CONFIG", "development")
-    app = create_app(config_name)
-
-    logger.info("Starting PDF extraction worker (standalone mode)...")
-
-    init_worker(app)
-
-    try:
-        while True:
-            time.sleep(1)
-    except (KeyboardInterrupt, SystemExit):
-        logger.info("Shutting down extraction worker...")
-        extraction_worker.shutdown()
-
-
-if __name__ == "__main__":
-    run_worker()
@@ -0,0 +1,159 @@
+"""Synthetic PDF corpus generator for extraction benchmarks.
+
+Generates reproducible PDFs with reportlab: configurable page counts,
+a Korean/English text mix and single- or multi-column layouts. Korean
+text uses reportlab's built-in Adobe-Korea1 CID font, so no font files
+are needed.
+"""
+
+import os
+import random
+from dataclasses import dataclass
+from typing import List
+
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+from reportlab.pdfgen import canvas
+
+KOREAN_FONT = "HYSMyeongJo-Medium"
+ENGLISH_FONT = "Helvetica"
+FONT_SIZE = 10
+LINE_HEIGHT = 13
+MARGIN = 56
+COLUMN_GAP = 18
+
+KOREAN_WORDS = [
+    "검색", "문서", "연구", "결과", "분석", "데이터", "시스템", "방법",
+    "실험", "모델", "성능", "한국어", "텍스트", "추출", "논문", "학습",
+    "평가", "구조", "처리", "정확도", "속도", "사용자", "질의", "색인",
+]
+
+ENGLISH_WORDS = [
+    "search", "document", "research", "result", "analysis", "data",
+    "system", "method", "experiment", "model", "performance", "text",
+    "extraction", "paper", "learning", "evaluation", "structure",
+    "processing", "accuracy", "latency", "user", "query", "index", "corpus",
+]
+
+
+@dataclass
+class CorpusDocument:
+    """A generated benchmark PDF.
+
+    Attributes:
+        path: Path to the PDF file
+        pages: Number of pages
+        size_bytes: File size in bytes
+    """
+
+    path: str
+    pages: int
+    size_bytes: int
+
+
+def _register_fonts() -> None:
+    """Register the Korean CID font once."""
+    if KOREAN_FONT not in pdfmetrics.getRegisteredFontNames():
+        pdfmetrics.registerFont(UnicodeCIDFont(KOREAN_FONT))
+
+
+def _make_line(rng: random.Random, korean_ratio: float, words: int) -> str:
+    """Build one line of mixed Korean/English words."""
+    return " ".join(
+        rng.choice(KOREAN_WORDS if rng.random() < korean_ratio else ENGLISH_WORDS)
+        for _ in range(words)
+    )
+
+
+def _draw_page(
+    pdf: canvas.Canvas,
+    rng: random.Random,
+    page_number: int,
+    korean_ratio: float,
+    columns: int,
+) -> None:
+    """Fill one page with columns of text."""
+    width, height = A4
+    column_width = (width - 2 * MARGIN - (columns - 1) * COLUMN_GAP) / columns
+    words_per_line = max(3, int(column_width / 42))
+    lines_per_column = int((height - 2 * MARGIN) / LINE_HEIGHT) - 2
+
+    pdf.setFont(ENGLISH_FONT, FONT_SIZE + 2)
+    pdf.drawString(MARGIN, height - MARGIN + 14, f"Benchmark page {page_number}")
+
+    # The CID font also covers Latin text, so mixed lines use one font
+    pdf.setFont(KOREAN_FONT if korean_ratio > 0 else ENGLISH_FONT, FONT_SIZE)
+
+    for column in range(columns):
+        x = MARGIN + column * (column_width + COLUMN_GAP)
+        y = height - MARGIN - LINE_HEIGHT
+        for _ in range(lines_per_column):
+            pdf.drawString(x, y, _make_line(rng, korean_ratio, words_per_line))
+            y -= LINE_HEIGHT
+
+
+def generate_document(
+    path: str,
+    pages: int,
+    korean_ratio: float = 0.5,
+    columns: int = 1,
+    seed: int = 0,
+) -> CorpusDocument:
+    """Generate a single synthetic PDF.
+
+    Args:
+        path: Output file path
+        pages: Number of pages
+        korean_ratio: Fraction of words drawn from the Korean vocabulary
+        columns: Number of text columns per page
+        seed: Random seed for reproducible content
+
+    Returns:
+        CorpusDocument describing the generated file
+    """
+    _register_fonts()
+    rng = random.Random(seed)
+
+    pdf = canvas.Canvas(path, pagesize=A4)
+    for page_number in range(1, pages + 1):
+        _draw_page(pdf, rng, page_number, korean_ratio, columns)
+        pdf.showPage()
+    pdf.save()
+
+    return CorpusDocument(path=path, pages=pages, size_bytes=os.path.getsize(path))
+
+
+def generate_corpus(
+    output_dir: str,
+    documents: int,
+    pages: int,
+    korean_ratio: float = 0.5,
+    columns: int = 1,
+    seed: int = 0,
+) -> List[CorpusDocument]:
+    """Generate a corpus of synthetic PDFs.
+
+    Args:
+        output_dir: Directory to write PDFs into (created if missing)
+        documents: Number of documents
+        pages: Pages per document
+        korean_ratio: Fraction of Korean words
+        columns: Text columns per page
+        seed: Base random seed
+
+    Returns:
+        List of generated documents
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    return [
+        generate_document(
+            os.path.join(output_dir, f"bench_{index:04d}.pdf"),
+            pages=pages,
+            korean_ratio=korean_ratio,
+            columns=columns,
+            seed=seed + index,
+        )
+        for index in range(documents)
+    ]
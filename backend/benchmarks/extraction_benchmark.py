@@ -0,0 +1,232 @@
+"""Extraction throughput benchmark.
+
+Generates a synthetic corpus, then measures two phases against it:
+
+- extract_text: ExtractionService.extract_text for every document
+- pipeline: add_to_queue + process_batch until the queue is drained
+  (claiming, extraction and status writes)
+
+Results are printed as JSON (pages/sec, peak RSS, DB time) so runs can be
+compared across commits.
+
+Usage (from backend/):
+    python -m benchmarks.extraction_benchmark --documents 20 --pages 10 \\
+        --korean-ratio 0.5 --columns 2 --mode balanced --output result.json
+"""
+
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from benchmarks.corpus import CorpusDocument, generate_corpus
+
+
+class QueryTimer:
+    """Accumulate time spent executing SQL statements on an engine."""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+
+        self.total_seconds = 0.0
+        self.statements = 0
+        self._local = threading.local()
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        self._local.started = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        self.total_seconds += time.perf_counter() - self._local.started
+        self.statements += 1
+
+    def reset(self) -> None:
+        """Reset accumulated totals."""
+        self.total_seconds = 0.0
+        self.statements = 0
+
+
+def _peak_rss_mb() -> Dict[str, float]:
+    """Return peak RSS of this process and its children in megabytes."""
+    # ru_maxrss is KB on Linux and bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale,
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale,
+    }
+
+
+def _phase_result(
+    pages: int, elapsed: float, timer: QueryTimer, errors: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Build the result record for one phase."""
+    return {
+        "pages": pages,
+        "seconds": round(elapsed, 4),
+        "pages_per_second": round(pages / elapsed, 2) if elapsed else None,
+        "db_seconds": round(timer.total_seconds, 4),
+        "db_statements": timer.statements,
+        "db_share": round(timer.total_seconds / elapsed, 4) if elapsed else None,
+        "errors": errors or [],
+    }
+
+
+def run_benchmark(
+    app,
+    corpus: List[CorpusDocument],
+    mode: str = "balanced",
+    batch_size: int = 5,
+) -> Dict[str, Any]:
+    """Run both benchmark phases against a generated corpus.
+
+    Args:
+        app: Flask application whose database is used
+        corpus: Generated documents
+        mode: Extraction mode (fast, balanced, precise)
+        batch_size: Queue items claimed per process_batch call
+
+    Returns:
+        Dictionary of benchmark results
+    """
+    from app.models import db
+    from app.models.document import SearchDocument
+    from app.models.user import User
+    from app.services.extraction_service import ExtractionService
+
+    with app.app_context():
+        db.create_all()
+        timer = QueryTimer(db.engine)
+
+        user = User(
+            email=f"bench-{time.time_ns()}@example.com",
+            name="Benchmark",
+            password="benchmark",
+        )
+        db.session.add(user)
+        db.session.commit()
+
+        documents = []
+        for item in corpus:
+            document = SearchDocument(
+                owner_id=user.id,
+                filename=os.path.basename(item.path),
+                original_filename=os.path.basename(item.path),
+                file_path=item.path,
+                file_size_bytes=item.size_bytes,
+            )
+            db.session.add(document)
+            documents.append(document)
+        db.session.commit()
+
+        total_pages = sum(item.pages for item in corpus)
+
+        # Phase 1: ExtractionService.extract_text
+        timer.reset()
+        started = time.perf_counter()
+        for document in documents:
+            ExtractionService.extract_text(document.id, mode=mode)
+        extract_result = _phase_result(
+            total_pages, time.perf_counter() - started, timer
+        )
+
+        # Phase 2: full queue pipeline
+        for document in documents:
+            ExtractionService.add_to_queue(document.id)
+
+        timer.reset()
+        started = time.perf_counter()
+        errors: List[str] = []
+        while True:
+            claimed, batch_errors = ExtractionService.process_batch(batch_size, mode)
+            if claimed == 0:
+                break
+            errors.extend(batch_errors)
+        pipeline_result = _phase_result(
+            total_pages, time.perf_counter() - started, timer, errors
+        )
+
+        return {
+            "config": {
+                "documents": len(corpus),
+                "pages_per_document": corpus[0].pages if corpus else 0,
+                "total_bytes": sum(item.size_bytes for item in corpus),
+                "mode": mode,
+                "batch_size": batch_size,
+                "sandbox": app.config.get("EXTRACTION_SANDBOX_ENABLED", True),
+                "database": db.engine.url.render_as_string(hide_password=True),
+            },
+            "extract_text": extract_result,
+            "pipeline": pipeline_result,
+            "peak_rss_mb": _peak_rss_mb(),
+        }
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--documents", type=int, default=10)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--korean-ratio", type=float, default=0.5)
+    parser.add_argument("--columns", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--mode", choices=["fast", "balanced", "precise"], default="balanced"
+    )
+    parser.add_argument("--batch-size", type=int, default=5)
+    parser.add_argument(
+        "--no-sandbox", action="store_true", help="Extract in-process"
+    )
+    parser.add_argument(
+        "--database-url",
+        default="sqlite:///:memory:",
+        help="Database to write pages into (default: in-memory SQLite)",
+    )
+    parser.add_argument(
+        "--corpus-dir", help="Keep the generated corpus in this directory"
+    )
+    parser.add_argument("--output", help="Write JSON results to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    args = _parse_args(argv)
+
+    # Must be set before the app config is imported
+    os.environ["TEST_DATABASE_URL"] = args.database_url
+    os.environ["ENABLE_EXTRACTION_WORKER"] = "false"
+    os.environ["ENABLE_TYPO_CHECK_WORKER"] = "false"
+    os.environ["ENABLE_METADATA_WORKER"] = "false"
+    if args.no_sandbox:
+        os.environ["EXTRACTION_SANDBOX_ENABLED"] = "false"
+
+    from app import create_app
+
+    app = create_app("testing")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        corpus = generate_corpus(
+            args.corpus_dir or temp_dir,
+            documents=args.documents,
+            pages=args.pages,
+            korean_ratio=args.korean_ratio,
+            columns=args.columns,
+            seed=args.seed,
+        )
+        results = run_benchmark(app, corpus, args.mode, args.batch_size)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
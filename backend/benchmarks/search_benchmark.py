@@ -0,0 +1,422 @@
+"""Search latency benchmark.
+
+Seeds users x documents x pages of mixed Korean/English text, then replays
+a mixed query workload against SearchService.search (``service`` target)
+or the /api/search route through the Flask test client (``route``
+target). Latency percentiles and queries/sec are printed as JSON, overall
+and per query kind:
+
+- short_korean: two-character Korean terms that match most pages
+- common: frequent English words
+- phrase: four-word phrases copied from seeded pages
+- rare: terms planted on a small fraction of pages
+- miss: terms that match nothing (full scan, no results)
+- deep_offset: common words requested at a large result offset
+
+Usage (from backend/):
+    python -m benchmarks.search_benchmark --users 5 --documents 20 \\
+        --pages 20 --queries 500 --target service
+    python -m benchmarks.search_benchmark --database-url \\
+        postgresql://localhost/pdf_search_bench --concurrency 8 --target route
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks.corpus import ENGLISH_WORDS, KOREAN_WORDS
+
+QUERY_KINDS = ["short_korean", "common", "phrase", "rare", "miss", "deep_offset"]
+
+RARE_TERM_COUNT = 50
+# Chance that a page contains one of the rare terms
+RARE_TERM_PROBABILITY = 0.2
+PHRASE_SAMPLES = 200
+PAGE_INSERT_BATCH = 1000
+
+
+def _rare_term(index: int) -> str:
+    return f"희귀어{index:03d}"
+
+
+def _page_text(rng: random.Random, words: int, korean_ratio: float) -> str:
+    """Build one page of mixed text, occasionally planting a rare term."""
+    tokens = [
+        rng.choice(KOREAN_WORDS if rng.random() < korean_ratio else ENGLISH_WORDS)
+        for _ in range(words)
+    ]
+    if rng.random() < RARE_TERM_PROBABILITY:
+        tokens[rng.randrange(words)] = _rare_term(rng.randrange(RARE_TERM_COUNT))
+    return " ".join(tokens)
+
+
+def seed_database(
+    app,
+    users: int,
+    documents: int,
+    pages: int,
+    words_per_page: int = 300,
+    korean_ratio: float = 0.5,
+    seed: int = 0,
+) -> Tuple[List[str], List[Tuple[str, str]]]:
+    """Seed completed documents with page text.
+
+    Args:
+        app: Flask application whose database is seeded
+        users: Number of users
+        documents: Documents per user
+        pages: Pages per document
+        words_per_page: Words of text per page
+        korean_ratio: Fraction of Korean words
+        seed: Random seed for reproducible content
+
+    Returns:
+        Tuple of (user ids, (owner id, phrase) samples from seeded pages)
+    """
+    from sqlalchemy import insert
+
+    from app.models import db
+    from app.models.document import SearchDocument
+    from app.models.page import SearchPage
+    from app.models.user import User
+    from app.services.extraction_service import ExtractionService
+
+    rng = random.Random(seed)
+    phrases: List[Tuple[str, str]] = []
+
+    with app.app_context():
+        db.create_all()
+
+        # Unique per run, so reseeding a persistent database adds users
+        # instead of colliding with an earlier run's emails
+        run_id = time.time_ns()
+        user_ids = []
+        for index in range(users):
+            user = User(
+                email=f"bench-search-{run_id}-{index}@example.com",
+                name=f"Benchmark {index}",
+                password="benchmark",
+                approval_status="approved",
+            )
+            db.session.add(user)
+            db.session.flush()
+            user_ids.append(user.id)
+
+            for doc_index in range(documents):
+                document = SearchDocument(
+                    owner_id=user.id,
+                    filename=f"bench_{index}_{doc_index}.pdf",
+                    original_filename=f"bench_{index}_{doc_index}.pdf",
+                    file_path=f"benchmark/bench_{index}_{doc_index}.pdf",
+                    page_count=pages,
+                    extraction_status="completed",
+                )
+                db.session.add(document)
+            db.session.flush()
+
+        documents_by_owner = db.session.execute(
+            db.select(SearchDocument.id, SearchDocument.owner_id)
+            .where(SearchDocument.owner_id.in_(user_ids))
+        ).all()
+
+        rows = []
+        for document_id, owner_id in documents_by_owner:
+            for page_number in range(1, pages + 1):
+                text = _page_text(rng, words_per_page, korean_ratio)
+                if len(phrases) < PHRASE_SAMPLES and rng.random() < 0.1:
+                    words = text.split()
+                    start = rng.randrange(max(1, len(words) - 4))
+                    phrases.append((owner_id, " ".join(words[start:start + 4])))
+                rows.append({
+                    "document_id": document_id,
+                    "page_number": page_number,
+                    "content": text,
+                    "content_normalized": ExtractionService.normalize_text(text),
+                })
+                if len(rows) >= PAGE_INSERT_BATCH:
+                    db.session.execute(insert(SearchPage), rows)
+                    rows = []
+        if rows:
+            db.session.execute(insert(SearchPage), rows)
+
+        db.session.commit()
+
+    return user_ids, phrases or [(user_ids[0], ENGLISH_WORDS[0])]
+
+
+def build_workload(
+    count: int,
+    user_ids: List[str],
+    phrases: List[Tuple[str, str]],
+    kinds: List[str] = QUERY_KINDS,
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    """Build a reproducible list of queries.
+
+    Args:
+        count: Number of queries
+        user_ids: Users to search as
+        phrases: (owner id, phrase) pairs known to exist in seeded pages
+        kinds: Query kinds to mix (evenly)
+        seed: Random seed
+
+    Returns:
+        List of query dicts with kind, user_id, q, limit and offset
+    """
+    rng = random.Random(seed)
+    workload = []
+
+    for index in range(count):
+        kind = kinds[index % len(kinds)]
+        user_id = rng.choice(user_ids)
+        offset = 0
+        if kind == "short_korean":
+            q = rng.choice([word for word in KOREAN_WORDS if len(word) == 2])
+        elif kind == "common":
+            q = rng.choice(ENGLISH_WORDS)
+        elif kind == "phrase":
+            user_id, q = rng.choice(phrases)
+        elif kind == "rare":
+            q = _rare_term(rng.randrange(RARE_TERM_COUNT))
+        elif kind == "miss":
+            q = f"없는단어{rng.randrange(10000)}"
+        else:
+            q = rng.choice(ENGLISH_WORDS)
+            offset = rng.choice([200, 500, 1000])
+
+        workload.append({
+            "kind": kind,
+            "user_id": user_id,
+            "q": q,
+            "limit": 50,
+            "offset": offset,
+        })
+
+    rng.shuffle(workload)
+    return workload
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies: List[float], elapsed: float) -> Dict[str, Any]:
+    """Summarize latencies (seconds) into milliseconds and throughput."""
+    ordered = sorted(latencies)
+    return {
+        "queries": len(ordered),
+        "p50_ms": round(_percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(_percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(_percentile(ordered, 99) * 1000, 3),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0,
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+        "qps": round(len(ordered) / elapsed, 2) if elapsed else None,
+    }
+
+
+def _make_runner(app, target: str):
+    """Return a callable that executes one query and returns its total."""
+    from app.services.search_service import SearchService
+    from app.utils.auth import create_access_token
+
+    if target == "service":
+        def run(query: Dict[str, Any]) -> int:
+            with app.app_context():
+                _, total = SearchService.search(
+                    query["user_id"], query["q"], query["limit"], query["offset"]
+                )
+                return total
+        return run
+
+    tokens: Dict[str, str] = {}
+    local = threading.local()
+
+    def run(query: Dict[str, Any]) -> int:
+        if not hasattr(local, "client"):
+            local.client = app.test_client()
+        user_id = query["user_id"]
+        if user_id not in tokens:
+            with app.app_context():
+                tokens[user_id] = create_access_token(user_id)
+        response = local.client.get(
+            "/api/search",
+            query_string={
+                "q": query["q"],
+                "limit": query["limit"],
+                "offset": query["offset"],
+            },
+            headers={"Authorization": f"Bearer {tokens[user_id]}"},
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"/api/search returned {response.status_code}")
+        return response.get_json()["total"]
+
+    return run
+
+
+def run_benchmark(
+    app,
+    workload: List[Dict[str, Any]],
+    target: str = "service",
+    concurrency: int = 1,
+    warmup: int = 20,
+) -> Dict[str, Any]:
+    """Replay a workload and measure latency.
+
+    Args:
+        app: Flask application to search against
+        workload: Queries from build_workload
+        target: "service" (SearchService.search) or "route" (/api/search)
+        concurrency: Number of client threads
+        warmup: Queries run first and excluded from the results
+
+    Returns:
+        Dictionary of benchmark results
+    """
+    run = _make_runner(app, target)
+
+    for query in workload[:warmup]:
+        run(query)
+
+    measured = workload[warmup:] or workload
+    timings: List[Tuple[str, float, int]] = []
+
+    def timed(query: Dict[str, Any]) -> Tuple[str, float, int]:
+        started = time.perf_counter()
+        total = run(query)
+        return query["kind"], time.perf_counter() - started, total
+
+    started = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            timings = list(executor.map(timed, measured))
+    else:
+        timings = [timed(query) for query in measured]
+    elapsed = time.perf_counter() - started
+
+    by_kind: Dict[str, Dict[str, Any]] = {}
+    for kind in sorted({kind for kind, _, _ in timings}):
+        kind_latencies = [latency for k, latency, _ in timings if k == kind]
+        kind_totals = [total for k, _, total in timings if k == kind]
+        by_kind[kind] = summarize(kind_latencies, sum(kind_latencies))
+        by_kind[kind]["mean_total_results"] = round(
+            sum(kind_totals) / len(kind_totals), 1
+        )
+
+    return {
+        "target": target,
+        "concurrency": concurrency,
+        "overall": summarize([latency for _, latency, _ in timings], elapsed),
+        "by_kind": by_kind,
+    }
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--users", type=int, default=5)
+    parser.add_argument("--documents", type=int, default=20, help="Per user")
+    parser.add_argument("--pages", type=int, default=20, help="Per document")
+    parser.add_argument("--words-per-page", type=int, default=300)
+    parser.add_argument("--korean-ratio", type=float, default=0.5)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument(
+        "--kinds",
+        default=",".join(QUERY_KINDS),
+        help="Comma-separated query kinds to mix",
+    )
+    parser.add_argument("--target", choices=["service", "route"], default="service")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--database-url",
+        default="sqlite:///:memory:",
+        help="Database to seed and search (default: in-memory SQLite)",
+    )
+    parser.add_argument("--output", help="Write JSON results to this file")
+
+    args = parser.parse_args(argv)
+
+    unknown = set(args.kinds.split(",")) - set(QUERY_KINDS)
+    if unknown:
+        parser.error(f"unknown query kinds: {', '.join(sorted(unknown))}")
+    if args.concurrency > 1 and ":memory:" in args.database_url:
+        # The in-memory database is a single shared connection
+        parser.error("--concurrency > 1 needs a file or PostgreSQL database")
+
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    args = _parse_args(argv)
+
+    # Must be set before the app config is imported
+    os.environ["TEST_DATABASE_URL"] = args.database_url
+    os.environ["ENABLE_EXTRACTION_WORKER"] = "false"
+    os.environ["ENABLE_TYPO_CHECK_WORKER"] = "false"
+    os.environ["ENABLE_METADATA_WORKER"] = "false"
+
+    from app import create_app
+
+    app = create_app("testing")
+
+    seed_started = time.perf_counter()
+    user_ids, phrases = seed_database(
+        app,
+        users=args.users,
+        documents=args.documents,
+        pages=args.pages,
+        words_per_page=args.words_per_page,
+        korean_ratio=args.korean_ratio,
+        seed=args.seed,
+    )
+    seed_seconds = time.perf_counter() - seed_started
+
+    workload = build_workload(
+        args.queries + args.warmup,
+        user_ids,
+        phrases,
+        kinds=args.kinds.split(","),
+        seed=args.seed,
+    )
+    results = run_benchmark(
+        app, workload, args.target, args.concurrency, args.warmup
+    )
+
+    with app.app_context():
+        from app.models import db
+
+        database = db.engine.url.render_as_string(hide_password=True)
+
+    results["config"] = {
+        "users": args.users,
+        "documents_per_user": args.documents,
+        "pages_per_document": args.pages,
+        "total_pages": args.users * args.documents * args.pages,
+        "words_per_page": args.words_per_page,
+        "database": database,
+        "seed_seconds": round(seed_seconds, 2),
+    }
+
+    output = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
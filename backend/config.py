@@ -30,6 +30,103 @@ class Config:
     MAX_CONTENT_LENGTH = 50 * 1024 * 1024  # 50MB max file size
     ALLOWED_EXTENSIONS = {"pdf"}
 
+    # Background workers
+    # Web processes only start the in-process schedulers when these are
+    # enabled. Production runs them in a dedicated `flask run-workers`
+    # process instead (deploy/pdf-search-worker.service).
+    ENABLE_EXTRACTION_WORKER = (
+        os.getenv("ENABLE_EXTRACTION_WORKER", "true").lower() == "true"
+    )
+    ENABLE_TYPO_CHECK_WORKER = (
+        os.getenv("ENABLE_TYPO_CHECK_WORKER", "true").lower() == "true"
+    )
+    ENABLE_METADATA_WORKER = (
+        os.getenv("ENABLE_METADATA_WORKER", "true").lower() == "true"
+    )
+    EXTRACTION_WORKER_INTERVAL = int(os.getenv("EXTRACTION_WORKER_INTERVAL", "5"))
+    EXTRACTION_WORKER_CONCURRENCY = int(
+        os.getenv("EXTRACTION_WORKER_CONCURRENCY", "1")
+    )
+    EXTRACTION_BATCH_SIZE = int(os.getenv("EXTRACTION_BATCH_SIZE", "5"))
+
+    # Extraction engine mode: fast, balanced or precise (precise is about
+    # ten times slower than balanced; see app/services/extraction_engines.py)
+    EXTRACTION_MODE = os.getenv("EXTRACTION_MODE", "balanced")
+
+    # Extraction sandbox: pdfplumber runs in a supervised child process
+    EXTRACTION_SANDBOX_ENABLED = (
+        os.getenv("EXTRACTION_SANDBOX_ENABLED", "true").lower() == "true"
+    )
+    EXTRACTION_PAGE_TIMEOUT = int(os.getenv("EXTRACTION_PAGE_TIMEOUT", "30"))
+    EXTRACTION_DOCUMENT_TIMEOUT = int(os.getenv("EXTRACTION_DOCUMENT_TIMEOUT", "600"))
+    EXTRACTION_MEMORY_LIMIT_MB = int(os.getenv("EXTRACTION_MEMORY_LIMIT_MB", "1024"))
+    TYPO_WORKER_INTERVAL = int(os.getenv("TYPO_WORKER_INTERVAL", "3"))
+    TYPO_WORKER_CONCURRENCY = int(os.getenv("TYPO_WORKER_CONCURRENCY", "1"))
+    # Chunks of one typo check sent in parallel, and the cap on in-flight
+    # requests per AI provider across all checks in a process
+    TYPO_CHUNK_CONCURRENCY = int(os.getenv("TYPO_CHUNK_CONCURRENCY", "8"))
+    TYPO_PROVIDER_CONCURRENCY = int(os.getenv("TYPO_PROVIDER_CONCURRENCY", "16"))
+    # Per-chunk typo result cache lifetime in days (0 disables)
+    TYPO_CHUNK_CACHE_MAX_AGE_DAYS = int(
+        os.getenv("TYPO_CHUNK_CACHE_MAX_AGE_DAYS", "30")
+    )
+    # Share chunk results across users under HMAC keys (off by default).
+    # TYPO_SHARED_CACHE_KEY falls back to SECRET_KEY. Shared entries hold
+    # the corrected text unencrypted and have no owning user, so deleting
+    # a user does not remove them; they expire with the chunk cache age.
+    TYPO_SHARED_CACHE = os.getenv("TYPO_SHARED_CACHE", "false").lower() == "true"
+    TYPO_SHARED_CACHE_KEY = os.getenv("TYPO_SHARED_CACHE_KEY")
+    # Consecutive provider failures that open its circuit, and seconds
+    # before an open circuit lets traffic through again
+    TYPO_CIRCUIT_FAILURES = int(os.getenv("TYPO_CIRCUIT_FAILURES", "5"))
+    TYPO_CIRCUIT_COOLDOWN = float(os.getenv("TYPO_CIRCUIT_COOLDOWN", "30"))
+    # Hedge short default-routed checks to a second provider after the
+    # primary's p90 latency, for at most TYPO_HEDGE_BUDGET of requests.
+    # The submit endpoint answers such texts synchronously when the
+    # request names no provider.
+    TYPO_HEDGING = os.getenv("TYPO_HEDGING", "false").lower() == "true"
+    TYPO_HEDGE_BUDGET = float(os.getenv("TYPO_HEDGE_BUDGET", "0.1"))
+    TYPO_HEDGE_MAX_LENGTH = int(os.getenv("TYPO_HEDGE_MAX_LENGTH", "2000"))
+    # Seconds the submit endpoint waits for such a check before queueing
+    TYPO_HEDGE_SYNC_TIMEOUT = float(os.getenv("TYPO_HEDGE_SYNC_TIMEOUT", "10"))
+    # Seconds between checks for system prompt changes made by other processes
+    SYSTEM_PROMPT_CACHE_TTL = float(os.getenv("SYSTEM_PROMPT_CACHE_TTL", "5"))
+    # Re-check only paragraphs changed since the user's last similar check
+    TYPO_INCREMENTAL_CHECK = (
+        os.getenv("TYPO_INCREMENTAL_CHECK", "true").lower() == "true"
+    )
+
+    # Metadata enrichment (DOI + CrossRef) runs as its own worker stage;
+    # lookups are I/O-bound, so several run concurrently
+    METADATA_WORKER_INTERVAL = int(os.getenv("METADATA_WORKER_INTERVAL", "5"))
+    METADATA_WORKER_CONCURRENCY = int(os.getenv("METADATA_WORKER_CONCURRENCY", "4"))
+    METADATA_BATCH_SIZE = int(os.getenv("METADATA_BATCH_SIZE", "10"))
+    METADATA_CLAIM_TIMEOUT = int(os.getenv("METADATA_CLAIM_TIMEOUT", "600"))
+
+    # CrossRef metadata cache: bounded in-memory LRU in front of a
+    # persistent table shared by all processes
+    CROSSREF_CACHE_MAX_ENTRIES = int(os.getenv("CROSSREF_CACHE_MAX_ENTRIES", "1000"))
+    CROSSREF_PERSISTENT_CACHE = (
+        os.getenv("CROSSREF_PERSISTENT_CACHE", "true").lower() == "true"
+    )
+    CROSSREF_CACHE_MAX_ROWS = int(os.getenv("CROSSREF_CACHE_MAX_ROWS", "50000"))
+    # Seconds to remember failed lookups (not found / timeouts and errors)
+    CROSSREF_NOT_FOUND_TTL = int(os.getenv("CROSSREF_NOT_FOUND_TTL", "3600"))
+    CROSSREF_ERROR_TTL = int(os.getenv("CROSSREF_ERROR_TTL", "60"))
+
+    # CrossRef HTTP client: keep-alive pool and retry policy
+    CROSSREF_TIMEOUT = float(os.getenv("CROSSREF_TIMEOUT", "2"))
+    CROSSREF_POOL_SIZE = int(os.getenv("CROSSREF_POOL_SIZE", "10"))
+    CROSSREF_MAX_RETRIES = int(os.getenv("CROSSREF_MAX_RETRIES", "2"))
+    CROSSREF_BACKOFF_FACTOR = float(os.getenv("CROSSREF_BACKOFF_FACTOR", "0.3"))
+    # Polite Pool request budget and how long to wait for it. When shared,
+    # the budget is kept in the database and holds across all processes.
+    CROSSREF_RATE_LIMIT = int(os.getenv("CROSSREF_RATE_LIMIT", "50"))
+    CROSSREF_RATE_LIMIT_TIMEOUT = float(os.getenv("CROSSREF_RATE_LIMIT_TIMEOUT", "10"))
+    CROSSREF_RATE_LIMIT_SHARED = (
+        os.getenv("CROSSREF_RATE_LIMIT_SHARED", "true").lower() == "true"
+    )
+
 
 class DevelopmentConfig(Config):
     """Development configuration."""
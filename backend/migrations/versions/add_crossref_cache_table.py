@@ -0,0 +1,52 @@
+"""Add crossref_cache table
+
+Revision ID: add_crossref_cache
+Revises: add_document_extraction_mode
+Create Date: 2026-10-18
+
+Persistent CrossRef metadata cache shared across processes and restarts.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "add_crossref_cache"
+down_revision = "add_document_extraction_mode"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create crossref_cache table."""
+    op.create_table(
+        "crossref_cache",
+        sa.Column("doi", sa.String(length=255), nullable=False),
+        sa.Column("data", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("last_accessed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("doi"),
+    )
+    op.create_index(
+        op.f("ix_crossref_cache_expires_at"),
+        "crossref_cache",
+        ["expires_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_crossref_cache_last_accessed_at"),
+        "crossref_cache",
+        ["last_accessed_at"],
+        unique=False,
+    )
+
+
+def downgrade():
+    """Drop crossref_cache table."""
+    op.drop_index(
+        op.f("ix_crossref_cache_last_accessed_at"), table_name="crossref_cache"
+    )
+    op.drop_index(op.f("ix_crossref_cache_expires_at"), table_name="crossref_cache")
+    op.drop_table("crossref_cache")
@@ -0,0 +1,32 @@
+"""Add extraction_mode to search_documents
+
+Revision ID: add_document_extraction_mode
+Revises: add_page_extraction_flag
+Create Date: 2026-10-18
+
+Records which extraction engine mode (fast, balanced, precise) produced
+a document's pages.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "add_document_extraction_mode"
+down_revision = "add_page_extraction_flag"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add extraction_mode column to search_documents table."""
+    op.add_column(
+        "search_documents",
+        sa.Column("extraction_mode", sa.String(length=20), nullable=True),
+    )
+
+
+def downgrade():
+    """Remove extraction_mode column from search_documents table."""
+    op.drop_column("search_documents", "extraction_mode")
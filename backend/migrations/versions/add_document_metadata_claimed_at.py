@@ -0,0 +1,32 @@
+"""Add metadata_claimed_at to search_documents
+
+Revision ID: add_document_metadata_claimed_at
+Revises: add_crossref_cache
+Create Date: 2026-10-18
+
+Metadata enrichment runs in its own worker stage; the claim time lets
+workers retry documents whose claim went stale after a crash.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "add_document_metadata_claimed_at"
+down_revision = "add_crossref_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add metadata_claimed_at column to search_documents table."""
+    op.add_column(
+        "search_documents",
+        sa.Column("metadata_claimed_at", sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade():
+    """Remove metadata_claimed_at column from search_documents table."""
+    op.drop_column("search_documents", "metadata_claimed_at")
@@ -0,0 +1,32 @@
+"""Add extraction_flag to search_pages
+
+Revision ID: add_page_extraction_flag
+Revises: 7228e64ce25a
+Create Date: 2026-10-18
+
+Pages that exceed the extraction sandbox time or memory limits are stored
+empty with a flag instead of failing the whole document.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "add_page_extraction_flag"
+down_revision = "7228e64ce25a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add extraction_flag column to search_pages table."""
+    op.add_column(
+        "search_pages",
+        sa.Column("extraction_flag", sa.String(length=20), nullable=True),
+    )
+
+
+def downgrade():
+    """Remove extraction_flag column from search_pages table."""
+    op.drop_column("search_pages", "extraction_flag")
@@ -0,0 +1,35 @@
+"""Add rate_limit_buckets table
+
+Revision ID: add_rate_limit_buckets
+Revises: add_document_metadata_claimed_at
+Create Date: 2026-10-18
+
+Token buckets shared by all processes, so the CrossRef request budget
+holds globally instead of per process.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "add_rate_limit_buckets"
+down_revision = "add_document_metadata_claimed_at"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create rate_limit_buckets table."""
+    op.create_table(
+        "rate_limit_buckets",
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("tokens", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade():
+    """Drop rate_limit_buckets table."""
+    op.drop_table("rate_limit_buckets")
@@ -0,0 +1,54 @@
+"""Add typo_chunk_cache table
+
+Revision ID: add_typo_chunk_cache
+Revises: add_rate_limit_buckets
+Create Date: 2026-10-18
+
+Per-chunk typo check results so edited resubmissions only re-check
+changed chunks.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "add_typo_chunk_cache"
+down_revision = "add_rate_limit_buckets"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create typo_chunk_cache table."""
+    op.create_table(
+        "typo_chunk_cache",
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("user_id", sa.String(length=36), nullable=False),
+        sa.Column("provider", sa.String(length=50), nullable=False),
+        sa.Column("prompt_version", sa.String(length=64), nullable=False),
+        sa.Column("corrected_text", sa.Text(), nullable=False),
+        sa.Column("issues", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+    op.create_index(
+        op.f("ix_typo_chunk_cache_user_id"),
+        "typo_chunk_cache",
+        ["user_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_typo_chunk_cache_created_at"),
+        "typo_chunk_cache",
+        ["created_at"],
+        unique=False,
+    )
+
+
+def downgrade():
+    """Drop typo_chunk_cache table."""
+    op.drop_index(op.f("ix_typo_chunk_cache_created_at"), table_name="typo_chunk_cache")
+    op.drop_index(op.f("ix_typo_chunk_cache_user_id"), table_name="typo_chunk_cache")
+    op.drop_table("typo_chunk_cache")
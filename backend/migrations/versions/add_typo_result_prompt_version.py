@@ -0,0 +1,31 @@
+"""add prompt_version column to typo_check_results
+
+Revision ID: add_typo_result_prompt_version
+Revises: allow_shared_typo_chunk_cache
+Create Date: 2026-10-18
+
+Incremental re-checks only carry issues over from results produced with
+the current system prompt; existing rows have no version and are never
+reused that way.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "add_typo_result_prompt_version"
+down_revision = "allow_shared_typo_chunk_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "typo_check_results",
+        sa.Column("prompt_version", sa.String(length=16), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_column("typo_check_results", "prompt_version")
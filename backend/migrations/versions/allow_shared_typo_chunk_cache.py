@@ -0,0 +1,36 @@
+"""Allow shared entries in typo_chunk_cache
+
+Revision ID: allow_shared_typo_chunk_cache
+Revises: add_typo_chunk_cache
+Create Date: 2026-10-18
+
+Entries of the opt-in cross-user tier have no owner: user_id becomes
+nullable and the key is an HMAC of provider, prompt version and text.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "allow_shared_typo_chunk_cache"
+down_revision = "add_typo_chunk_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Make typo_chunk_cache.user_id nullable."""
+    with op.batch_alter_table("typo_chunk_cache", schema=None) as batch_op:
+        batch_op.alter_column(
+            "user_id", existing_type=sa.String(length=36), nullable=True
+        )
+
+
+def downgrade():
+    """Drop shared entries and make user_id required again."""
+    op.execute("DELETE FROM typo_chunk_cache WHERE user_id IS NULL")
+    with op.batch_alter_table("typo_chunk_cache", schema=None) as batch_op:
+        batch_op.alter_column(
+            "user_id", existing_type=sa.String(length=36), nullable=False
+        )
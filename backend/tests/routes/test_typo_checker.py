@@ -63,7 +63,7 @@ class TestTypoCheckerEndpoints:
 
         # Mock the service
         with patch("app.routes.typo_checker.TypoCheckerService") as mock_service:
-            mock_service.check_text.return_value = {
+            mock_service.check_text_within.return_value = {
                 "success": True,
                 "corrected_text": "안녕하세요",
                 "issues": [
@@ -171,7 +171,7 @@ class TestTypoCheckerEndpoints:
             user, token = self.create_test_user()
 
         with patch("app.routes.typo_checker.TypoCheckerService") as mock_service:
-            mock_service.check_text.return_value = {
+            mock_service.check_text_within.return_value = {
                 "success": True,
                 "corrected_text": "테스트",
                 "issues": [],
@@ -334,3 +334,97 @@ class TestTypoCheckResultEndpoint:
         )
 
         assert response.status_code == 403
+
+
+class TestHedgedSubmit:
+    """Tests for the synchronous hedged path of the submit endpoint."""
+
+    def create_test_user(self):
+        """Create a test user and return auth token."""
+        user = User(
+            email="typo_hedge@example.com",
+            name="Typo Hedge User",
+            password="testpassword123",
+            approval_status="approved"
+        )
+        db.session.add(user)
+        db.session.commit()
+        return user, create_access_token(user.id)
+
+    def test_short_text_without_provider_is_checked_synchronously(
+        self, client, app
+    ):
+        """Test that hedging answers short default-routed texts directly."""
+        from app.services.typo_checker_service import TypoCheckerService
+
+        app.config["TYPO_HEDGING"] = True
+        with app.app_context():
+            user, token = self.create_test_user()
+
+        result = {
+            "success": True,
+            "corrected_text": "테스트",
+            "issues": [],
+            "provider": "openai",
+            "cached": False,
+        }
+        with patch.object(
+            TypoCheckerService, "check_text", return_value=result
+        ) as check_text:
+            response = client.post(
+                "/api/typo-check",
+                headers={"Authorization": f"Bearer {token}"},
+                json={"text": "테스트"}
+            )
+
+        assert response.status_code == 200
+        assert response.get_json()["provider"] == "openai"
+        check_text.assert_called_once_with("테스트", user.id)
+
+    def test_explicit_provider_is_queued(self, client, app):
+        """Test that naming a provider keeps the background job path."""
+        from app.services.typo_checker_service import TypoCheckerService
+
+        app.config["TYPO_HEDGING"] = True
+        with app.app_context():
+            user, token = self.create_test_user()
+
+        with patch.object(TypoCheckerService, "check_text") as check_text:
+            response = client.post(
+                "/api/typo-check",
+                headers={"Authorization": f"Bearer {token}"},
+                json={"text": "테스트", "provider": "claude"}
+            )
+
+        assert response.status_code == 202
+        check_text.assert_not_called()
+
+    def test_slow_synchronous_check_falls_back_to_job(self, client, app):
+        """Test that a check overrunning the sync timeout is queued."""
+        import threading
+
+        from app.services.typo_checker_service import TypoCheckerService
+
+        app.config["TYPO_HEDGING"] = True
+        app.config["TYPO_HEDGE_SYNC_TIMEOUT"] = 0.05
+        with app.app_context():
+            user, token = self.create_test_user()
+
+        release = threading.Event()
+
+        def stalled_check(text, user_id):
+            release.wait(5)
+            return {"success": True}
+
+        with patch.object(
+            TypoCheckerService, "check_text", side_effect=stalled_check
+        ):
+            response = client.post(
+                "/api/typo-check",
+                headers={"Authorization": f"Bearer {token}"},
+                json={"text": "테스트"}
+            )
+            release.set()
+
+        assert response.status_code == 202
+        assert response.get_json()["status"] == "pending"
@@ -59,6 +59,36 @@ class TestClaudeProviderAvailability:
             assert provider.is_available() is True
 
 
+class TestClaudeProviderClient:
+    """Tests for ClaudeProvider client reuse."""
+
+    @patch("app.services.ai.claude_provider.Anthropic")
+    def test_client_created_once_across_threads(self, mock_anthropic_class):
+        """Test that concurrent first calls build a single client."""
+        import threading
+        import time
+
+        def slow_client(**kwargs):
+            time.sleep(0.01)
+            return MagicMock()
+
+        mock_anthropic_class.side_effect = slow_client
+        provider = ClaudeProvider(api_key="test-key")
+        clients = []
+
+        threads = [
+            threading.Thread(target=lambda: clients.append(provider._get_client()))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert mock_anthropic_class.call_count == 1
+        assert len({id(client) for client in clients}) == 1
+
+
 class TestClaudeProviderCheckTypo:
     """Tests for ClaudeProvider check_typo method."""
 
@@ -0,0 +1,168 @@
+"""Tests for provider health statistics and circuit breakers."""
+
+import time
+
+from app.services.ai.provider_health import ProviderHealth
+
+
+class TestProviderHealthStats:
+    """Tests for rolling latency and error statistics."""
+
+    def test_latency_quantiles_use_successful_calls(self):
+        """Test that quantiles ignore failed calls."""
+        health = ProviderHealth()
+        for latency in [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]:
+            health.record("claude", latency, True)
+        health.record("claude", 30.0, False)
+
+        assert health.latency("claude", 0.5) == 0.6
+        assert health.latency("claude", 0.9) == 1.0
+        assert health.latency("openai") is None
+
+    def test_window_drops_old_calls(self):
+        """Test that only the most recent calls are kept."""
+        health = ProviderHealth(window=3)
+        for latency in [5.0, 0.1, 0.2, 0.3]:
+            health.record("claude", latency, True)
+
+        assert health.snapshot()["claude"]["calls"] == 3
+        assert health.latency("claude", 1.0) == 0.3
+
+    def test_routing_key_ranks_failing_providers_last(self):
+        """Test that failures without successes rank below slow providers."""
+        health = ProviderHealth(failure_threshold=10)
+        for _ in range(4):
+            health.record("claude", 0.1, False)
+        health.record("openai", 2.0, True)
+
+        ranked = sorted(["claude", "openai", "gemini"], key=health.routing_key)
+
+        assert ranked == ["gemini", "openai", "claude"]
+
+
+class TestProviderHealthCircuit:
+    """Tests for circuit breaker transitions."""
+
+    def test_consecutive_failures_open_circuit(self):
+        """Test that the circuit opens after the failure threshold."""
+        health = ProviderHealth(failure_threshold=3, cooldown=60)
+        for _ in range(2):
+            health.record("claude", 1.0, False)
+        assert health.is_healthy("claude") is True
+
+        health.record("claude", 1.0, False)
+        assert health.is_healthy("claude") is False
+        assert health.snapshot()["claude"]["state"] == "open"
+
+    def test_error_rate_opens_circuit(self):
+        """Test that a high error rate opens the circuit without a streak."""
+        health = ProviderHealth(failure_threshold=100, cooldown=60)
+        for _ in range(5):
+            health.record("claude", 1.0, True)
+            health.record("claude", 1.0, False)
+
+        assert health.is_healthy("claude") is False
+
+    def test_half_open_after_cooldown(self):
+        """Test that a cooled-down circuit probes and closes on success."""
+        health = ProviderHealth(failure_threshold=1, cooldown=0.05)
+        health.record("claude", 1.0, False)
+        assert health.is_healthy("claude") is False
+        assert health.acquire("claude") is None
+
+        time.sleep(0.06)
+        assert health.is_healthy("claude") is True
+        assert health.snapshot()["claude"]["state"] == "open"
+
+        ticket = health.acquire("claude")
+        assert ticket is not None
+        assert health.snapshot()["claude"]["state"] == "half_open"
+        assert health.is_healthy("claude") is False
+
+        health.record("claude", 0.5, True, ticket)
+        assert health.snapshot()["claude"]["state"] == "closed"
+
+    def test_half_open_failure_reopens(self):
+        """Test that a failed probe re-opens the circuit."""
+        health = ProviderHealth(failure_threshold=5, cooldown=0.05)
+        for _ in range(5):
+            health.record("claude", 1.0, False)
+        time.sleep(0.06)
+        ticket = health.acquire("claude")
+
+        health.record("claude", 1.0, False, ticket)
+        assert health.snapshot()["claude"]["state"] == "open"
+        assert health.is_healthy("claude") is False
+
+    def test_only_one_call_is_admitted_while_half_open(self):
+        """Test that calls are refused, not queued, while the probe runs."""
+        health = ProviderHealth(failure_threshold=1, cooldown=5)
+        health.record("claude", 1.0, False)
+        health._stats["claude"].opened_at -= 5
+
+        probe = health.acquire("claude")
+
+        assert probe is not None
+        assert health.acquire("claude") is None
+
+        health.record("claude", 0.5, True, probe)
+        assert health.acquire("claude") is not None
+
+    def test_stale_success_does_not_close_circuit(self):
+        """Test that a call admitted before the circuit opened is ignored."""
+        health = ProviderHealth(failure_threshold=1, cooldown=60)
+        slow_call = health.acquire("claude")
+        health.record("claude", 1.0, False)
+        assert health.snapshot()["claude"]["state"] == "open"
+
+        health.record("claude", 30.0, True, slow_call)
+
+        assert health.snapshot()["claude"]["state"] == "open"
+        assert health.latency("claude") == 30.0
+
+
+class TestHedgeBudget:
+    """Tests for the hedge budget cap."""
+
+    def test_caps_share_of_hedged_requests(self):
+        """Test that at most ratio of the requests seen hedge."""
+        from app.services.ai.provider_health import HedgeBudget
+
+        budget = HedgeBudget(ratio=0.2, window=10)
+
+        assert [budget.try_hedge() for _ in range(7)] == [
+            True, False, False, False, False, False, True
+        ]
+
+    def test_cold_start_does_not_hedge_a_burst(self):
+        """Test that a fresh budget applies the ratio to requests seen."""
+        from app.services.ai.provider_health import HedgeBudget
+
+        budget = HedgeBudget(ratio=0.1, window=100)
+
+        assert sum(budget.try_hedge() for _ in range(12)) == 2
+
+    def test_budget_recovers_as_window_moves(self):
+        """Test that hedges age out of the window."""
+        from app.services.ai.provider_health import HedgeBudget
+
+        budget = HedgeBudget(ratio=0.1, window=10)
+        assert budget.try_hedge() is True
+        assert budget.try_hedge() is False
+
+        for _ in range(10):
+            budget.record()
+        assert budget.try_hedge() is True
+
+    def test_abandoned_calls_are_charged_until_released(self):
+        """Test that still running losers use up the budget."""
+        from app.services.ai.provider_health import HedgeBudget
+
+        budget = HedgeBudget(ratio=0.5, window=10)
+        budget.record()
+        budget.charge()
+
+        assert budget.try_hedge() is False
+
+        budget.release()
+        assert budget.try_hedge() is True
@@ -1,10 +1,11 @@
 """Tests for CrossRef API caching functionality.
 
 TDD RED Phase: Write failing tests first.
-In-memory cache with 7-day TTL for CrossRef metadata.
+In-memory cache with 7-day TTL for CrossRef metadata, short-TTL negative
+caching and coalescing of concurrent lookups.
 """
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from datetime import datetime, timedelta
 
 
@@ -23,7 +24,7 @@ class TestCrossRefCache:
             },
         }
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
 
@@ -47,7 +48,7 @@ class TestCrossRefCache:
             "message": {"title": ["Test"]},
         }
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
 
@@ -60,11 +61,13 @@ class TestCrossRefCache:
             CrossRefService.fetch_metadata("10.1038/first")
             assert mock_get.call_count == 2
 
-    def test_cache_does_not_store_errors(self):
-        """Test that API errors are not cached."""
+    def test_errors_are_cached_briefly(self):
+        """Test that API errors are cached with a short TTL."""
         from app.services.crossref_service import CrossRefService
 
-        with patch("requests.get") as mock_get:
+        CrossRefService.clear_cache()
+
+        with patch("requests.Session.get") as mock_get:
             # First call returns error
             mock_get.return_value.status_code = 500
 
@@ -72,30 +75,67 @@ class TestCrossRefCache:
             assert error1 is not None
             assert mock_get.call_count == 1
 
-            # Second call should retry API (not use cached error)
+            # Second call is answered from the negative cache
+            result2, error2 = CrossRefService.fetch_metadata("10.1038/error")
+            assert mock_get.call_count == 1
+            assert result2 is None
+            assert error2 == error1
+
+            # Once the negative entry expires the API is retried
+            with CrossRefService._cache_lock:
+                CrossRefService._negative_cache["10.1038/error"]["expires_at"] = (
+                    datetime.now() - timedelta(seconds=1)
+                )
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = {
                 "status": "ok",
                 "message": {"title": ["Recovered"]},
             }
 
-            result2, error2 = CrossRefService.fetch_metadata("10.1038/error")
+            result3, error3 = CrossRefService.fetch_metadata("10.1038/error")
             assert mock_get.call_count == 2
-            assert error2 is None
-            assert result2["title"] == "Recovered"
+            assert error3 is None
+            assert result3["title"] == "Recovered"
 
-    def test_cache_does_not_store_not_found(self):
-        """Test that 404 errors are not cached."""
+    def test_not_found_cached_longer_than_errors(self):
+        """Test that 404s use the not-found TTL and errors the error TTL."""
         from app.services.crossref_service import CrossRefService
 
-        with patch("requests.get") as mock_get:
-            mock_get.return_value.status_code = 404
+        CrossRefService.clear_cache()
 
-            result1, error1 = CrossRefService.fetch_metadata("10.1038/notfound")
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value.status_code = 404
+            CrossRefService.fetch_metadata("10.1038/notfound")
+            CrossRefService.fetch_metadata("10.1038/notfound")
             assert mock_get.call_count == 1
 
-            # Should retry
-            result2, error2 = CrossRefService.fetch_metadata("10.1038/notfound")
+            mock_get.return_value.status_code = 503
+            CrossRefService.fetch_metadata("10.1038/unavailable")
+
+        negative = CrossRefService._negative_cache
+        not_found_expiry = negative["10.1038/notfound"]["expires_at"]
+        error_expiry = negative["10.1038/unavailable"]["expires_at"]
+        assert not_found_expiry - datetime.now() > timedelta(
+            seconds=CrossRefService.ERROR_TTL_SECONDS
+        )
+        assert error_expiry - datetime.now() <= timedelta(
+            seconds=CrossRefService.ERROR_TTL_SECONDS
+        )
+        assert CrossRefService.get_cache_stats()["negative_hits"] == 1
+        CrossRefService.clear_cache()
+
+    def test_negative_cache_can_be_disabled(self, app):
+        """Test that a zero TTL disables negative caching."""
+        from app.services.crossref_service import CrossRefService
+
+        app.config["CROSSREF_NOT_FOUND_TTL"] = 0
+        CrossRefService.clear_cache()
+
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value.status_code = 404
+
+            CrossRefService.fetch_metadata("10.1038/notfound-nocache")
+            CrossRefService.fetch_metadata("10.1038/notfound-nocache")
             assert mock_get.call_count == 2
 
 
@@ -114,7 +154,7 @@ class TestCrossRefCacheTTL:
             "message": {"title": ["Test"]},
         }
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
 
@@ -153,7 +193,7 @@ class TestCrossRefCacheManagement:
             "message": {"title": ["Test"]},
         }
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
 
@@ -182,7 +222,7 @@ class TestCrossRefCacheManagement:
             "message": {"title": ["Test"]},
         }
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
 
@@ -206,7 +246,7 @@ class TestCrossRefCacheManagement:
             "message": {"title": ["Test"]},
         }
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
 
@@ -238,7 +278,7 @@ class TestCrossRefCacheThreadSafety:
         errors = []
         lock = threading.Lock()
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
 
@@ -262,3 +302,201 @@ class TestCrossRefCacheThreadSafety:
 
             # No errors should occur
             assert len(errors) == 0
+
+
+class TestCrossRefCacheLRU:
+    """Test cases for the bounded in-memory LRU."""
+
+    def test_evicts_least_recently_used(self, app):
+        """Test that the oldest unused entry is evicted when full."""
+        from app.services.crossref_service import CrossRefService
+
+        app.config["CROSSREF_CACHE_MAX_ENTRIES"] = 2
+        app.config["CROSSREF_PERSISTENT_CACHE"] = False
+        CrossRefService.clear_cache()
+
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.json.return_value = {
+                "status": "ok",
+                "message": {"title": ["Test"]},
+            }
+
+            CrossRefService.fetch_metadata("10.1038/lru1")
+            CrossRefService.fetch_metadata("10.1038/lru2")
+            CrossRefService.fetch_metadata("10.1038/lru1")  # lru2 is now oldest
+            CrossRefService.fetch_metadata("10.1038/lru3")
+
+        assert list(CrossRefService._cache) == ["10.1038/lru1", "10.1038/lru3"]
+        CrossRefService.clear_cache()
+
+
+class TestCrossRefPersistentCache:
+    """Test cases for the persistent database cache tier."""
+
+    def _mock_ok(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {
+            "status": "ok",
+            "message": {"title": ["Persistent"]},
+        }
+
+    def test_survives_process_local_cache_loss(self, app):
+        """Test that a restart (empty memory cache) still hits the DB tier."""
+        from app.services.crossref_service import CrossRefService
+
+        CrossRefService.clear_cache()
+
+        with patch("requests.Session.get") as mock_get:
+            self._mock_ok(mock_get)
+
+            CrossRefService.fetch_metadata("10.1038/persist")
+            with CrossRefService._cache_lock:
+                CrossRefService._cache.clear()
+
+            result, error = CrossRefService.fetch_metadata("10.1038/persist")
+
+            assert mock_get.call_count == 1
+            assert error is None
+            assert result["title"] == "Persistent"
+
+        stats = CrossRefService.get_cache_stats()
+        assert stats["persistent_hits"] == 1
+        assert stats["persistent_size"] == 1
+        # Promoted back into memory
+        assert "10.1038/persist" in CrossRefService._cache
+        CrossRefService.clear_cache()
+
+    def test_expired_rows_are_not_served(self, app):
+        """Test that expired persistent entries trigger a new API call."""
+        from app.models import db
+        from app.models.crossref_cache import CrossRefCacheEntry
+        from app.services.crossref_service import CrossRefService
+
+        CrossRefService.clear_cache()
+
+        with patch("requests.Session.get") as mock_get:
+            self._mock_ok(mock_get)
+
+            CrossRefService.fetch_metadata("10.1038/expired")
+            CrossRefService._cache.clear()
+            entry = db.session.get(CrossRefCacheEntry, "10.1038/expired")
+            entry.expires_at = datetime.now() - timedelta(days=1)
+            db.session.commit()
+
+            CrossRefService.fetch_metadata("10.1038/expired")
+
+            assert mock_get.call_count == 2
+        CrossRefService.clear_cache()
+
+    def test_prune_evicts_expired_then_least_recently_used(self, app):
+        """Test size and TTL eviction of the persistent cache."""
+        from app.models import db
+        from app.models.crossref_cache import CrossRefCacheEntry
+        from app.services.crossref_service import CrossRefService
+
+        CrossRefService.clear_cache()
+        now = datetime.now()
+        for index, accessed_days_ago in enumerate([3, 1, 2]):
+            db.session.add(CrossRefCacheEntry(
+                doi=f"10.1038/prune{index}",
+                data="{}",
+                expires_at=now + timedelta(days=1),
+                last_accessed_at=now - timedelta(days=accessed_days_ago),
+            ))
+        db.session.add(CrossRefCacheEntry(
+            doi="10.1038/prune-expired",
+            data="{}",
+            expires_at=now - timedelta(days=1),
+            last_accessed_at=now,
+        ))
+        db.session.commit()
+
+        deleted = CrossRefService.prune_persistent_cache(max_rows=2)
+
+        assert deleted == 2
+        remaining = {entry.doi for entry in CrossRefCacheEntry.query.all()}
+        assert remaining == {"10.1038/prune1", "10.1038/prune2"}
+        CrossRefService.clear_cache()
+
+
+class TestCrossRefRequestCoalescing:
+    """Test cases for single-flight coalescing of concurrent lookups."""
+
+    def test_concurrent_lookups_share_one_request(self):
+        """Test that concurrent callers for one DOI make a single API call."""
+        import threading
+        import time
+        from app.services.crossref_service import CrossRefService
+
+        CrossRefService.clear_cache()
+        started = threading.Event()
+
+        def slow_get(*args, **kwargs):
+            started.set()
+            time.sleep(0.2)
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {
+                "status": "ok",
+                "message": {"title": ["Shared"]},
+            }
+            return response
+
+        results = []
+
+        def worker():
+            results.append(CrossRefService.fetch_metadata("10.1038/shared"))
+
+        with patch("requests.Session.get", side_effect=slow_get) as mock_get:
+            leader = threading.Thread(target=worker)
+            leader.start()
+            started.wait(1)
+            followers = [threading.Thread(target=worker) for _ in range(5)]
+            for t in followers:
+                t.start()
+            for t in [leader] + followers:
+                t.join()
+
+            assert mock_get.call_count == 1
+
+        assert len(results) == 6
+        assert all(result["title"] == "Shared" for result, _ in results)
+        assert CrossRefService.get_cache_stats()["coalesced"] == 5
+        assert CrossRefService._inflight == {}
+        CrossRefService.clear_cache()
+
+    def test_followers_receive_leader_error(self):
+        """Test that waiting callers get the leader's error result."""
+        import threading
+        import time
+        from app.services.crossref_service import CrossRefService
+
+        CrossRefService.clear_cache()
+        started = threading.Event()
+
+        def failing_get(*args, **kwargs):
+            started.set()
+            time.sleep(0.2)
+            response = MagicMock()
+            response.status_code = 404
+            return response
+
+        results = []
+
+        def worker():
+            results.append(CrossRefService.fetch_metadata("10.1038/missing"))
+
+        with patch("requests.Session.get", side_effect=failing_get) as mock_get:
+            leader = threading.Thread(target=worker)
+            leader.start()
+            started.wait(1)
+            follower = threading.Thread(target=worker)
+            follower.start()
+            for t in (leader, follower):
+                t.join()
+
+            assert mock_get.call_count == 1
+
+        assert [error for _, error in results] == ["DOI not found: 10.1038/missing"] * 2
+        CrossRefService.clear_cache()
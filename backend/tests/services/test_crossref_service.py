@@ -4,7 +4,7 @@ TDD RED Phase: Write failing tests first.
 """
 
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 
 @pytest.fixture(autouse=True)
@@ -39,7 +39,7 @@ class TestCrossRefServiceFetchMetadata:
             },
         }
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
 
@@ -57,7 +57,7 @@ class TestCrossRefServiceFetchMetadata:
         """Test that API request includes mailto parameter for Polite Pool."""
         from app.services.crossref_service import CrossRefService
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = {
                 "status": "ok",
@@ -91,7 +91,7 @@ class TestCrossRefServiceFetchMetadata:
         """Test handling of 404 response (DOI not found)."""
         from app.services.crossref_service import CrossRefService
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 404
 
             result, error = CrossRefService.fetch_metadata("10.1038/nonexistent")
@@ -104,7 +104,7 @@ class TestCrossRefServiceFetchMetadata:
         """Test handling of API error responses."""
         from app.services.crossref_service import CrossRefService
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 500
 
             result, error = CrossRefService.fetch_metadata("10.1038/nature12373")
@@ -117,7 +117,7 @@ class TestCrossRefServiceFetchMetadata:
         from app.services.crossref_service import CrossRefService
         import requests
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.side_effect = requests.Timeout("Connection timed out")
 
             result, error = CrossRefService.fetch_metadata("10.1038/nature12373")
@@ -131,7 +131,7 @@ class TestCrossRefServiceFetchMetadata:
         from app.services.crossref_service import CrossRefService
         import requests
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.side_effect = requests.RequestException("Network error")
 
             result, error = CrossRefService.fetch_metadata("10.1038/nature12373")
@@ -143,7 +143,7 @@ class TestCrossRefServiceFetchMetadata:
         """Test that API request uses correct timeout (2 seconds)."""
         from app.services.crossref_service import CrossRefService
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = {
                 "status": "ok",
@@ -157,6 +157,166 @@ class TestCrossRefServiceFetchMetadata:
             assert call_args[1].get("timeout") == 2
 
 
+class TestCrossRefServiceSession:
+    """Test cases for the pooled HTTP session."""
+
+    @pytest.fixture
+    def flaky_server(self):
+        """Local CrossRef stand-in that fails once with 503, then succeeds."""
+        import json
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        requests_seen = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                requests_seen.append(self.path)
+                if len(requests_seen) == 1:
+                    body, status = b"busy", 503
+                else:
+                    body = json.dumps({
+                        "status": "ok",
+                        "message": {"title": ["Pooled"]},
+                    }).encode()
+                    status = 200
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_port}/works", requests_seen
+        server.shutdown()
+        server.server_close()
+
+    def test_session_is_reused(self):
+        """Test that lookups share one session."""
+        from app.services.crossref_service import CrossRefService
+
+        CrossRefService.close_session()
+
+        assert CrossRefService._get_session() is CrossRefService._get_session()
+        CrossRefService.close_session()
+
+    def test_session_uses_configured_pool_and_retries(self, app):
+        """Test that the adapter follows app config and rebuilds on change."""
+        from app.services.crossref_service import CrossRefService
+
+        CrossRefService.close_session()
+        app.config["CROSSREF_POOL_SIZE"] = 4
+        app.config["CROSSREF_MAX_RETRIES"] = 3
+
+        session = CrossRefService._get_session()
+        adapter = session.get_adapter("https://api.crossref.org/works")
+
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+
+        app.config["CROSSREF_MAX_RETRIES"] = 1
+        assert CrossRefService._get_session() is not session
+        CrossRefService.close_session()
+
+    def test_session_does_not_keep_cookies(self):
+        """Test that the shared session stays stateless."""
+        from app.services.crossref_service import CrossRefService
+
+        CrossRefService.close_session()
+        session = CrossRefService._get_session()
+
+        assert session.cookies.get_policy().allowed_domains() == ()
+        CrossRefService.close_session()
+
+    def test_retries_transient_errors(self, app, flaky_server):
+        """Test that a 503 is retried on the pooled connection."""
+        from app.services.crossref_service import CrossRefService
+
+        url, requests_seen = flaky_server
+        app.config["CROSSREF_BACKOFF_FACTOR"] = 0
+        app.config["CROSSREF_PERSISTENT_CACHE"] = False
+        CrossRefService.close_session()
+
+        with patch.object(CrossRefService, "API_BASE_URL", url):
+            result, error = CrossRefService.fetch_metadata("10.1038/retry")
+
+        assert error is None
+        assert result["title"] == "Pooled"
+        assert len(requests_seen) == 2
+        CrossRefService.close_session()
+
+
+class TestCrossRefServiceRateLimit:
+    """Test cases for rate limiting CrossRef requests."""
+
+    def test_requests_acquire_rate_limiter(self):
+        """Test that each API request waits for a rate limiter token."""
+        from app.services.crossref_service import CrossRefService
+
+        limiter = MagicMock()
+        limiter.acquire.return_value = True
+
+        with patch.object(
+            CrossRefService, "_get_rate_limiter", return_value=limiter
+        ), patch("requests.Session.get") as mock_get:
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.json.return_value = {
+                "status": "ok",
+                "message": {"title": ["Limited"]},
+            }
+
+            CrossRefService.fetch_metadata("10.1038/limited")
+
+        limiter.acquire.assert_called_once()
+        assert limiter.acquire.call_args[1]["wait"] is True
+
+    def test_rate_limited_lookup_is_not_cached(self):
+        """Test that running out of budget is reported but not cached."""
+        from app.services.crossref_service import CrossRefService
+
+        limiter = MagicMock()
+        limiter.acquire.return_value = False
+
+        with patch.object(
+            CrossRefService, "_get_rate_limiter", return_value=limiter
+        ), patch("requests.Session.get") as mock_get:
+            result, error = CrossRefService.fetch_metadata("10.1038/budget")
+
+            mock_get.assert_not_called()
+
+        assert result is None
+        assert error == CrossRefService.RATE_LIMITED_ERROR
+        assert CrossRefService._get_negative_entry("10.1038/budget") is None
+
+    def test_rate_limiter_follows_config(self, app):
+        """Test that the limiter uses CROSSREF_RATE_LIMIT."""
+        from app.services.crossref_service import CrossRefService
+
+        app.config["CROSSREF_RATE_LIMIT"] = 7
+
+        assert CrossRefService._get_rate_limiter().rate == 7
+
+    def test_rate_limiter_is_shared_in_app_context(self, app):
+        """Test that the limiter is database-backed unless disabled."""
+        from app.services.crossref_service import CrossRefService
+        from app.utils.rate_limiter import DatabaseRateLimiter
+
+        assert isinstance(CrossRefService._get_rate_limiter(), DatabaseRateLimiter)
+
+        app.config["CROSSREF_RATE_LIMIT_SHARED"] = False
+
+        assert not isinstance(
+            CrossRefService._get_rate_limiter(), DatabaseRateLimiter
+        )
+
+
 class TestCrossRefServiceParseResponse:
     """Test cases for parsing CrossRef API response."""
 
@@ -272,7 +432,7 @@ class TestCrossRefServiceAPIEndpoint:
         doi = "10.1038/nature12373"
         expected_url = f"https://api.crossref.org/works/{doi}"
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = {
                 "status": "ok",
@@ -293,7 +453,7 @@ class TestCrossRefServiceReturnTuple:
         """Test that fetch_metadata always returns tuple."""
         from app.services.crossref_service import CrossRefService
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = {
                 "status": "ok",
@@ -324,7 +484,7 @@ class TestCrossRefServiceEdgeCases:
         """Test handling of API response with invalid status."""
         from app.services.crossref_service import CrossRefService
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = {
                 "status": "error",
@@ -341,7 +501,7 @@ class TestCrossRefServiceEdgeCases:
         """Test handling of unexpected exception."""
         from app.services.crossref_service import CrossRefService
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.side_effect = ValueError("Invalid JSON")
 
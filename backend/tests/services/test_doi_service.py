@@ -311,3 +311,199 @@ class TestDOIServiceTupleReturn:
             finally:
                 if os.path.exists(temp_path):
                     os.unlink(temp_path)
+
+
+def _write_pdf_with_xmp(path, xmp):
+    """Write a minimal one-page PDF whose catalog has an XMP packet."""
+    data = xmp.encode("utf-8")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R /Metadata 4 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] >>",
+        b"<< /Type /Metadata /Subtype /XML /Length %d >>\nstream\n" % len(data)
+        + data
+        + b"\nendstream",
+    ]
+    output = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    with open(path, "wb") as f:
+        f.write(output)
+
+
+class TestDOIExtractionFromPDFMetadata:
+    """Test cases for finding DOIs without text extraction."""
+
+    def _extract_without_text(self, path):
+        from unittest.mock import patch
+        from app.services.doi_service import DOIService
+
+        with patch("pdfplumber.page.Page.extract_text") as mock_extract:
+            result = DOIService.extract_doi_from_pdf(path)
+        mock_extract.assert_not_called()
+        return result
+
+    def test_doi_from_info_dictionary(self, tmp_path):
+        """Test that a DOI in /Subject is found before reading page text."""
+        from reportlab.pdfgen import canvas
+
+        path = str(tmp_path / "info.pdf")
+        c = canvas.Canvas(path)
+        c.setSubject("Cell 180 (2020) 1-12. doi:10.1016/j.cell.2020.01.001")
+        c.drawString(100, 750, "DOI: 10.9999/text-doi")
+        c.showPage()
+        c.save()
+
+        assert self._extract_without_text(path) == ("10.1016/j.cell.2020.01.001", None)
+
+    def test_doi_from_xmp(self, tmp_path):
+        """Test that prism:doi in the XMP packet is used."""
+        path = str(tmp_path / "xmp.pdf")
+        _write_pdf_with_xmp(
+            path,
+            '<x:xmpmeta xmlns:x="adobe:ns:meta/"><rdf:RDF><rdf:Description '
+            'xmlns:prism="http://prismstandard.org/namespaces/basic/2.0/">'
+            "<prism:doi>10.1038/s41586-020-2649-2</prism:doi>"
+            "</rdf:Description></rdf:RDF></x:xmpmeta>",
+        )
+
+        assert self._extract_without_text(path) == ("10.1038/s41586-020-2649-2", None)
+
+    def test_doi_from_link_annotations(self, tmp_path):
+        """Test that doi.org and CrossMark links on page one are used."""
+        from reportlab.pdfgen import canvas
+
+        path = str(tmp_path / "links.pdf")
+        c = canvas.Canvas(path)
+        c.linkURL(
+            "https://crossmark.crossref.org/dialog/?doi=10.1371/journal.pone.0000001"
+            "&domain=pdf",
+            (100, 700, 200, 720),
+        )
+        c.showPage()
+        c.save()
+
+        assert self._extract_without_text(path) == (
+            "10.1371/journal.pone.0000001",
+            None,
+        )
+
+    def test_later_page_links_fall_back_to_text(self, tmp_path):
+        """Test that links past page one (citations) are not trusted."""
+        from reportlab.pdfgen import canvas
+        from app.services.doi_service import DOIService
+
+        path = str(tmp_path / "cited.pdf")
+        c = canvas.Canvas(path)
+        c.drawString(100, 750, "DOI: 10.1038/nature12373")
+        c.showPage()
+        c.linkURL("https://doi.org/10.1000/cited", (100, 700, 200, 720))
+        c.showPage()
+        c.save()
+
+        assert DOIService.extract_doi_from_pdf(path) == ("10.1038/nature12373", None)
+
+
+class TestDOIScanner:
+    """Test cases for the single-pass scored DOI scanner."""
+
+    def test_joins_doi_split_across_lines(self):
+        """Test that a DOI broken after a period or slash is rejoined."""
+        from app.services.doi_service import DOIService
+
+        assert (
+            DOIService.extract_doi_from_text("doi: 10.1016/j.cell.\n2020.01.001 more")
+            == "10.1016/j.cell.2020.01.001"
+        )
+        assert (
+            DOIService.extract_doi_from_text("https://doi.org/10.1093/\nnar/gkz001")
+            == "10.1093/nar/gkz001"
+        )
+
+    def test_sentence_end_is_not_joined(self):
+        """Test that a DOI ending a sentence keeps its own form."""
+        from app.services.doi_service import DOIService
+
+        text = "See 10.1000/xyz123.\nand the next line"
+        assert DOIService.extract_doi_from_text(text) == "10.1000/xyz123"
+
+    def test_hyphen_split_yields_both_forms(self):
+        """Test that a line-end hyphen keeps the DOI hyphen but offers both."""
+        from app.services.doi_service import DOIService
+
+        candidates = DOIService.scan_dois(["DOI: 10.1038/s41586-\n020-2649-2"])
+        dois = [candidate.doi for candidate in candidates]
+
+        assert dois[0] == "10.1038/s41586-020-2649-2"
+        assert "10.1038/s41586020-2649-2" in dois
+        assert candidates[0].confidence > candidates[1].confidence
+
+    def test_line_break_before_word_or_number_is_not_joined(self):
+        """Test that prose after a line break is not glued onto a DOI."""
+        from app.services.doi_service import DOIService
+
+        assert (
+            DOIService.extract_doi_from_text("See 10.1234/abc.\n2020 was a year")
+            == "10.1234/abc"
+        )
+        assert (
+            DOIService.extract_doi_from_text("See 10.1234/abc-\nthe next line")
+            == "10.1234/abc-"
+        )
+
+    def test_earlier_page_outranks_labelled_citation(self):
+        """Test that the article DOI beats a labelled DOI in the references."""
+        from app.services.doi_service import DOIService
+
+        pages = [
+            "Journal of Things 10.1038/nature12373 Received 2020",
+            "Body text",
+            "References doi:10.1000/cited.1",
+        ]
+
+        candidates = DOIService.scan_dois(pages)
+
+        assert [candidate.doi for candidate in candidates] == [
+            "10.1038/nature12373",
+            "10.1000/cited.1",
+        ]
+
+    def test_labelled_and_repeated_dois_rank_first_within_a_page(self):
+        """Test scoring on one page: labels and repeats beat bare citations."""
+        from app.services.doi_service import DOIService
+
+        pages = [
+            "Cited work 10.1000/cited appears first. Article doi:10.1038/"
+            "nature12373 Footer https://doi.org/10.1038/NATURE12373",
+        ]
+
+        candidates = DOIService.scan_dois(pages)
+
+        assert candidates[0].doi == "10.1038/nature12373"
+        assert candidates[0].occurrences == 2
+        assert candidates[-1].doi == "10.1000/cited"
+
+    def test_stops_reading_after_first_page_with_a_candidate(self):
+        """Test that later pages are not consumed once a DOI is found."""
+        from app.services.doi_service import DOIService
+
+        consumed = []
+
+        def pages():
+            for text in ["Title page", "10.1038/nature12373", "doi:10.1000/x"]:
+                consumed.append(text)
+                yield text
+
+        candidates = DOIService.scan_dois(pages(), stop_at_first_page=True)
+
+        assert [candidate.doi for candidate in candidates] == ["10.1038/nature12373"]
+        assert consumed == ["Title page", "10.1038/nature12373"]
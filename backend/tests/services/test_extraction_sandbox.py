@@ -0,0 +1,131 @@
+"""Tests for the supervised PDF extraction sandbox."""
+
+import os
+import tempfile
+import time
+
+import pytest
+
+from app.services.extraction_sandbox import (
+    FLAG_FAILED,
+    FLAG_TIMEOUT,
+    ExtractionSandbox,
+)
+
+
+def _slow_second_page(page):
+    """Page extractor that hangs on page 2 (runs in the sandbox child)."""
+    if page.page_number == 2:
+        time.sleep(30)
+    return page.extract_text() or ""
+
+
+def _broken_second_page(page):
+    """Page extractor that raises on page 2."""
+    if page.page_number == 2:
+        raise ValueError("bad content stream")
+    return page.extract_text() or ""
+
+
+def _slow_every_page(page):
+    """Page extractor that is slow on every page."""
+    time.sleep(0.6)
+    return page.extract_text() or ""
+
+
+@pytest.fixture
+def three_page_pdf():
+    """Create a temporary three-page PDF."""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+        path = f.name
+
+    c = canvas.Canvas(path, pagesize=letter)
+    for number in range(1, 4):
+        c.drawString(100, 750, f"Sandbox page {number}")
+        c.showPage()
+    c.save()
+
+    yield path
+
+    os.unlink(path)
+
+
+class TestExtractionSandbox:
+    """Test cases for ExtractionSandbox."""
+
+    def test_extracts_all_pages(self, three_page_pdf):
+        """Test that normal PDFs extract every page without flags."""
+        pages = ExtractionSandbox(page_timeout=10).extract(three_page_pdf)
+
+        assert [page.page_number for page in pages] == [1, 2, 3]
+        assert "Sandbox page 2" in pages[1].content
+        assert all(page.flag is None for page in pages)
+
+    def test_page_timeout_flags_page_and_continues(self, three_page_pdf):
+        """Test that a hanging page is recorded empty and later pages survive."""
+        sandbox = ExtractionSandbox(
+            page_timeout=1.5, page_extractor=_slow_second_page
+        )
+
+        pages = sandbox.extract(three_page_pdf)
+
+        assert pages[1].content == ""
+        assert pages[1].flag == FLAG_TIMEOUT
+        assert "Sandbox page 1" in pages[0].content
+        assert "Sandbox page 3" in pages[2].content
+
+    def test_document_timeout_flags_remaining_pages(self, three_page_pdf):
+        """Test that pages not reached before the deadline are flagged."""
+        sandbox = ExtractionSandbox(
+            page_timeout=5,
+            document_timeout=1.5,
+            page_extractor=_slow_every_page,
+        )
+
+        pages = sandbox.extract(three_page_pdf)
+
+        assert len(pages) == 3
+        assert pages[-1].flag == FLAG_TIMEOUT
+
+    def test_unreadable_pdf_raises(self):
+        """Test that a file that is not a PDF still fails the document."""
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+            f.write(b"not a pdf")
+            path = f.name
+
+        try:
+            with pytest.raises(RuntimeError):
+                ExtractionSandbox(page_timeout=10).extract(path)
+        finally:
+            os.unlink(path)
+
+    def test_child_is_reused_across_documents(self, three_page_pdf):
+        """Test that one child process serves consecutive documents."""
+        sandbox = ExtractionSandbox(page_timeout=10)
+        try:
+            sandbox.extract(three_page_pdf)
+            first_pid = sandbox._idle[0].process.pid
+            pages = sandbox.extract(three_page_pdf)
+
+            assert "Sandbox page 3" in pages[2].content
+            assert [child.process.pid for child in sandbox._idle] == [first_pid]
+        finally:
+            sandbox.close()
+
+    def test_page_error_flags_page_and_continues(self, three_page_pdf):
+        """Test that a page raising an exception does not fail the document."""
+        sandbox = ExtractionSandbox(
+            page_timeout=10, page_extractor=_broken_second_page
+        )
+        try:
+            pages = sandbox.extract(three_page_pdf)
+        finally:
+            sandbox.close()
+
+        assert pages[1].content == ""
+        assert pages[1].flag == FLAG_FAILED
+        assert "Sandbox page 3" in pages[2].content
+        assert len(sandbox._idle) == 0
@@ -0,0 +1,273 @@
+"""Tests for the metadata enrichment stage.
+
+DOI extraction and CrossRef lookups run in their own worker stage after
+text extraction has completed.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app import db
+from app.models.document import SearchDocument
+from app.models.user import User
+from app.services.metadata_service import MetadataService
+
+
+@pytest.fixture
+def owner(app):
+    """Create a document owner."""
+    user = User(email="meta@example.com", name="Meta", password="password")
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _create_document(owner, name, extraction_status="completed", **fields):
+    document = SearchDocument(
+        owner_id=owner.id,
+        filename=name,
+        original_filename=name,
+        file_path=f"/nonexistent/{name}",
+        extraction_status=extraction_status,
+        extraction_completed_at=datetime.now(timezone.utc),
+        **fields,
+    )
+    db.session.add(document)
+    db.session.commit()
+    return document
+
+
+class TestMetadataClaiming:
+    """Tests for claiming documents awaiting metadata."""
+
+    def test_claims_only_extracted_pending_documents(self, app, owner):
+        """Test that only extracted documents with pending metadata are claimed."""
+        ready = _create_document(owner, "ready.pdf")
+        _create_document(owner, "extracting.pdf", extraction_status="processing")
+        _create_document(owner, "done.pdf", metadata_status="completed")
+
+        claimed = MetadataService.claim_pending_batch(10)
+
+        assert [document.id for document in claimed] == [ready.id]
+        assert claimed[0].metadata_status == "processing"
+        assert claimed[0].metadata_claimed_at is not None
+        assert MetadataService.claim_pending_batch(10) == []
+
+    def test_release_stale_claims(self, app, owner):
+        """Test that abandoned claims return to pending."""
+        stale = _create_document(
+            owner,
+            "stale.pdf",
+            metadata_status="processing",
+            metadata_claimed_at=datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+        fresh = _create_document(
+            owner,
+            "fresh.pdf",
+            metadata_status="processing",
+            metadata_claimed_at=datetime.now(timezone.utc),
+        )
+
+        released = MetadataService.release_stale_claims(timeout_seconds=600)
+
+        db.session.refresh(stale)
+        db.session.refresh(fresh)
+        assert released == 1
+        assert stale.metadata_status == "pending"
+        assert fresh.metadata_status == "processing"
+
+
+class TestMetadataProcessing:
+    """Tests for enriching claimed documents."""
+
+    def test_saves_crossref_metadata(self, app, owner):
+        """Test that DOI and CrossRef metadata are stored."""
+        document = _create_document(owner, "paper.pdf")
+        metadata = {
+            "title": "Test Article",
+            "authors": ["John Doe", "Jane Smith"],
+            "journal": "Nature",
+            "year": 2023,
+            "publisher": "Nature Publishing Group",
+        }
+
+        with patch(
+            "app.services.metadata_service.DOIService.extract_doi_from_pdf",
+            return_value=("10.1038/test", None),
+        ), patch(
+            "app.services.metadata_service.CrossRefService.fetch_metadata",
+            return_value=(metadata, None),
+        ):
+            claimed, errors = MetadataService.process_batch(5)
+
+        db.session.refresh(document)
+        assert (claimed, errors) == (1, [])
+        assert document.metadata_status == "completed"
+        assert document.doi == "10.1038/test"
+        assert document.first_author == "Doe, J."
+        assert json.loads(document.co_authors) == ["Smith, J."]
+        assert document.journal_name == "Nature"
+        assert document.metadata_fetched_at is not None
+
+    def test_no_doi_completes_without_lookup(self, app, owner):
+        """Test that documents without a DOI need no CrossRef call."""
+        document = _create_document(owner, "nodoi.pdf")
+
+        with patch(
+            "app.services.metadata_service.DOIService.extract_doi_from_pdf",
+            return_value=(None, None),
+        ), patch(
+            "app.services.metadata_service.CrossRefService.fetch_metadata"
+        ) as mock_fetch:
+            MetadataService.process_batch(5)
+
+        db.session.refresh(document)
+        assert document.metadata_status == "completed"
+        mock_fetch.assert_not_called()
+
+    def test_crossref_error_marks_failed(self, app, owner):
+        """Test that CrossRef failures only fail the metadata stage."""
+        document = _create_document(owner, "error.pdf")
+
+        with patch(
+            "app.services.metadata_service.DOIService.extract_doi_from_pdf",
+            return_value=("10.1038/error", None),
+        ), patch(
+            "app.services.metadata_service.CrossRefService.fetch_metadata",
+            return_value=(None, "Request timeout"),
+        ):
+            MetadataService.process_batch(5)
+
+        db.session.refresh(document)
+        assert document.metadata_status == "failed"
+        assert document.doi == "10.1038/error"
+        assert document.extraction_status == "completed"
+
+    def test_unexpected_error_is_reported(self, app, owner):
+        """Test that exceptions mark the document failed and are returned."""
+        document = _create_document(owner, "boom.pdf")
+
+        with patch(
+            "app.services.metadata_service.DOIService.extract_doi_from_pdf",
+            side_effect=RuntimeError("boom"),
+        ):
+            claimed, errors = MetadataService.process_batch(5)
+
+        db.session.refresh(document)
+        assert claimed == 1
+        assert len(errors) == 1
+        assert document.metadata_status == "failed"
+
+
+class TestMetadataBackfill:
+    """Tests for bulk metadata backfill."""
+
+    def test_claims_eligible_documents_in_id_order(self, app, owner):
+        """Test that backfill walks failed, pending and stale documents by id."""
+        failed = _create_document(owner, "failed.pdf", metadata_status="failed")
+        pending = _create_document(owner, "pending.pdf")
+        old = _create_document(
+            owner,
+            "old.pdf",
+            metadata_status="completed",
+            metadata_fetched_at=datetime.now(timezone.utc) - timedelta(days=90),
+        )
+        _create_document(
+            owner,
+            "recent.pdf",
+            metadata_status="completed",
+            metadata_fetched_at=datetime.now(timezone.utc),
+        )
+        cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+
+        assert MetadataService.count_backfill_candidates(fetched_before=cutoff) == 3
+
+        first, last_id = MetadataService.claim_backfill_batch(
+            0, 2, fetched_before=cutoff
+        )
+        second, next_id = MetadataService.claim_backfill_batch(
+            last_id, 2, fetched_before=cutoff
+        )
+
+        assert [document.id for document in first] == [failed.id, pending.id]
+        assert [document.id for document in second] == [old.id]
+        assert MetadataService.claim_backfill_batch(next_id, 2) == ([], None)
+
+    def test_backfill_batch_reuses_stored_doi(self, app, owner):
+        """Test that known DOIs are looked up without reading the PDF."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        document = _create_document(
+            owner, "known.pdf", metadata_status="failed", doi="10.1038/known"
+        )
+        documents, _ = MetadataService.claim_backfill_batch(0, 10)
+        seen = []
+
+        with patch(
+            "app.services.metadata_service.DOIService.extract_doi_from_pdf"
+        ) as mock_extract, patch(
+            "app.services.metadata_service.CrossRefService.fetch_metadata",
+            return_value=({"title": "Known", "year": 2020}, None),
+        ) as mock_fetch, ThreadPoolExecutor(max_workers=2) as executor:
+            errors = MetadataService.backfill_batch(
+                documents, executor, on_result=seen.append
+            )
+
+        db.session.refresh(document)
+        assert errors == []
+        assert seen == documents
+        mock_extract.assert_not_called()
+        mock_fetch.assert_called_once_with("10.1038/known")
+        assert document.metadata_status == "completed"
+        assert document.metadata_claimed_at is None
+        assert document.publication_year == 2020
+
+    def test_interrupted_batch_releases_claims(self, app, owner):
+        """Test that an interrupted batch hands its documents back."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        document = _create_document(owner, "stop.pdf", metadata_status="failed")
+        documents, _ = MetadataService.claim_backfill_batch(0, 10)
+
+        def interrupt(_document):
+            raise KeyboardInterrupt
+
+        with patch(
+            "app.services.metadata_service.DOIService.extract_doi_from_pdf",
+            return_value=(None, None),
+        ), ThreadPoolExecutor(max_workers=1) as executor:
+            with pytest.raises(KeyboardInterrupt):
+                MetadataService.backfill_batch(documents, executor, on_result=interrupt)
+
+        db.session.refresh(document)
+        assert document.metadata_status == "pending"
+        assert document.metadata_claimed_at is None
+
+    def test_backfill_command(self, app, owner):
+        """Test the flask backfill-metadata command end to end."""
+        documents = [
+            _create_document(owner, f"cli{index}.pdf", metadata_status="failed")
+            for index in range(5)
+        ]
+
+        with patch(
+            "app.services.metadata_service.DOIService.extract_doi_from_pdf",
+            return_value=("10.1038/cli", None),
+        ), patch(
+            "app.services.metadata_service.CrossRefService.fetch_metadata",
+            return_value=({"title": "CLI"}, None),
+        ):
+            result = app.test_cli_runner().invoke(
+                args=["backfill-metadata", "--batch-size", "2", "--limit", "4"]
+            )
+
+        assert result.exit_code == 0, result.output
+        assert "Found 4 documents" in result.output
+        assert "Backfilled 4 documents: 4 with metadata" in result.output
+
+        db.session.expire_all()
+        statuses = [document.metadata_status for document in documents]
+        assert statuses == ["completed"] * 4 + ["failed"]
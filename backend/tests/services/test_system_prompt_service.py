@@ -1,5 +1,7 @@
 """Tests for SystemPromptService."""
 
+from unittest.mock import patch
+
 import pytest
 
 from app import db
@@ -228,3 +230,44 @@ class TestSystemPromptServiceValidProviders:
             assert "gemini" in SystemPromptService.VALID_PROVIDERS
             assert "openai" in SystemPromptService.VALID_PROVIDERS
             assert len(SystemPromptService.VALID_PROVIDERS) == 3
+
+
+class TestSystemPromptServiceCache:
+    """Tests for the in-process prompt cache."""
+
+    def test_cached_reads_skip_the_database(self, app):
+        """Test that repeated reads are served from the cache."""
+        SystemPromptService.update_prompt("claude", "Cached prompt")
+        SystemPromptService.get_cached_prompt_text("claude")
+
+        with patch.object(
+            SystemPromptService, "get_prompt_text", side_effect=AssertionError
+        ):
+            assert SystemPromptService.get_cached_prompt_text("claude") == (
+                "Cached prompt"
+            )
+
+    def test_update_and_reset_invalidate(self, app):
+        """Test that changes through the service are visible immediately."""
+        SystemPromptService.update_prompt("claude", "First")
+        assert SystemPromptService.get_cached_prompt_text("claude") == "First"
+        version = SystemPromptService.cache_version()
+
+        SystemPromptService.update_prompt("claude", "Second")
+        assert SystemPromptService.get_cached_prompt_text("claude") == "Second"
+
+        SystemPromptService.reset_to_default("claude")
+        assert SystemPromptService.get_cached_prompt_text("claude") is None
+        assert SystemPromptService.cache_version() > version
+
+    def test_changes_from_other_processes_seen_after_ttl(self, app):
+        """Test that direct table changes are picked up by the stamp check."""
+        assert SystemPromptService.get_cached_prompt_text("gemini") is None
+
+        # Simulate another process writing the table
+        db.session.add(SystemPromptConfig(provider="gemini", prompt="Remote"))
+        db.session.commit()
+        assert SystemPromptService.get_cached_prompt_text("gemini") is None
+
+        app.extensions["system_prompt_cache"].ttl = 0
+        assert SystemPromptService.get_cached_prompt_text("gemini") == "Remote"
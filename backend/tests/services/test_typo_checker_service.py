@@ -143,6 +143,64 @@ class TestProviderSelection:
 
         assert provider is None
 
+    def test_get_provider_reuses_instance_across_threads(self, app):
+        """Test that concurrent callers share one pooled instance."""
+        import threading
+
+        provider_class = MagicMock(side_effect=lambda: MagicMock())
+        seen = []
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": provider_class}
+        ):
+            threads = [
+                threading.Thread(
+                    target=lambda: seen.append(
+                        TypoCheckerService._get_provider("claude")
+                    )
+                )
+                for _ in range(8)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert provider_class.call_count == 1
+        assert len({id(provider) for provider in seen}) == 1
+
+    def test_reset_providers_rebuilds_instances(self, app):
+        """Test that reset_providers drops pooled instances."""
+        provider_class = MagicMock(side_effect=lambda: MagicMock())
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": provider_class}
+        ):
+            first = TypoCheckerService._get_provider("claude")
+            TypoCheckerService.reset_providers()
+            second = TypoCheckerService._get_provider("claude")
+
+        assert first is not second
+        assert provider_class.call_count == 2
+
+    def test_unavailable_provider_is_not_pooled(self, app):
+        """Test that a provider without an API key is rebuilt on next use."""
+        unavailable, available = MagicMock(), MagicMock()
+        unavailable.is_available.return_value = False
+        available.is_available.return_value = True
+        provider_class = MagicMock(side_effect=[unavailable, available])
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": provider_class}
+        ):
+            first = TypoCheckerService._get_provider("claude")
+            second = TypoCheckerService._get_provider("claude")
+            third = TypoCheckerService._get_provider("claude")
+
+        assert first is unavailable
+        assert second is third is available
+        assert provider_class.call_count == 2
+
 
 class TestCheckText:
     """Tests for the main check_text method."""
@@ -490,3 +548,674 @@ class TestCaching:
         assert result1["corrected_text"] == result2["corrected_text"]
         # API should not be called again (or call count should remain same)
         assert mock_instance.check_typo.call_count == call_count_after_first
+
+
+class TestJobClaiming:
+    """Tests for atomic typo check job claiming."""
+
+    def _create_job(self, user_id, text):
+        from app.models.typo_check_job import TypoCheckJob
+
+        job = TypoCheckJob(
+            user_id=user_id,
+            original_text=text,
+            original_text_hash=hashlib.sha256(text.encode()).hexdigest(),
+            provider="claude",
+        )
+        db.session.add(job)
+        db.session.commit()
+        return job
+
+    def test_claim_next_job_marks_processing(self, app):
+        """Test that claiming a job moves it to processing."""
+        user = User(email="claim@example.com", name="Test", password="password")
+        db.session.add(user)
+        db.session.commit()
+
+        job = self._create_job(user.id, "첫 번째")
+
+        claimed = TypoCheckerService.claim_next_job()
+
+        assert claimed is not None
+        assert claimed.id == job.id
+        assert claimed.status == "processing"
+        assert claimed.started_at is not None
+
+    def test_claim_next_job_never_returns_same_job_twice(self, app):
+        """Test that consecutive claims return distinct jobs."""
+        user = User(email="claim2@example.com", name="Test", password="password")
+        db.session.add(user)
+        db.session.commit()
+
+        first = self._create_job(user.id, "첫 번째")
+        second = self._create_job(user.id, "두 번째")
+
+        claimed_ids = [
+            TypoCheckerService.claim_next_job().id,
+            TypoCheckerService.claim_next_job().id,
+        ]
+
+        assert claimed_ids == [first.id, second.id]
+        assert TypoCheckerService.claim_next_job() is None
+
+
+def _make_user(email):
+    """Create and commit a user with the given email."""
+    user = User(email=email, name="Test", password="password")
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _mock_provider(name="claude", check_typo=None):
+    """Build a mock provider class and the available instance it returns."""
+    instance = MagicMock()
+    instance.is_available.return_value = True
+    instance.provider_name = name
+    if check_typo is not None:
+        instance.check_typo.side_effect = check_typo
+    return MagicMock(return_value=instance), instance
+
+
+def _slow_provider(delay, active=None, issue_word=None):
+    """Build a mock provider class whose check_typo sleeps per chunk.
+
+    Records the peak number of concurrent calls in ``active["peak"]`` and
+    reports one issue at the first occurrence of ``issue_word`` per chunk.
+    """
+    import threading
+    import time
+
+    lock = threading.Lock()
+    active = active if active is not None else {}
+    active.setdefault("now", 0)
+    active.setdefault("peak", 0)
+
+    def check_typo(text):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(delay)
+        with lock:
+            active["now"] -= 1
+
+        issues = []
+        if issue_word and issue_word in text:
+            issues.append(
+                TypoIssue(
+                    original=issue_word,
+                    corrected=issue_word,
+                    position=text.index(issue_word),
+                    issue_type="spelling",
+                    explanation="",
+                )
+            )
+        return AITypoCheckResult(
+            original_text=text,
+            corrected_text=text.upper(),
+            issues=issues,
+            provider="claude",
+            success=True,
+        )
+
+    return _mock_provider("claude", check_typo)
+
+
+class TestParallelChunks:
+    """Tests for concurrent chunk dispatch."""
+
+    def test_chunks_run_concurrently_and_reassemble_in_order(self, app):
+        """Test that wall time tracks the slowest chunk and order is kept."""
+        import time
+
+        provider_class, instance = _slow_provider(0.2, issue_word="marker")
+        text = "".join(f"chunk {i} marker. " + "a" * 7980 + ". " for i in range(5))
+        chunks = TypoCheckerService._chunk_text(text)
+        assert len(chunks) >= 5
+
+        user = _make_user("parallel@example.com")
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": provider_class}
+        ):
+            started = time.monotonic()
+            result = TypoCheckerService.check_text(text, user.id)
+            elapsed = time.monotonic() - started
+
+        assert result["success"] is True
+        assert elapsed < 0.2 * len(chunks) / 2
+        assert result["corrected_text"] == text.upper()
+        for issue in result["issues"]:
+            assert text[issue["position"] : issue["position"] + 6] == "marker"
+        assert len(result["issues"]) == text.count("marker")
+
+    def test_provider_concurrency_is_capped(self, app):
+        """Test that TYPO_PROVIDER_CONCURRENCY bounds in-flight requests."""
+        active = {}
+        provider_class, _ = _slow_provider(0.05, active=active)
+        app.config["TYPO_PROVIDER_CONCURRENCY"] = 2
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": provider_class}
+        ), patch.dict(TypoCheckerService._provider_slots, clear=True):
+            result = TypoCheckerService.check_text(
+                "가" * 40000, _make_user("capped@example.com").id
+            )
+
+        assert result["success"] is True
+        assert active["peak"] == 2
+
+    def test_failed_chunk_fails_the_check(self, app):
+        """Test that one failing chunk fails the whole check."""
+        provider_class, instance = _slow_provider(0)
+
+        def fail_second(text):
+            return AITypoCheckResult(
+                original_text=text,
+                corrected_text="",
+                provider="claude",
+                success=text.startswith("가"),
+                error_message="boom",
+            )
+
+        instance.check_typo.side_effect = fail_second
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": provider_class}
+        ):
+            result = TypoCheckerService.check_text(
+                "가" * 8000 + "나" * 8000, _make_user("fail@example.com").id
+            )
+
+        assert result["success"] is False
+        assert result["error"] == "boom"
+
+    def test_process_job_reports_progress(self, app):
+        """Test that job progress counts completed chunks."""
+        from app.models.typo_check_job import TypoCheckJob
+
+        provider_class, instance = _slow_provider(0.01)
+        user = _make_user("job@example.com")
+        text = "나" * 30000
+        job = TypoCheckJob(
+            user_id=user.id,
+            original_text=text,
+            original_text_hash=hashlib.sha256(text.encode()).hexdigest(),
+            provider="claude",
+        )
+        db.session.add(job)
+        db.session.commit()
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": provider_class}
+        ):
+            TypoCheckerService.process_job(job.id)
+
+        db.session.refresh(job)
+        assert job.status == "completed"
+        assert job.progress_total == 4
+        assert job.progress_current == 4
+        result = db.session.get(TypoCheckResult, job.result_id)
+        assert result.corrected_text == text.upper()
+
+
+class TestChunkCache:
+    """Tests for the per-chunk result cache."""
+
+    def _document(self, last_sentence):
+        paragraphs = [f"문단 {i} marker. " + "가" * 7980 + ". " for i in range(2)]
+        return "".join(paragraphs) + last_sentence
+
+    def test_edited_resubmission_only_rechecks_changed_chunks(self, app):
+        """Test that unchanged chunks are served from the cache."""
+        provider_class, instance = _slow_provider(0, issue_word="marker")
+        instance.get_system_prompt.return_value = "prompt"
+        user = _make_user("chunks@example.com")
+        original = self._document("마지막 문장 marker.")
+        edited = self._document("고친 마지막 문장 marker.")
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": provider_class}
+        ):
+            TypoCheckerService.check_text(original, user.id)
+            first_calls = instance.check_typo.call_count
+            result = TypoCheckerService.check_text(edited, user.id)
+
+        assert first_calls == 3
+        assert instance.check_typo.call_count == 4
+        assert result["corrected_text"] == edited.upper()
+        assert len(result["issues"]) == 3
+        for issue in result["issues"]:
+            assert edited[issue["position"] : issue["position"] + 6] == "marker"
+
+    def test_prompt_change_and_other_users_miss(self, app):
+        """Test that entries are scoped to user and prompt version."""
+        provider_class, instance = _slow_provider(0)
+        instance.get_system_prompt.return_value = "prompt v1"
+        first = _make_user("scope1@example.com")
+        second = _make_user("scope2@example.com")
+        text = "가나다라. " * 10
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": provider_class}
+        ):
+            TypoCheckerService.check_text(text, first.id)
+            TypoCheckerService.check_text(text, first.id)
+            assert instance.check_typo.call_count == 1
+
+            TypoCheckerService.check_text(text, second.id)
+            assert instance.check_typo.call_count == 2
+
+            instance.get_system_prompt.return_value = "prompt v2"
+            TypoCheckerService.check_text(text, first.id)
+            assert instance.check_typo.call_count == 3
+
+    def test_cache_can_be_disabled(self, app):
+        """Test that TYPO_CHUNK_CACHE_MAX_AGE_DAYS=0 disables the cache."""
+        from app.models.typo_chunk_cache import TypoChunkCacheEntry
+
+        provider_class, instance = _slow_provider(0)
+        app.config["TYPO_CHUNK_CACHE_MAX_AGE_DAYS"] = 0
+        user = _make_user("nocache@example.com")
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": provider_class}
+        ):
+            TypoCheckerService.check_text("가나다라.", user.id)
+
+        assert TypoChunkCacheEntry.query.count() == 0
+
+
+class TestSharedChunkCache:
+    """Tests for the opt-in cross-user chunk cache."""
+
+    def test_other_users_hit_shared_entries(self, app):
+        """Test that identical text from another user reuses the result."""
+        from app.models.typo_chunk_cache import TypoChunkCacheEntry
+
+        provider_class, instance = _slow_provider(0)
+        instance.get_system_prompt.return_value = "prompt"
+        app.config["TYPO_SHARED_CACHE"] = True
+        first = _make_user("shared1@example.com")
+        second = _make_user("shared2@example.com")
+        text = "가나다라. " * 10
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": provider_class}
+        ):
+            TypoCheckerService.check_text(text, first.id)
+            result = TypoCheckerService.check_text(text, second.id)
+
+        assert instance.check_typo.call_count == 1
+        assert result["corrected_text"] == text.upper()
+        entry = TypoChunkCacheEntry.query.one()
+        assert entry.user_id is None
+
+    def test_shared_keys_are_keyed_hashes(self, app):
+        """Test that shared keys cannot be recomputed without the secret."""
+        text = "가나다라."
+        plain = TypoCheckerService._chunk_cache_key("user", "claude", "v1", text)
+        first = TypoCheckerService._shared_chunk_cache_key(b"a", "claude", "v1", text)
+        second = TypoCheckerService._shared_chunk_cache_key(
+            b"b", "claude", "v1", text
+        )
+
+        assert len({plain, first, second}) == 3
+        assert hashlib.sha256(f"claude\0v1\0{text}".encode()).hexdigest() != first
+
+    def test_secret_accepts_str_or_bytes(self, app):
+        """Test that a bytes SECRET_KEY is used as the HMAC key unchanged."""
+        app.config["TYPO_SHARED_CACHE"] = True
+        app.config["TYPO_SHARED_CACHE_KEY"] = None
+
+        app.config["SECRET_KEY"] = b"raw-secret"
+        assert TypoCheckerService._shared_cache_secret() == b"raw-secret"
+
+        app.config["SECRET_KEY"] = "text-secret"
+        assert TypoCheckerService._shared_cache_secret() == b"text-secret"
+
+    def test_get_cached_result_needs_every_chunk(self, app):
+        """Test the submit fast path only answers fully cached texts."""
+        provider_class, instance = _slow_provider(0)
+        instance.get_system_prompt.return_value = "prompt"
+        app.config["TYPO_SHARED_CACHE"] = True
+        first = _make_user("fast1@example.com")
+        second = _make_user("fast2@example.com")
+        text = "가나다라. " * 10
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": provider_class}
+        ):
+            missing = TypoCheckerService.get_cached_result(text, second.id, "claude")
+            TypoCheckerService.check_text(text, first.id)
+            result = TypoCheckerService.get_cached_result(text, second.id, "claude")
+
+        assert missing is None
+        # A shared hit must not reveal that another account sent the text
+        assert result["cached"] is False
+        assert result["corrected_text"] == text.upper()
+        assert instance.check_typo.call_count == 1
+        assert TypoCheckResult.query.filter_by(user_id=second.id).count() == 1
+
+
+    def test_get_cached_result_flags_own_tier_hits(self, app):
+        """Test that a hit in the user's own tier is reported as cached."""
+        provider_class, instance = _slow_provider(0)
+        instance.get_system_prompt.return_value = "prompt"
+        user = _make_user("own-tier@example.com")
+        text = "가나다라. " * 10
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": provider_class}
+        ):
+            TypoCheckerService.check_text(text, user.id)
+            result = TypoCheckerService.get_cached_result(text, user.id, "claude")
+
+        assert result["cached"] is True
+        assert instance.check_typo.call_count == 1
+
+
+class TestIncrementalCheck:
+    """Tests for diff-aware re-checks of edited text."""
+
+    def _lines(self, middle):
+        return f"첫째 줄 marker.\n{middle}\n셋째 줄 marker.\n"
+
+    def test_only_changed_paragraphs_are_rechecked(self, app):
+        """Test that unchanged paragraphs keep their issues, shifted."""
+        provider_class, instance = _slow_provider(0, issue_word="marker")
+        instance.get_system_prompt.return_value = "prompt"
+        user = _make_user("incremental@example.com")
+        edited = self._lines("고쳐서 더 길어진 둘째 줄 marker.")
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": provider_class}
+        ):
+            TypoCheckerService.check_text(self._lines("둘째 줄 marker."), user.id)
+            result = TypoCheckerService.check_text(edited, user.id)
+
+        assert instance.check_typo.call_count == 2
+        instance.check_typo.assert_called_with("고쳐서 더 길어진 둘째 줄 marker.\n")
+        # The first check reported the first line's marker only
+        positions = sorted(issue["position"] for issue in result["issues"])
+        assert positions == [edited.index("marker"), edited.index("marker", 12)]
+        assert result["corrected_text"].splitlines()[1] == (
+            "고쳐서 더 길어진 둘째 줄 MARKER."
+        )
+
+    def test_prompt_change_disables_reuse(self, app):
+        """Test that results from another prompt version are not reused."""
+        provider_class, instance = _slow_provider(0, issue_word="marker")
+        instance.get_system_prompt.return_value = "prompt v1"
+        user = _make_user("incremental-prompt@example.com")
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": provider_class}
+        ):
+            TypoCheckerService.check_text(self._lines("둘째 줄."), user.id)
+            instance.get_system_prompt.return_value = "prompt v2"
+            TypoCheckerService.check_text(self._lines("바뀐 둘째 줄."), user.id)
+
+        instance.check_typo.assert_called_with(self._lines("바뀐 둘째 줄."))
+
+    def test_dissimilar_text_is_checked_in_full(self, app):
+        """Test that unrelated text does not reuse previous paragraphs."""
+        provider_class, instance = _slow_provider(0)
+        instance.get_system_prompt.return_value = "prompt"
+        user = _make_user("incremental-new@example.com")
+        other = "완전히\n다른\n글입니다.\n"
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": provider_class}
+        ):
+            TypoCheckerService.check_text(self._lines("둘째 줄."), user.id)
+            TypoCheckerService.check_text(other, user.id)
+
+        instance.check_typo.assert_called_with(other)
+
+    def test_nearby_edits_are_checked_together_with_context(self, app):
+        """Test that close changed lines share one request with the gap."""
+        provider_class, instance = _slow_provider(0)
+        instance.get_system_prompt.return_value = "prompt"
+        user = _make_user("incremental-nearby@example.com")
+        lines = [f"문장 {i} " + "가" * 100 + ".\n" for i in range(200)]
+        edited = list(lines)
+        edited[3] = "바뀐 문장 3.\n"
+        edited[6] = "바뀐 문장 6.\n"
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": provider_class}
+        ):
+            TypoCheckerService.check_text("".join(lines), user.id)
+            instance.check_typo.reset_mock()
+            result = TypoCheckerService.check_text("".join(edited), user.id)
+
+        assert result["corrected_text"] == "".join(
+            line.upper() for line in edited
+        )
+        instance.check_typo.assert_called_once_with("".join(edited[3:7]))
+
+    def test_scattered_edits_do_not_multiply_requests(self, app):
+        """Test that many spread-out edits cost no more than a full check."""
+        provider_class, instance = _slow_provider(0)
+        instance.get_system_prompt.return_value = "prompt"
+        user = _make_user("incremental-scattered@example.com")
+        lines = [f"문장 {i} " + "가" * 100 + ".\n" for i in range(420)]
+        edited = [
+            f"바뀐 문장 {i}.\n" if i % 10 == 5 else line
+            for i, line in enumerate(lines)
+        ]
+        text = "".join(edited)
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": provider_class}
+        ):
+            TypoCheckerService.check_text("".join(lines), user.id)
+            instance.check_typo.reset_mock()
+            result = TypoCheckerService.check_text(text, user.id)
+
+        assert result["corrected_text"] == text.upper()
+        assert instance.check_typo.call_count <= len(
+            TypoCheckerService._chunk_text(text)
+        )
+
+
+class TestProviderRouting:
+    """Tests for health-aware default provider selection."""
+
+    def test_prefers_fastest_healthy_provider(self, app):
+        """Test that the provider with the lowest median latency wins."""
+        claude_class, claude = _mock_provider("claude")
+        openai_class, openai = _mock_provider("openai")
+        registry = {"claude": claude_class, "openai": openai_class}
+
+        with patch.dict(TypoCheckerService._provider_registry, registry, clear=True):
+            # Unmeasured providers are tried first, in preference order
+            assert TypoCheckerService._get_default_provider() is claude
+
+            health = TypoCheckerService._get_health()
+            health.record("claude", 2.0, True)
+            assert TypoCheckerService._get_default_provider() is openai
+
+            health.record("openai", 0.5, True)
+            assert TypoCheckerService._get_default_provider() is openai
+
+    def test_failing_provider_ranks_below_slow_one(self, app):
+        """Test that failed calls below the circuit threshold still count."""
+        claude_class, claude = _mock_provider("claude")
+        openai_class, openai = _mock_provider("openai")
+        registry = {"claude": claude_class, "openai": openai_class}
+
+        with patch.dict(TypoCheckerService._provider_registry, registry, clear=True):
+            health = TypoCheckerService._get_health()
+            for _ in range(4):
+                health.record("claude", 0.1, False)
+            health.record("openai", 2.0, True)
+
+            assert TypoCheckerService._get_default_provider() is openai
+
+    def test_skips_provider_with_open_circuit(self, app):
+        """Test that failing calls trip the circuit and reroute traffic."""
+        claude_class, claude = _mock_provider("claude")
+        openai_class, openai = _mock_provider("openai")
+        claude.check_typo.side_effect = RuntimeError("overloaded")
+        app.config["TYPO_CIRCUIT_FAILURES"] = 2
+        registry = {"claude": claude_class, "openai": openai_class}
+
+        with patch.dict(TypoCheckerService._provider_registry, registry, clear=True):
+            TypoCheckerService._get_health().record("openai", 5.0, True)
+            for _ in range(2):
+                try:
+                    TypoCheckerService._check_chunk(claude, "가나다")
+                except RuntimeError:
+                    pass
+
+            assert TypoCheckerService._get_default_provider() is openai
+
+    def test_rejected_chunk_is_rerouted(self, app):
+        """Test that a chunk turned away by an open circuit goes elsewhere."""
+        claude_class, claude = _mock_provider("claude")
+        openai_class, openai = _mock_provider("openai")
+        openai.check_typo.return_value = AITypoCheckResult(
+            original_text="가나다", corrected_text="가나다", provider="openai"
+        )
+        app.config["TYPO_CIRCUIT_FAILURES"] = 1
+        registry = {"claude": claude_class, "openai": openai_class}
+
+        with patch.dict(TypoCheckerService._provider_registry, registry, clear=True):
+            TypoCheckerService._get_health().record("claude", 1.0, False)
+            result = TypoCheckerService._check_chunk(claude, "가나다")
+
+        assert result.provider == "openai"
+        claude.check_typo.assert_not_called()
+
+    def test_rejected_chunk_fails_without_alternative(self, app):
+        """Test that a chunk fails fast when no provider will take it."""
+        claude_class, claude = _mock_provider("claude")
+        app.config["TYPO_CIRCUIT_FAILURES"] = 1
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": claude_class}, clear=True
+        ):
+            TypoCheckerService._get_health().record("claude", 1.0, False)
+            result = TypoCheckerService._check_chunk(claude, "가나다")
+
+        assert result.success is False
+        claude.check_typo.assert_not_called()
+
+    def test_all_tripped_falls_back_to_preference(self, app):
+        """Test that a provider is still returned when every circuit is open."""
+        claude_class, claude = _mock_provider("claude")
+        app.config["TYPO_CIRCUIT_FAILURES"] = 1
+
+        with patch.dict(
+            TypoCheckerService._provider_registry, {"claude": claude_class}, clear=True
+        ):
+            TypoCheckerService._get_health().record("claude", 1.0, False)
+
+            assert TypoCheckerService._get_default_provider() is claude
+
+
+class TestHedgedRequests:
+    """Tests for hedging short checks across providers."""
+
+    def _provider(self, name, delay=0, gate=None):
+        import time
+
+        def check_typo(text):
+            time.sleep(delay)
+            if gate is not None:
+                gate.wait(5)
+            return AITypoCheckResult(
+                original_text=text,
+                corrected_text=f"{name}: {text}",
+                issues=[],
+                provider=name,
+                success=True,
+            )
+
+        provider_class, instance = _mock_provider(name, check_typo)
+        instance.get_system_prompt.return_value = "prompt"
+        return provider_class, instance
+
+    def _setup(self, app, budget):
+        app.config["TYPO_HEDGING"] = True
+        app.config["TYPO_HEDGE_BUDGET"] = budget
+        user = _make_user("hedge@example.com")
+
+        # claude is the faster provider by median, so it is the primary
+        health = TypoCheckerService._get_health()
+        health.record("claude", 0.05, True)
+        health.record("openai", 1.0, True)
+        return user
+
+    def test_slow_primary_is_hedged(self, app):
+        """Test that a second provider answers when the primary stalls."""
+        import threading
+        import time
+
+        # The primary stays blocked until the check has returned
+        release = threading.Event()
+        claude_class, _ = self._provider("claude", gate=release)
+        openai_class, openai = self._provider("openai")
+        registry = {"claude": claude_class, "openai": openai_class}
+        user = self._setup(app, 0.1)
+
+        try:
+            with patch.dict(
+                TypoCheckerService._provider_registry, registry, clear=True
+            ):
+                result = TypoCheckerService.check_text("가나다라.", user.id)
+            # The stalled primary is still running and holds budget
+            budget = TypoCheckerService._get_hedge_budget()
+            assert budget._abandoned == 1
+        finally:
+            release.set()
+
+        assert result["corrected_text"] == "openai: 가나다라."
+        assert result["provider"] == "openai"
+        assert openai.check_typo.call_count == 1
+
+        deadline = time.monotonic() + 5
+        while budget._abandoned and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert budget._abandoned == 0
+
+    def test_cancelled_chunk_does_not_call_provider(self, app):
+        """Test that a loser cancelled before its call never reaches it."""
+        import threading
+
+        _, claude = self._provider("claude")
+        cancelled = threading.Event()
+        cancelled.set()
+
+        result = TypoCheckerService._check_chunk(claude, "가나다라.", cancelled)
+
+        assert result.success is False
+        assert claude.check_typo.call_count == 0
+
+    def test_no_hedge_without_budget(self, app):
+        """Test that an exhausted budget waits for the primary."""
+        claude_class, _ = self._provider("claude", 0.2)
+        openai_class, openai = self._provider("openai")
+        registry = {"claude": claude_class, "openai": openai_class}
+        user = self._setup(app, 0)
+
+        with patch.dict(TypoCheckerService._provider_registry, registry, clear=True):
+            result = TypoCheckerService.check_text("가나다라.", user.id)
+
+        assert result["provider"] == "claude"
+        assert openai.check_typo.call_count == 0
+
+    def test_explicit_provider_is_not_hedged(self, app):
+        """Test that a requested provider is never hedged away."""
+        claude_class, _ = self._provider("claude", 0.2)
+        openai_class, openai = self._provider("openai")
+        registry = {"claude": claude_class, "openai": openai_class}
+        user = self._setup(app, 1)
+
+        with patch.dict(TypoCheckerService._provider_registry, registry, clear=True):
+            result = TypoCheckerService.check_text("가나다라.", user.id, "claude")
+
+        assert result["provider"] == "claude"
+        assert openai.check_typo.call_count == 0
@@ -31,3 +31,70 @@ class TestAppFactory:
         response = client.get("/api/health")
         assert response.status_code == 200
         assert response.json["status"] == "ok"
+
+
+class TestWorkerProcessMode:
+    """Test cases for running workers outside the web process."""
+
+    def test_run_workers_command_registered(self, app):
+        """Test that the dedicated worker command is available."""
+        assert "run-workers" in app.cli.commands
+
+    def test_run_workers_shuts_down_on_sigterm(self, app):
+        """Test that SIGTERM goes through the graceful shutdown path."""
+        import signal
+        from unittest.mock import patch
+
+        with patch("app.worker.init_worker"), patch(
+            "app.typo_worker.init_typo_worker"
+        ), patch("app.metadata_worker.init_metadata_worker"), patch(
+            "app.worker.extraction_worker.shutdown"
+        ) as extraction_shutdown, patch(
+            "app.typo_worker.typo_check_worker.shutdown"
+        ) as typo_shutdown, patch(
+            "app.metadata_worker.metadata_worker.shutdown"
+        ) as metadata_shutdown, patch(
+            "time.sleep", side_effect=lambda _: signal.raise_signal(signal.SIGTERM)
+        ):
+            previous = signal.getsignal(signal.SIGTERM)
+            try:
+                result = app.test_cli_runner().invoke(args=["run-workers"])
+            finally:
+                signal.signal(signal.SIGTERM, previous)
+
+        assert "Shutting down workers" in result.output
+        extraction_shutdown.assert_called_once()
+        typo_shutdown.assert_called_once()
+        metadata_shutdown.assert_called_once()
+
+    def test_wake_up_without_scheduler_is_noop(self):
+        """Test that web-only processes can signal wake-up safely."""
+        from app.metadata_worker import MetadataWorkerManager
+        from app.worker import ExtractionWorkerManager
+        from app.typo_worker import TypoCheckWorkerManager
+
+        extraction = ExtractionWorkerManager()
+        typo = TypoCheckWorkerManager()
+        metadata = MetadataWorkerManager()
+
+        extraction.wake_up()
+        typo.wake_up()
+        metadata.wake_up()
+
+        assert extraction.is_running is False
+        assert typo.is_running is False
+        assert metadata.is_running is False
+
+    def test_idle_pause_disabled_for_dedicated_worker(self, app):
+        """Test that max_idle_checks=None keeps the worker polling."""
+        from app.worker import ExtractionWorkerManager
+
+        manager = ExtractionWorkerManager(interval_seconds=60, max_idle_checks=None)
+        manager.init_app(app)
+        manager.start()
+        try:
+            for _ in range(20):
+                manager._process_queue()
+            assert manager.is_running is True
+        finally:
+            manager.shutdown()
@@ -0,0 +1,93 @@
+"""Smoke tests for the benchmark harness."""
+
+import pdfplumber
+
+from benchmarks.corpus import generate_corpus
+from benchmarks.extraction_benchmark import run_benchmark
+from benchmarks.search_benchmark import (
+    QUERY_KINDS,
+    _percentile,
+    build_workload,
+    run_benchmark as run_search_benchmark,
+    seed_database,
+)
+
+
+class TestCorpus:
+    """Tests for the synthetic corpus generator."""
+
+    def test_generates_extractable_korean_text(self, tmp_path):
+        """Generated PDFs have the requested pages and extractable text."""
+        corpus = generate_corpus(
+            str(tmp_path), documents=2, pages=3, korean_ratio=1.0, columns=2
+        )
+
+        assert len(corpus) == 2
+        with pdfplumber.open(corpus[0].path) as pdf:
+            assert len(pdf.pages) == 3
+            text = pdf.pages[0].extract_text()
+
+        assert "Benchmark page 1" in text
+        assert any("가" <= ch <= "힣" for ch in text)
+
+    def test_same_seed_is_reproducible(self, tmp_path):
+        """The same seed yields the same content."""
+        first = generate_corpus(str(tmp_path / "a"), documents=1, pages=1, seed=7)
+        second = generate_corpus(str(tmp_path / "b"), documents=1, pages=1, seed=7)
+
+        with pdfplumber.open(first[0].path) as a, pdfplumber.open(second[0].path) as b:
+            assert a.pages[0].extract_text() == b.pages[0].extract_text()
+
+
+class TestExtractionBenchmark:
+    """Tests for the extraction benchmark runner."""
+
+    def test_reports_both_phases(self, app, tmp_path):
+        """Both phases process every page and report metrics."""
+        app.config["EXTRACTION_SANDBOX_ENABLED"] = False
+        corpus = generate_corpus(str(tmp_path), documents=2, pages=2)
+
+        results = run_benchmark(app, corpus, mode="fast", batch_size=1)
+
+        for phase in ("extract_text", "pipeline"):
+            assert results[phase]["pages"] == 4
+            assert results[phase]["pages_per_second"] > 0
+            assert results[phase]["db_statements"] > 0
+            assert results[phase]["errors"] == []
+        assert results["config"]["mode"] == "fast"
+        assert results["peak_rss_mb"]["self"] > 0
+
+
+class TestSearchBenchmark:
+    """Tests for the search latency benchmark."""
+
+    def test_percentiles_and_hits(self, app):
+        """Seeded queries hit, misses return nothing and stats are reported."""
+        user_ids, phrases = seed_database(
+            app, users=2, documents=2, pages=3, words_per_page=50
+        )
+        workload = build_workload(60, user_ids, phrases)
+
+        results = run_search_benchmark(app, workload, target="route", warmup=6)
+
+        assert results["overall"]["queries"] == 54
+        overall = results["overall"]
+        assert 0 < overall["p50_ms"] <= overall["p95_ms"] <= overall["p99_ms"]
+        assert set(results["by_kind"]) == set(QUERY_KINDS)
+        assert results["by_kind"]["phrase"]["mean_total_results"] >= 1
+        assert results["by_kind"]["miss"]["mean_total_results"] == 0
+
+    def test_reseeding_the_same_database(self, app):
+        """A second seed run against the same database adds new users."""
+        first, _ = seed_database(app, users=2, documents=1, pages=1, words_per_page=5)
+        second, _ = seed_database(app, users=2, documents=1, pages=1, words_per_page=5)
+
+        assert len(set(first) | set(second)) == 4
+
+    def test_percentile_nearest_rank(self):
+        """Percentiles use the nearest-rank method."""
+        values = [float(v) for v in range(1, 101)]
+
+        assert _percentile(values, 50) == 50.0
+        assert _percentile(values, 99) == 99.0
+        assert _percentile([3.0], 95) == 3.0
@@ -199,6 +199,174 @@ class TestExtractionService:
             next_item = ExtractionService.get_next_pending()
             assert next_item is None
 
+    def test_claim_next_pending_marks_processing(self, app):
+        """Test claiming moves the item to processing and skips it afterwards."""
+        from app.models import db
+        from app.models.user import User
+        from app.models.document import SearchDocument
+        from app.services.extraction_service import ExtractionService
+
+        with app.app_context():
+            user = User(
+                email="test@example.com",
+                name="Test User",
+                password="password123"
+            )
+            db.session.add(user)
+            db.session.commit()
+
+            doc1 = SearchDocument(
+                owner_id=user.id,
+                filename="first.pdf",
+                original_filename="first.pdf",
+                file_path="/storage/first.pdf"
+            )
+            doc2 = SearchDocument(
+                owner_id=user.id,
+                filename="second.pdf",
+                original_filename="second.pdf",
+                file_path="/storage/second.pdf"
+            )
+            db.session.add_all([doc1, doc2])
+            db.session.commit()
+            ExtractionService.add_to_queue(doc1.id, priority=5)
+            ExtractionService.add_to_queue(doc2.id, priority=1)
+
+            first = ExtractionService.claim_next_pending()
+            assert first.document_id == doc1.id
+            assert first.status == "processing"
+            assert first.started_at is not None
+
+            # Claimed items are no longer visible to other workers
+            second = ExtractionService.claim_next_pending()
+            assert second.document_id == doc2.id
+
+            assert ExtractionService.claim_next_pending() is None
+
+    def test_compute_priority_prefers_small_documents(self, app):
+        """Test size-aware priority derivation."""
+        from app.services.extraction_service import ExtractionService
+
+        with app.app_context():
+            small = ExtractionService.compute_priority(200 * 1024)
+            medium = ExtractionService.compute_priority(4 * 1024 * 1024)
+            large = ExtractionService.compute_priority(50 * 1024 * 1024)
+
+            assert small > medium > large
+            assert large == 0
+            assert ExtractionService.compute_priority(None) == 0
+            # Known page count takes precedence over file size
+            assert ExtractionService.compute_priority(
+                50 * 1024 * 1024, page_count=2
+            ) == small
+
+    def test_add_to_queue_derives_priority_from_size(self, app):
+        """Test that queueing without a priority uses the document size."""
+        from app.models import db
+        from app.models.user import User
+        from app.models.document import SearchDocument
+        from app.services.extraction_service import ExtractionService
+
+        with app.app_context():
+            user = User(
+                email="test@example.com",
+                name="Test User",
+                password="password123"
+            )
+            db.session.add(user)
+            db.session.commit()
+
+            document = SearchDocument(
+                owner_id=user.id,
+                filename="paper.pdf",
+                original_filename="paper.pdf",
+                file_path="/storage/paper.pdf",
+                file_size_bytes=300 * 1024
+            )
+            db.session.add(document)
+            db.session.commit()
+
+            queue_item = ExtractionService.add_to_queue(document.id)
+
+            assert queue_item.priority == ExtractionService.compute_priority(
+                300 * 1024
+            )
+            assert queue_item.priority > 0
+
+    def test_claim_pending_batch_round_robins_owners(self, app):
+        """Test that one owner's bulk import does not starve other owners."""
+        from app.models import db
+        from app.models.user import User
+        from app.models.document import SearchDocument
+        from app.services.extraction_service import ExtractionService
+
+        with app.app_context():
+            bulk_user = User(
+                email="bulk@example.com",
+                name="Bulk User",
+                password="password123"
+            )
+            other_user = User(
+                email="other@example.com",
+                name="Other User",
+                password="password123"
+            )
+            db.session.add_all([bulk_user, other_user])
+            db.session.commit()
+
+            bulk_docs = []
+            for i in range(3):
+                document = SearchDocument(
+                    owner_id=bulk_user.id,
+                    filename=f"bulk{i}.pdf",
+                    original_filename=f"bulk{i}.pdf",
+                    file_path=f"/storage/bulk{i}.pdf"
+                )
+                db.session.add(document)
+                db.session.commit()
+                ExtractionService.add_to_queue(document.id, priority=0)
+                bulk_docs.append(document)
+
+            other_doc = SearchDocument(
+                owner_id=other_user.id,
+                filename="other.pdf",
+                original_filename="other.pdf",
+                file_path="/storage/other.pdf"
+            )
+            db.session.add(other_doc)
+            db.session.commit()
+            ExtractionService.add_to_queue(other_doc.id, priority=0)
+
+            claimed = ExtractionService.claim_pending_batch(2)
+
+            assert [item.document_id for item in claimed] == [
+                bulk_docs[0].id,
+                other_doc.id,
+            ]
+
+    def test_owner_round_is_bounded_per_owner_on_postgresql(self, app):
+        """Test that PostgreSQL ranks at most ``limit`` items per owner."""
+        from unittest.mock import MagicMock, patch
+        from sqlalchemy import select
+        from sqlalchemy.dialects import postgresql
+        from app.models import db
+        from app.services.extraction_service import ExtractionService
+
+        bind = MagicMock()
+        bind.dialect.name = "postgresql"
+        with app.app_context(), patch.object(
+            db.session, "get_bind", return_value=bind
+        ):
+            owner_round = ExtractionService._owner_round_subquery(5)
+
+        sql = str(
+            select(owner_round).compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+        )
+        assert "LATERAL" in sql
+        assert "LIMIT 5" in sql
+
     def test_process_next_success(self, app):
         """Test processing next item successfully."""
         from app.models import db
@@ -360,6 +528,147 @@ class TestExtractionService:
                 if os.path.exists(temp_path):
                     os.unlink(temp_path)
 
+    def test_process_batch_writes_statuses_for_whole_batch(self, app):
+        """Test batch processing completes good items and retries bad ones."""
+        from app.models import db
+        from app.models.user import User
+        from app.models.document import SearchDocument
+        from app.models.page import SearchPage
+        from app.services.extraction_service import ExtractionService
+
+        with app.app_context():
+            user = User(
+                email="test@example.com",
+                name="Test User",
+                password="password123"
+            )
+            db.session.add(user)
+            db.session.commit()
+
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+                temp_path = f.name
+
+            try:
+                from reportlab.lib.pagesizes import letter
+                from reportlab.pdfgen import canvas
+
+                c = canvas.Canvas(temp_path, pagesize=letter)
+                c.drawString(100, 750, "Batch page content")
+                c.showPage()
+                c.save()
+
+                good = SearchDocument(
+                    owner_id=user.id,
+                    filename="good.pdf",
+                    original_filename="good.pdf",
+                    file_path=temp_path
+                )
+                bad = SearchDocument(
+                    owner_id=user.id,
+                    filename="bad.pdf",
+                    original_filename="bad.pdf",
+                    file_path="/nonexistent/path.pdf"
+                )
+                db.session.add_all([good, bad])
+                db.session.commit()
+
+                good_item = ExtractionService.add_to_queue(good.id)
+                bad_item = ExtractionService.add_to_queue(bad.id)
+
+                with patch(
+                    "app.services.metadata_service.DOIService.extract_doi_from_pdf"
+                ) as mock_doi:
+                    claimed, errors = ExtractionService.process_batch(5)
+
+                # Metadata is left to the metadata worker
+                mock_doi.assert_not_called()
+
+                assert claimed == 2
+                assert len(errors) == 1
+
+                db.session.refresh(good_item)
+                db.session.refresh(bad_item)
+                db.session.refresh(good)
+                assert good_item.status == "completed"
+                assert good.extraction_status == "completed"
+                assert good.page_count == 1
+                assert good.metadata_status == "pending"
+                assert SearchPage.query.filter_by(document_id=good.id).count() == 1
+
+                assert bad_item.status == "pending"
+                assert bad_item.retry_count == 1
+
+                # Only the failed item is left; the next batch retries it
+                claimed, errors = ExtractionService.process_batch(5)
+                assert claimed == 1
+                assert len(errors) == 1
+                db.session.refresh(bad_item)
+                assert bad_item.retry_count == 2
+
+            finally:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+
+    @pytest.mark.parametrize("mode", ["fast", "balanced", "precise"])
+    def test_extract_text_records_extraction_mode(self, app, mode):
+        """Test each extraction mode produces pages and is recorded."""
+        from app.models import db
+        from app.models.user import User
+        from app.models.document import SearchDocument
+        from app.models.page import SearchPage
+        from app.services.extraction_service import ExtractionService
+
+        with app.app_context():
+            user = User(
+                email="test@example.com",
+                name="Test User",
+                password="password123"
+            )
+            db.session.add(user)
+            db.session.commit()
+
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+                temp_path = f.name
+
+            try:
+                from reportlab.lib.pagesizes import letter
+                from reportlab.pdfgen import canvas
+
+                c = canvas.Canvas(temp_path, pagesize=letter)
+                c.drawString(100, 750, "Extraction mode content")
+                c.showPage()
+                c.save()
+
+                document = SearchDocument(
+                    owner_id=user.id,
+                    filename="mode.pdf",
+                    original_filename="mode.pdf",
+                    file_path=temp_path
+                )
+                db.session.add(document)
+                db.session.commit()
+
+                page_count = ExtractionService.extract_text(document.id, mode=mode)
+
+                assert page_count == 1
+                page = SearchPage.query.filter_by(document_id=document.id).one()
+                assert "extraction mode content" in page.content_normalized
+
+                db.session.refresh(document)
+                assert document.extraction_mode == mode
+
+            finally:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+
+    def test_unknown_extraction_mode_falls_back_to_default(self, app):
+        """Test that an invalid mode resolves to the balanced default."""
+        from app.services.extraction_service import ExtractionService
+
+        with app.app_context():
+            assert ExtractionService.get_extraction_mode("bogus") == "balanced"
+            assert ExtractionService.get_extraction_mode("fast") == "fast"
+
     def test_process_next_failure_increments_retry(self, app):
         """Test processing failure increments retry count."""
         from app.models import db
@@ -226,6 +226,85 @@ class TestRateLimiterWait:
         assert elapsed >= 0.1
 
 
+class TestRateLimiterExactWait:
+    """Test cases for exact-wait blocking and the async variant."""
+
+    def test_wait_matches_refill_time(self):
+        """Test that a blocked acquire returns when the next token is due."""
+        from app.utils.rate_limiter import RateLimiter
+
+        limiter = RateLimiter(rate=10, per_seconds=1)
+        for _ in range(10):
+            limiter.acquire()
+
+        start = time.monotonic()
+        assert limiter.acquire(wait=True, timeout=1.0) is True
+        elapsed = time.monotonic() - start
+
+        # One token every 100ms
+        assert 0.08 <= elapsed < 0.2
+
+    def test_waiters_sustain_configured_rate(self):
+        """Test that concurrent waiters get exactly rate tokens per period."""
+        from app.utils.rate_limiter import RateLimiter
+
+        limiter = RateLimiter(rate=20, per_seconds=1)
+        for _ in range(20):
+            limiter.acquire()
+
+        start = time.monotonic()
+        threads = [
+            threading.Thread(target=limiter.acquire, kwargs={"wait": True})
+            for _ in range(10)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.monotonic() - start
+
+        # 10 tokens at 20/s take ~0.5s
+        assert 0.45 <= elapsed < 0.8
+
+    def test_reset_wakes_waiters(self):
+        """Test that reset() releases blocked waiters immediately."""
+        from app.utils.rate_limiter import RateLimiter
+
+        limiter = RateLimiter(rate=1, per_seconds=60)
+        limiter.acquire()
+        results = []
+
+        waiter = threading.Thread(
+            target=lambda: results.append(limiter.acquire(wait=True, timeout=5))
+        )
+        start = time.monotonic()
+        waiter.start()
+        time.sleep(0.05)
+        limiter.reset()
+        waiter.join()
+
+        assert results == [True]
+        assert time.monotonic() - start < 1
+
+    def test_acquire_async(self):
+        """Test the asyncio variant waits and times out like acquire()."""
+        import asyncio
+        from app.utils.rate_limiter import RateLimiter
+
+        limiter = RateLimiter(rate=10, per_seconds=1)
+        for _ in range(10):
+            limiter.acquire()
+
+        async def run():
+            acquired = await limiter.acquire_async(timeout=1.0)
+            slow = RateLimiter(rate=1, per_seconds=10)
+            slow.acquire()
+            timed_out = await slow.acquire_async(timeout=0.05)
+            return acquired, timed_out
+
+        assert asyncio.run(run()) == (True, False)
+
+
 class TestRateLimiterReset:
     """Test cases for rate limiter reset functionality."""
 
@@ -263,3 +342,123 @@ class TestRateLimiterReset:
         # Reset and try again
         limiter.reset()
         assert limiter.acquire() is True
+
+
+class TestDatabaseRateLimiter:
+    """Test cases for the cross-process database-backed limiter."""
+
+    def test_instances_share_one_bucket(self, app):
+        """Test that limiters with the same name draw from one budget."""
+        from app.models import db
+        from app.utils.rate_limiter import DatabaseRateLimiter
+
+        first = DatabaseRateLimiter(db.engine, "shared", rate=5, per_seconds=60)
+        second = DatabaseRateLimiter(db.engine, "shared", rate=5, per_seconds=60)
+
+        results = [first.acquire() for _ in range(3)]
+        results += [second.acquire() for _ in range(3)]
+
+        assert results == [True] * 5 + [False]
+        assert first.tokens < 1
+
+    def test_buckets_are_independent_by_name(self, app):
+        """Test that differently named buckets do not interfere."""
+        from app.models import db
+        from app.utils.rate_limiter import DatabaseRateLimiter
+
+        first = DatabaseRateLimiter(db.engine, "one", rate=1, per_seconds=60)
+        second = DatabaseRateLimiter(db.engine, "two", rate=1, per_seconds=60)
+
+        assert first.acquire() is True
+        assert second.acquire() is True
+        assert first.acquire() is False
+
+    def test_wait_uses_shared_refill_time(self, app):
+        """Test that a blocked acquire waits until the shared token is due."""
+        from app.models import db
+        from app.utils.rate_limiter import DatabaseRateLimiter
+
+        first = DatabaseRateLimiter(db.engine, "paced", rate=10, per_seconds=1)
+        second = DatabaseRateLimiter(db.engine, "paced", rate=10, per_seconds=1)
+        for _ in range(10):
+            first.acquire()
+
+        start = time.monotonic()
+        assert second.acquire(wait=True, timeout=1.0) is True
+        elapsed = time.monotonic() - start
+
+        assert 0.08 <= elapsed < 0.3
+
+    def test_reset_refills_shared_bucket(self, app):
+        """Test that reset() restores the shared budget."""
+        from app.models import db
+        from app.utils.rate_limiter import DatabaseRateLimiter
+
+        first = DatabaseRateLimiter(db.engine, "reset", rate=2, per_seconds=60)
+        second = DatabaseRateLimiter(db.engine, "reset", rate=2, per_seconds=60)
+        first.acquire()
+        first.acquire()
+
+        second.reset()
+
+        assert first.tokens == 2
+        assert first.acquire() is True
+
+    def test_falls_back_to_local_bucket_on_db_error(self, app):
+        """Test that database errors fall back to per-process limiting."""
+        from unittest.mock import patch
+        from sqlalchemy.exc import OperationalError
+        from app.models import db
+        from app.utils.rate_limiter import DatabaseRateLimiter
+
+        limiter = DatabaseRateLimiter(db.engine, "broken", rate=2, per_seconds=60)
+
+        with patch.object(
+            db.engine, "begin", side_effect=OperationalError("", {}, Exception())
+        ):
+            assert limiter.acquire() is True
+            assert limiter.acquire() is True
+            assert limiter.acquire() is False
+
+    def test_integrity_errors_retry_once_then_fall_back(self, app):
+        """Test that a repeated insert race does not recurse."""
+        from unittest.mock import patch
+        from sqlalchemy.exc import IntegrityError
+        from app.models import db
+        from app.utils.rate_limiter import DatabaseRateLimiter
+
+        limiter = DatabaseRateLimiter(db.engine, "racy", rate=1, per_seconds=60)
+
+        with patch.object(
+            db.engine, "begin", side_effect=IntegrityError("", {}, Exception())
+        ) as begin:
+            assert limiter.acquire() is True
+
+        assert begin.call_count == 2
+
+    def test_acquire_async_takes_tokens_off_the_event_loop(self, app):
+        """Test that async acquires do the database round-trip in a thread."""
+        import asyncio
+        import threading
+        from app.models import db
+        from app.utils.rate_limiter import DatabaseRateLimiter
+
+        limiter = DatabaseRateLimiter(db.engine, "async", rate=1, per_seconds=60)
+        take = limiter._take_or_wait_time
+        threads = []
+
+        def recording_take():
+            threads.append(threading.get_ident())
+            return take()
+
+        limiter._take_or_wait_time = recording_take
+
+        async def run():
+            acquired = await limiter.acquire_async(timeout=1.0)
+            timed_out = await limiter.acquire_async(timeout=0.05)
+            return acquired, timed_out, threading.get_ident()
+
+        acquired, timed_out, loop_thread = asyncio.run(run())
+
+        assert (acquired, timed_out) == (True, False)
+        assert threads and loop_thread not in threads
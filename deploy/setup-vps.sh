@@ -50,8 +50,10 @@ nginx -t
 # 7. Setup Systemd service
 echo "[7/8] Configuring Systemd service..."
 cp /tmp/pdf-search.service /etc/systemd/system/
+cp /tmp/pdf-search-worker.service /etc/systemd/system/
 systemctl daemon-reload
 systemctl enable pdf-search
+systemctl enable pdf-search-worker
 
 # 8. Set permissions
 echo "[8/8] Setting permissions..."
@@ -65,6 +67,6 @@ echo ""
 echo "Next steps:"
 echo "1. Edit /var/www/pdf-search/backend/.env with secure keys"
 echo "2. Run database migrations: cd $APP_DIR/backend && source venv/bin/activate && flask db upgrade"
-echo "3. Start services: systemctl start pdf-search && systemctl reload nginx"
+echo "3. Start services: systemctl start pdf-search pdf-search-worker && systemctl reload nginx"
 echo "4. Verify: curl http://localhost:5010/api/health"
 echo ""